@@ -4,14 +4,37 @@ from io import StringIO
 from datetime import datetime
 import time
 import os
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Set, Iterator, Sequence, Union
 import ijson
 import json
 import redis
+import decimal
+import io
+import math
+import ctypes
+import ctypes.util
+import zlib
 import hashlib
+import unicodedata
 from abc import ABC, abstractmethod
 import bz2
 import gzip
+import struct
+import mmap
+import pickle
+import heapq
+import tempfile
+import shutil
+import bisect
+import random
+import statistics
+import sqlite3
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+from array import array
+from collections import deque, OrderedDict
+from contextlib import contextmanager
 
 
 class EntityTypeEnum(StringEnum):
@@ -41,6 +64,64 @@ class PropertyTypeEnum(StringEnum):
 	Sense = "sense"
 
 
+def convert_entity_id_to_integer(*, entity_id: str) -> int:
+	# the lowest two bits keep items, properties, and lexemes in separate integer spaces
+	if entity_id[0] == "Q":
+		entity_type_index = 0
+	elif entity_id[0] == "P":
+		entity_type_index = 1
+	elif entity_id[0] == "L":
+		entity_type_index = 2
+	else:
+		raise NotImplementedError(f"Entity id prefix not implemented: {entity_id}")
+	return (int(entity_id[1:]) << 2) | entity_type_index
+
+
+def convert_integer_to_entity_id(*, integer: int) -> str:
+	return f"{'QPL'[integer & 3]}{integer >> 2}"
+
+
+def normalize_sitelink_title(*, site_id: str, title: str) -> str:
+	# sitelink titles treat underscores as spaces and, except on Wiktionary sites, ignore the case of the first character
+	normalized_title = title.replace("_", " ")
+	if site_id.endswith("wiktionary"):
+		return normalized_title
+	return normalized_title[:1].upper() + normalized_title[1:]
+
+
+def write_integer_arrays(*, file_path: str, integer_arrays: Dict[str, array]):
+	header = {}
+	offset = 0
+	for name, integer_array in integer_arrays.items():
+		if integer_array.typecode != "q":
+			raise Exception(f"Integer array \"{name}\" must have typecode \"q\" but has \"{integer_array.typecode}\".")
+		header[name] = (offset, len(integer_array))
+		offset += len(integer_array) * 8
+	header_bytes = json.dumps(header).encode()
+	header_bytes += b" " * (-(len(header_bytes) + 8) % 8)
+	with open(file_path, "wb") as file_handle:
+		file_handle.write(b"WDPA")
+		file_handle.write(struct.pack("<I", len(header_bytes)))
+		file_handle.write(header_bytes)
+		for integer_array in integer_arrays.values():
+			integer_array.tofile(file_handle)
+
+
+def read_integer_arrays(*, file_path: str) -> Dict[str, memoryview]:
+	with open(file_path, "rb") as file_handle:
+		if file_handle.read(4) != b"WDPA":
+			raise Exception(f"File is not an integer array file: {file_path}")
+		header_length, = struct.unpack("<I", file_handle.read(4))
+		header = json.loads(file_handle.read(header_length))
+		memory_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+	data_offset = 8 + header_length
+	integer_arrays = {}  # type: Dict[str, memoryview]
+	for name, (offset, length) in header.items():
+		start_index = data_offset + offset
+		integer_arrays[name] = memoryview(memory_map)[start_index:start_index + length * 8].cast("q")
+	return integer_arrays
+
+
 class ClaimPropertyValue():
 
 	def __init__(self, *, property_type: PropertyTypeEnum, property_value: str):
@@ -156,50 +237,98 @@ class Claim():
 
 	def __init__(self, *, property_id: str, property_values: List[ClaimPropertyValue]):
 		self.__property_id = property_id
-		self.__property_values = property_values
+		self.__property_values = tuple(property_values)  # type: Tuple[ClaimPropertyValue, ...]
+
+		self.__hash = None  # type: Optional[int]
 
 	def __str__(self):
 		return f"{self.__property_id}: {', '.join([str(property_value) for property_value in self.__property_values])}"
 
 	def __eq__(self, other):
+		if self is other:
+			return True
 		if isinstance(other, Claim):
-			return self.__property_id == other.get_property_id() and \
-				self.__property_values == other.get_property_values()
+			return hash(self) == hash(other) and \
+				self.__property_id == other.__property_id and \
+				self.__property_values == other.__property_values
 		return False
 
 	def __hash__(self):
-		return hash((self.__property_id, self.__property_values))
+		if self.__hash is None:
+			self.__hash = hash((self.__property_id, self.__property_values))
+		return self.__hash
+
+	def __getstate__(self):
+		# string hashes are salted per process, so the cached hash must not travel with a pickle
+		state = self.__dict__.copy()
+		state["_Claim__hash"] = None
+		return state
 
 	def get_property_id(self) -> str:
 		return self.__property_id
 
 	def get_property_values(self) -> List[ClaimPropertyValue]:
-		return self.__property_values.copy()
+		return list(self.__property_values)
 
 
 class Entity():
 
-	def __init__(self, *, entity_type: EntityTypeEnum, id: str, label: str, description: str, claims: List[Claim]):
+	__entity_types = list(EntityTypeEnum)
+	__property_types = list(PropertyTypeEnum)
+
+	def __init__(self, *, entity_type: EntityTypeEnum, id: str, label: str, description: str, claims: List[Claim], label_per_language_code: Optional[Dict[str, str]] = None, description_per_language_code: Optional[Dict[str, str]] = None, aliases_per_language_code: Optional[Dict[str, List[str]]] = None, title_per_site_id: Optional[Dict[str, str]] = None):
 		self.__entity_type = entity_type
 		self.__id = id
 		self.__label = label
 		self.__description = description
-		self.__claims = claims
+		self.__claims = tuple(claims)  # type: Tuple[Claim, ...]
+		self.__label_per_language_code = dict(label_per_language_code or {})
+		self.__description_per_language_code = dict(description_per_language_code or {})
+		self.__aliases_per_language_code = {language_code: tuple(aliases) for language_code, aliases in (aliases_per_language_code or {}).items()}  # type: Dict[str, Tuple[str, ...]]
+		self.__title_per_site_id = dict(title_per_site_id or {})
+
+		self.__hash = None  # type: Optional[int]
 
 	def __str__(self):
 		return f"{self.__entity_type.value} ({self.__id}): {self.__label}, {self.__description}. {len(self.__claims)} claim{'s' if self.__claims else ''}."
 
 	def __eq__(self, other):
+		if self is other:
+			return True
 		if isinstance(other, Entity):
-			return self.__entity_type == other.get_entity_type() and \
-				self.__id == other.get_id() and \
-				self.__label == other.get_label() and \
-				self.__description == other.get_description() and \
-				self.__claims == other.get_claims()
+			return hash(self) == hash(other) and \
+				self.__entity_type == other.__entity_type and \
+				self.__id == other.__id and \
+				self.__label == other.__label and \
+				self.__description == other.__description and \
+				self.__claims == other.__claims and \
+				self.__label_per_language_code == other.__label_per_language_code and \
+				self.__description_per_language_code == other.__description_per_language_code and \
+				self.__aliases_per_language_code == other.__aliases_per_language_code and \
+				self.__title_per_site_id == other.__title_per_site_id
 		return False
 
 	def __hash__(self):
-		return hash((self.__entity_type.value, self.__id, self.__label, self.__description, self.__claims))
+		if self.__hash is None:
+			# the per-language mappings compare without regard to order, so they hash as frozensets
+			self.__hash = hash((
+				self.__entity_type.value,
+				self.__id,
+				self.__label,
+				self.__description,
+				self.__claims,
+				frozenset(self.__label_per_language_code.items()),
+				frozenset(self.__description_per_language_code.items()),
+				frozenset(self.__aliases_per_language_code.items()),
+				frozenset(self.__title_per_site_id.items())
+			))
+		return self.__hash
+
+	def __getstate__(self):
+		# string hashes are salted per process, so the cached hash must not travel with a pickle
+		state = self.__dict__.copy()
+		state["_Entity__hash"] = None
+		return state
 
 	def get_entity_type(self) -> EntityTypeEnum:
 		return self.__entity_type
@@ -207,17 +336,45 @@ class Entity():
 	def get_id(self) -> str:
 		return self.__id
 
-	def get_label(self) -> str:
-		return self.__label
+	def get_label(self, *, language: Optional[LanguageEnum] = None) -> Optional[str]:
+		if language is None:
+			return self.__label
+		return self.__label_per_language_code.get(language.get_language_code(), None)
+
+	def get_description(self, *, language: Optional[LanguageEnum] = None) -> Optional[str]:
+		if language is None:
+			return self.__description
+		return self.__description_per_language_code.get(language.get_language_code(), None)
 
-	def get_description(self) -> str:
-		return self.__description
+	def get_aliases(self, *, language: LanguageEnum) -> List[str]:
+		return list(self.__aliases_per_language_code.get(language.get_language_code(), ()))
+
+	def get_label_per_language_code(self) -> Dict[str, str]:
+		return self.__label_per_language_code.copy()
+
+	def get_description_per_language_code(self) -> Dict[str, str]:
+		return self.__description_per_language_code.copy()
+
+	def get_aliases_per_language_code(self) -> Dict[str, List[str]]:
+		return {language_code: list(aliases) for language_code, aliases in self.__aliases_per_language_code.items()}
+
+	def get_sitelink_title(self, *, site_id: str) -> Optional[str]:
+		return self.__title_per_site_id.get(site_id, None)
+
+	def get_title_per_site_id(self) -> Dict[str, str]:
+		return self.__title_per_site_id.copy()
 
 	def get_claims(self) -> List[Claim]:
-		return self.__claims
+		return list(self.__claims)
+
+	def get_claim(self, *, property_id: str) -> Optional[Claim]:
+		for claim in self.__claims:
+			if claim.get_property_id() == property_id:
+				return claim
+		return None
 
 	@classmethod
-	def parse_json(cls, *, json_dict: Dict, language_code: str) -> Entity:
+	def parse_json(cls, *, json_dict: Dict, language_code: str, additional_language_codes: Optional[List[str]] = None) -> Entity:
 		if language_code not in json_dict["labels"]:
 			label = None
 		else:
@@ -227,11 +384,29 @@ class Entity():
 		else:
 			description = json_dict["descriptions"][language_code]["value"]
 
+		label_per_language_code = {}  # type: Dict[str, str]
+		description_per_language_code = {}  # type: Dict[str, str]
+		aliases_per_language_code = {}  # type: Dict[str, List[str]]
+		aliases_json = json_dict.get("aliases", {})
+		for collected_language_code in [language_code] + (additional_language_codes or []):
+			if collected_language_code in json_dict["labels"]:
+				label_per_language_code[collected_language_code] = json_dict["labels"][collected_language_code]["value"]
+			if collected_language_code in json_dict["descriptions"]:
+				description_per_language_code[collected_language_code] = json_dict["descriptions"][collected_language_code]["value"]
+			if collected_language_code in aliases_json:
+				aliases_per_language_code[collected_language_code] = [alias_json["value"] for alias_json in aliases_json[collected_language_code]]
+
 		return Entity(
 			entity_type=EntityTypeEnum(json_dict["type"]),
 			id=json_dict["id"],
 			label=label,
 			description=description,
+			label_per_language_code=label_per_language_code,
+			description_per_language_code=description_per_language_code,
+			aliases_per_language_code=aliases_per_language_code,
+			title_per_site_id={
+				site_id: sitelink_json["title"] for site_id, sitelink_json in json_dict.get("sitelinks", {}).items()
+			},
 			claims=[
 				Claim(
 					property_id=claim_key,
@@ -248,6 +423,117 @@ class Entity():
 			]
 		)
 
+	@staticmethod
+	def __append_string(*, byte_array: bytearray, string: Optional[str]):
+		if string is None:
+			byte_array += b"\xff\xff\xff\xff"
+		else:
+			string_bytes = string.encode()
+			byte_array += struct.pack("<I", len(string_bytes))
+			byte_array += string_bytes
+
+	@staticmethod
+	def __read_string(*, entity_bytes: memoryview, offset: int) -> Tuple[Optional[str], int]:
+		string_length, = struct.unpack_from("<I", entity_bytes, offset)
+		offset += 4
+		if string_length == 0xffffffff:
+			return None, offset
+		return str(entity_bytes[offset:offset + string_length], "utf-8"), offset + string_length
+
+	def to_bytes(self) -> bytes:
+		byte_array = bytearray()
+		byte_array.append(Entity.__entity_types.index(self.__entity_type))
+		for string in [self.__id, self.__label, self.__description]:
+			Entity.__append_string(byte_array=byte_array, string=string)
+		byte_array += struct.pack("<I", len(self.__claims))
+		for claim in self.__claims:
+			Entity.__append_string(byte_array=byte_array, string=claim.get_property_id())
+			property_values = claim.get_property_values()
+			byte_array += struct.pack("<I", len(property_values))
+			for property_value in property_values:
+				byte_array.append(Entity.__property_types.index(property_value.get_type()))
+				Entity.__append_string(byte_array=byte_array, string=property_value.get_value())
+		for text_per_language_code in [self.__label_per_language_code, self.__description_per_language_code]:
+			byte_array += struct.pack("<I", len(text_per_language_code))
+			for language_code, text in text_per_language_code.items():
+				Entity.__append_string(byte_array=byte_array, string=language_code)
+				Entity.__append_string(byte_array=byte_array, string=text)
+		byte_array += struct.pack("<I", len(self.__aliases_per_language_code))
+		for language_code, aliases in self.__aliases_per_language_code.items():
+			Entity.__append_string(byte_array=byte_array, string=language_code)
+			byte_array += struct.pack("<I", len(aliases))
+			for alias in aliases:
+				Entity.__append_string(byte_array=byte_array, string=alias)
+		byte_array += struct.pack("<I", len(self.__title_per_site_id))
+		for site_id, title in self.__title_per_site_id.items():
+			Entity.__append_string(byte_array=byte_array, string=site_id)
+			Entity.__append_string(byte_array=byte_array, string=title)
+		return bytes(byte_array)
+
+	@classmethod
+	def parse_bytes(cls, *, entity_bytes: bytes) -> Entity:
+		entity_bytes = memoryview(entity_bytes)
+		entity_type = Entity.__entity_types[entity_bytes[0]]
+		offset = 1
+		id, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+		label, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+		description, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+		claims_total, = struct.unpack_from("<I", entity_bytes, offset)
+		offset += 4
+		claims = []  # type: List[Claim]
+		for _ in range(claims_total):
+			property_id, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+			property_values_total, = struct.unpack_from("<I", entity_bytes, offset)
+			offset += 4
+			property_values = []  # type: List[ClaimPropertyValue]
+			for _ in range(property_values_total):
+				property_type = Entity.__property_types[entity_bytes[offset]]
+				property_value, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset + 1)
+				property_values.append(ClaimPropertyValue(
+					property_type=property_type,
+					property_value=property_value
+				))
+			claims.append(Claim(
+				property_id=property_id,
+				property_values=property_values
+			))
+		text_per_language_code_pair = ({}, {})  # type: Tuple[Dict[str, str], Dict[str, str]]
+		for text_per_language_code in text_per_language_code_pair:
+			texts_total, = struct.unpack_from("<I", entity_bytes, offset)
+			offset += 4
+			for _ in range(texts_total):
+				language_code, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+				text_per_language_code[language_code], offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+		aliases_per_language_code = {}  # type: Dict[str, List[str]]
+		language_codes_total, = struct.unpack_from("<I", entity_bytes, offset)
+		offset += 4
+		for _ in range(language_codes_total):
+			language_code, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+			aliases_total, = struct.unpack_from("<I", entity_bytes, offset)
+			offset += 4
+			aliases = []  # type: List[str]
+			for _ in range(aliases_total):
+				alias, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+				aliases.append(alias)
+			aliases_per_language_code[language_code] = aliases
+		title_per_site_id = {}  # type: Dict[str, str]
+		site_ids_total, = struct.unpack_from("<I", entity_bytes, offset)
+		offset += 4
+		for _ in range(site_ids_total):
+			site_id, offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+			title_per_site_id[site_id], offset = Entity.__read_string(entity_bytes=entity_bytes, offset=offset)
+		return Entity(
+			entity_type=entity_type,
+			id=id,
+			label=label,
+			description=description,
+			claims=claims,
+			label_per_language_code=text_per_language_code_pair[0],
+			description_per_language_code=text_per_language_code_pair[1],
+			aliases_per_language_code=aliases_per_language_code,
+			title_per_site_id=title_per_site_id
+		)
+
 
 class PageCriteria():
 
@@ -269,6 +555,9 @@ class PageCriteria():
 	def get_first_valid_entity_index(self) -> int:
 		return self.__start_inclusive_entity_index
 
+	def get_end_exclusive_entity_index(self) -> int:
+		return self.__end_exclusive_entity_index
+
 	def get_current_redis_key(self) -> str:
 		return self.__current_redis_key
 
@@ -278,26 +567,185 @@ class PageCriteria():
 
 class SearchCriteria():
 
-	def __init__(self, *, entity_types: List[EntityTypeEnum], entity_types_set_compliment_type: SetComplimentTypeEnum, id: Optional[str], label_parts: Optional[List[str]], description_parts: Optional[List[str]], language: LanguageEnum):
+	def __init__(self, *, entity_types: List[EntityTypeEnum], entity_types_set_compliment_type: SetComplimentTypeEnum, id: Optional[str], label_parts: Optional[List[str]], description_parts: Optional[List[str]], language: LanguageEnum, instance_of_ids: Optional[List[str]] = None, is_instance_of_transitive: bool = False, additional_languages: Optional[List[LanguageEnum]] = None, label_parts_per_language: Optional[Dict[LanguageEnum, List[str]]] = None, description_parts_per_language: Optional[Dict[LanguageEnum, List[str]]] = None, sitelink_site_id: Optional[str] = None, sitelink_title: Optional[str] = None, minimum_id: Optional[str] = None, maximum_id: Optional[str] = None, claim_property_ids: Optional[List[str]] = None):
 		self.__entity_types = entity_types
 		self.__entity_types_set_compliment_type = entity_types_set_compliment_type
 		self.__id = id
 		self.__label_parts = label_parts
 		self.__description_parts = description_parts
 		self.__language = language
+		self.__instance_of_ids = instance_of_ids
+		self.__is_instance_of_transitive = is_instance_of_transitive
+		self.__label_parts_per_language = label_parts_per_language
+		self.__description_parts_per_language = description_parts_per_language
+		self.__sitelink_site_id = sitelink_site_id
+		self.__sitelink_title = None if sitelink_title is None else normalize_sitelink_title(site_id=sitelink_site_id, title=sitelink_title)
+		self.__claim_property_ids = claim_property_ids
+
+		if (self.__sitelink_site_id is None) != (self.__sitelink_title is None):
+			raise Exception("Both the sitelink site id and title must be provided together.")
+
+		self.__minimum_id = minimum_id
+		self.__maximum_id = maximum_id
+		# an id range is limited to a single entity type, and within a type the entity integers are ordered by the id number
+		if self.__minimum_id is None and self.__maximum_id is None:
+			self.__entity_integer_range = None  # type: Optional[Tuple[int, int]]
+		else:
+			if self.__minimum_id is not None and self.__maximum_id is not None and self.__minimum_id[0] != self.__maximum_id[0]:
+				raise Exception(f"The id range from {self.__minimum_id} to {self.__maximum_id} must be within a single entity type.")
+			entity_type_index = convert_entity_id_to_integer(entity_id=self.__minimum_id if self.__minimum_id is not None else self.__maximum_id) & 3
+			self.__entity_integer_range = (
+				entity_type_index if self.__minimum_id is None else convert_entity_id_to_integer(entity_id=self.__minimum_id),
+				(2 ** 63 - 1) if self.__maximum_id is None else convert_entity_id_to_integer(entity_id=self.__maximum_id)
+			)
+
+		# every language referenced by the criteria is collected in the same pass as the primary language
+		self.__additional_languages = []  # type: List[LanguageEnum]
+		for additional_language in (additional_languages or []) + list((label_parts_per_language or {}).keys()) + list((description_parts_per_language or {}).keys()):
+			if additional_language != self.__language and additional_language not in self.__additional_languages:
+				self.__additional_languages.append(additional_language)
+
+		self.__hierarchy_index_and_instance_of_class_ids_pair = (None, None)  # type: Tuple[Optional[WikiDataHierarchyIndex], Optional[Set[str]]]
 
-		self.__redis_key = hashlib.sha1(f"{','.join([entity_type.value for entity_type in self.__entity_types])}\u0000{self.__entity_types_set_compliment_type.value}\u0000{self.__id}\u0000{self.__label_parts}\u0000{self.__description_parts}".encode()).hexdigest()
+		self.__redis_key = hashlib.sha1(f"{','.join([entity_type.value for entity_type in self.__entity_types])}\u0000{self.__entity_types_set_compliment_type.value}\u0000{self.__id}\u0000{self.__label_parts}\u0000{self.__description_parts}\u0000{self.__instance_of_ids}\u0000{self.__is_instance_of_transitive}\u0000{self.__language.value}\u0000{','.join([additional_language.value for additional_language in self.__additional_languages])}\u0000{self.__get_parts_per_language_string(parts_per_language=self.__label_parts_per_language)}\u0000{self.__get_parts_per_language_string(parts_per_language=self.__description_parts_per_language)}\u0000{self.__sitelink_site_id}\u0000{self.__sitelink_title}\u0000{self.__minimum_id}\u0000{self.__maximum_id}\u0000{self.__claim_property_ids}".encode()).hexdigest()
+
+	@staticmethod
+	def __get_parts_per_language_string(*, parts_per_language: Optional[Dict[LanguageEnum, List[str]]]) -> str:
+		if parts_per_language is None:
+			return str(None)
+		return str(sorted([(language.value, parts) for language, parts in parts_per_language.items()]))
 
 	def get_language(self) -> LanguageEnum:
 		return self.__language
 
-	def is_valid(self, *, entity: Entity) -> bool:
+	def get_additional_languages(self) -> List[LanguageEnum]:
+		return self.__additional_languages.copy()
+
+	def get_id(self) -> Optional[str]:
+		return self.__id
+
+	def get_entity_types(self) -> List[EntityTypeEnum]:
+		return self.__entity_types.copy()
+
+	def get_entity_types_set_compliment_type(self) -> SetComplimentTypeEnum:
+		return self.__entity_types_set_compliment_type
+
+	def get_label_parts(self) -> Optional[List[str]]:
+		return self.__label_parts
+
+	def get_description_parts(self) -> Optional[List[str]]:
+		return self.__description_parts
+
+	def get_label_parts_per_language(self) -> Optional[Dict[LanguageEnum, List[str]]]:
+		return self.__label_parts_per_language
+
+	def get_description_parts_per_language(self) -> Optional[Dict[LanguageEnum, List[str]]]:
+		return self.__description_parts_per_language
+
+	def get_minimum_id(self) -> Optional[str]:
+		return self.__minimum_id
+
+	def get_maximum_id(self) -> Optional[str]:
+		return self.__maximum_id
+
+	def get_entity_integer_range(self) -> Optional[Tuple[int, int]]:
+		return self.__entity_integer_range
+
+	def is_entity_integer_in_range(self, *, entity_integer: int) -> bool:
+		if self.__entity_integer_range is None:
+			return True
+		minimum_entity_integer, maximum_entity_integer = self.__entity_integer_range
+		return entity_integer & 3 == minimum_entity_integer & 3 and minimum_entity_integer <= entity_integer <= maximum_entity_integer
+
+	def get_sitelink_site_id(self) -> Optional[str]:
+		return self.__sitelink_site_id
+
+	def get_sitelink_title(self) -> Optional[str]:
+		return self.__sitelink_title
+
+	def get_claim_property_ids(self) -> Optional[List[str]]:
+		return self.__claim_property_ids
+
+	def get_maximum_valid_entities_total(self) -> Optional[int]:
+		# entity ids and sitelinks are unique, so at most one entity can satisfy either criteria
+		if self.__id is not None or self.__sitelink_site_id is not None:
+			return 1
+		return None
+
+	def get_instance_of_ids(self) -> Optional[List[str]]:
+		return self.__instance_of_ids
+
+	def is_instance_of_transitive(self) -> bool:
+		return self.__is_instance_of_transitive
+
+	def get_raw_required_parts(self) -> List[bytes]:
+		# byte strings that must appear verbatim in the raw json record of any valid entity
+		# only printable ascii parts are used since anything else may be escaped differently within the dump
+		raw_required_parts = []  # type: List[bytes]
+		if self.__id is not None:
+			raw_required_parts.append(f"\"{self.__id}\"".encode())
+		if self.__instance_of_ids is not None and len(self.__instance_of_ids) == 1 and not self.__is_instance_of_transitive:
+			raw_required_parts.append(f"\"{self.__instance_of_ids[0]}\"".encode())
+		for claim_property_id in self.__claim_property_ids or []:
+			raw_required_parts.append(f"\"{claim_property_id}\"".encode())
+		parts = []  # type: List[str]
+		for text_parts in [self.__label_parts, self.__description_parts]:
+			if text_parts is not None:
+				parts.extend(text_parts)
+		for text_parts_per_language in [self.__label_parts_per_language, self.__description_parts_per_language]:
+			if text_parts_per_language is not None:
+				for text_parts in text_parts_per_language.values():
+					parts.extend(text_parts)
+		for part in parts:
+			if part != "" and all(" " <= character <= "~" and character not in "\"\\/" for character in part):
+				raw_required_parts.append(part.encode())
+		return raw_required_parts
+
+	def __get_instance_of_class_ids(self, *, hierarchy_index: Optional[WikiDataHierarchyIndex]) -> Set[str]:
+		if not self.__is_instance_of_transitive:
+			return set(self.__instance_of_ids)
+		if hierarchy_index is None:
+			raise Exception(f"A hierarchy index is required in order to search for transitive instances of {self.__instance_of_ids}.")
+		cached_hierarchy_index, instance_of_class_ids = self.__hierarchy_index_and_instance_of_class_ids_pair
+		if cached_hierarchy_index is not hierarchy_index:
+			instance_of_class_ids = set(self.__instance_of_ids)
+			for instance_of_id in self.__instance_of_ids:
+				instance_of_class_ids.update(hierarchy_index.get_subclass_ids(
+					class_id=instance_of_id,
+					is_transitive=True
+				))
+			self.__hierarchy_index_and_instance_of_class_ids_pair = (hierarchy_index, instance_of_class_ids)
+		return instance_of_class_ids
+
+	def is_valid(self, *, entity: Entity, hierarchy_index: Optional[WikiDataHierarchyIndex] = None) -> bool:
 		if (self.__entity_types_set_compliment_type == SetComplimentTypeEnum.Inclusive and entity.get_entity_type() not in self.__entity_types) or \
 				(self.__entity_types_set_compliment_type == SetComplimentTypeEnum.Exclusive and entity.get_entity_type() in self.__entity_types):
 			return False
 		if self.__id is not None and entity.get_id() != self.__id:
 			return False
-		if entity.get_label() is None:
+		if self.__entity_integer_range is not None and not self.is_entity_integer_in_range(entity_integer=convert_entity_id_to_integer(entity_id=entity.get_id())):
+			return False
+		if self.__sitelink_site_id is not None:
+			sitelink_title = entity.get_sitelink_title(
+				site_id=self.__sitelink_site_id
+			)
+			if sitelink_title is None or normalize_sitelink_title(site_id=self.__sitelink_site_id, title=sitelink_title) != self.__sitelink_title:
+				return False
+		if self.__claim_property_ids is not None and any(entity.get_claim(property_id=claim_property_id) is None for claim_property_id in self.__claim_property_ids):
+			return False
+		if self.__instance_of_ids is not None:
+			instance_of_claim = entity.get_claim(
+				property_id="P31"
+			)
+			if instance_of_claim is None:
+				return False
+			instance_of_class_ids = self.__get_instance_of_class_ids(
+				hierarchy_index=hierarchy_index
+			)
+			if not any(property_value.get_value() in instance_of_class_ids for property_value in instance_of_claim.get_property_values()):
+				return False
+		# entities without a primary language label are skipped unless the criteria only concerns other languages
+		if entity.get_label() is None and (self.__label_parts is not None or self.__description_parts is not None or (self.__label_parts_per_language is None and self.__description_parts_per_language is None)):
 			return False
 		if self.__label_parts is not None:
 			for label_part in self.__label_parts:
@@ -309,6 +757,22 @@ class SearchCriteria():
 			for description_part in self.__description_parts:
 				if description_part not in entity.get_description():
 					return False
+		if self.__label_parts_per_language is not None:
+			for language, label_parts in self.__label_parts_per_language.items():
+				label = entity.get_label(language=language)
+				if label is None:
+					return False
+				for label_part in label_parts:
+					if label_part not in label:
+						return False
+		if self.__description_parts_per_language is not None:
+			for language, description_parts in self.__description_parts_per_language.items():
+				description = entity.get_description(language=language)
+				if description is None:
+					return False
+				for description_part in description_parts:
+					if description_part not in description:
+						return False
 		return True
 
 	def get_redis_key(self) -> str:
@@ -317,10 +781,43 @@ class SearchCriteria():
 
 class LanguageEnum(StringEnum):
 	English = "english"
+	German = "german"
+	French = "french"
+	Spanish = "spanish"
+	Italian = "italian"
+	Portuguese = "portuguese"
+	Dutch = "dutch"
+	Polish = "polish"
+	Russian = "russian"
+	Japanese = "japanese"
+	Chinese = "chinese"
+	Arabic = "arabic"
 
 	def get_language_code(self) -> str:
 		if self == LanguageEnum.English:
 			return "en"
+		elif self == LanguageEnum.German:
+			return "de"
+		elif self == LanguageEnum.French:
+			return "fr"
+		elif self == LanguageEnum.Spanish:
+			return "es"
+		elif self == LanguageEnum.Italian:
+			return "it"
+		elif self == LanguageEnum.Portuguese:
+			return "pt"
+		elif self == LanguageEnum.Dutch:
+			return "nl"
+		elif self == LanguageEnum.Polish:
+			return "pl"
+		elif self == LanguageEnum.Russian:
+			return "ru"
+		elif self == LanguageEnum.Japanese:
+			return "ja"
+		elif self == LanguageEnum.Chinese:
+			return "zh"
+		elif self == LanguageEnum.Arabic:
+			return "ar"
 		else:
 			raise NotImplementedError(f"Language not implemented: {self.value}.")
 
@@ -338,16 +835,377 @@ class RedisConfig():
 		return self.__expire_seconds
 
 
+class ScanPartition():
+
+	def __init__(self, *, partition_index: int, partitions_total: int):
+		if not 0 <= partition_index < partitions_total:
+			raise Exception(f"Partition index {partition_index} must be within the {partitions_total} partitions.")
+
+		self.__partition_index = partition_index
+		self.__partitions_total = partitions_total
+
+	def get_partition_index(self) -> int:
+		return self.__partition_index
+
+	def get_partitions_total(self) -> int:
+		return self.__partitions_total
+
+	def get_index_range(self, *, indexes_total: int) -> Tuple[int, int]:
+		return indexes_total * self.__partition_index // self.__partitions_total, indexes_total * (self.__partition_index + 1) // self.__partitions_total
+
+	def get_byte_range(self, *, bytes_total: int) -> Tuple[int, int]:
+		return self.get_index_range(
+			indexes_total=bytes_total
+		)
+
+	def is_ordinal_owned(self, *, ordinal: int) -> bool:
+		return ordinal % self.__partitions_total == self.__partition_index
+
+
+class GrowingFileReader(io.RawIOBase):
+
+	def __init__(self, *, file_path: str, completion_marker_file_path: str, poll_seconds: float):
+		super().__init__()
+
+		self.__file_path = file_path
+		self.__completion_marker_file_path = completion_marker_file_path
+		self.__poll_seconds = poll_seconds
+
+		self.__file_handle = None
+
+	def readable(self) -> bool:
+		return True
+
+	def readinto(self, buffer) -> int:
+		# blocks at the end of the file until more bytes arrive, and only reports the end once the completion marker exists
+		while True:
+			is_complete = os.path.exists(self.__completion_marker_file_path)
+			if self.__file_handle is None:
+				if os.path.exists(self.__file_path):
+					self.__file_handle = open(self.__file_path, "rb", buffering=0)
+				elif is_complete:
+					raise FileNotFoundError(f"Completed file does not exist: {self.__file_path}")
+			if self.__file_handle is not None:
+				bytes_total = self.__file_handle.readinto(buffer)
+				if bytes_total or is_complete:
+					return bytes_total
+			time.sleep(self.__poll_seconds)
+
+	def close(self):
+		if self.__file_handle is not None:
+			self.__file_handle.close()
+			self.__file_handle = None
+		super().close()
+
+
 class WikiDataParser():
 
-	def __init__(self, *, json_file_path: str):
+	def __init__(self, *, json_file_path: str, hierarchy_index: Optional[WikiDataHierarchyIndex] = None, entity_cache: Optional[WikiDataEntityCache] = None, sitelink_index: Optional[WikiDataSitelinkIndex] = None, cursor_expire_seconds: Optional[float] = None, maximum_cursors_total: Optional[int] = None, is_memory_mapped: bool = False, follow_completion_marker_file_path: Optional[str] = None, follow_poll_seconds: float = 1.0, offset_index: Optional[WikiDataOffsetIndex] = None, sparse_id_index: Optional[WikiDataSparseIdIndex] = None, gzip_checkpoint_index: Optional[WikiDataGzipCheckpointIndex] = None, reverse_link_index: Optional[WikiDataReverseLinkIndex] = None, sqlite_database: Optional[WikiDataSqliteDatabase] = None):
 		self.__json_file_path = json_file_path
+		self.__gzip_checkpoint_index = gzip_checkpoint_index
+		self.__reverse_link_index = reverse_link_index
+		self.__is_memory_mapped = is_memory_mapped
+		self.__follow_completion_marker_file_path = follow_completion_marker_file_path
+		self.__follow_poll_seconds = follow_poll_seconds
+		self.__hierarchy_index = hierarchy_index
+		self.__entity_cache = entity_cache
+		self.__sitelink_index = sitelink_index
+		self.__cursor_expire_seconds = cursor_expire_seconds
+		self.__maximum_cursors_total = maximum_cursors_total
+
+		if self.__is_memory_mapped and not self.__json_file_path.endswith(".json"):
+			raise NotImplementedError(f"Unable to memory map compressed file: {self.__json_file_path}")
+		if self.__is_memory_mapped and self.__follow_completion_marker_file_path is not None:
+			raise NotImplementedError(f"Unable to memory map file while it is still growing: {self.__json_file_path}")
+		if offset_index is not None and offset_index.get_file_size() != os.path.getsize(self.__json_file_path):
+			raise Exception(f"Offset index was built for a different version of the file: {self.__json_file_path}")
+		if sparse_id_index is not None and sparse_id_index.get_file_size() != os.path.getsize(self.__json_file_path):
+			raise Exception(f"Sparse id index was built for a different version of the file: {self.__json_file_path}")
+		if gzip_checkpoint_index is not None and gzip_checkpoint_index.get_file_size() != os.path.getsize(self.__json_file_path):
+			raise Exception(f"Gzip checkpoint index was built for a different version of the file: {self.__json_file_path}")
+		if reverse_link_index is not None and reverse_link_index.get_file_size() != os.path.getsize(self.__json_file_path):
+			raise Exception(f"Reverse link index was built for a different version of the file: {self.__json_file_path}")
+		if sqlite_database is not None and sqlite_database.get_file_size() != os.path.getsize(self.__json_file_path):
+			raise Exception(f"SQLite database was built for a different version of the file: {self.__json_file_path}")
+
+		self.__offset_index = offset_index
+		self.__sparse_id_index = sparse_id_index
+		self.__sqlite_database = sqlite_database
+		self.__query_planner = WikiDataQueryPlanner(
+			offset_index=offset_index,
+			hierarchy_index=hierarchy_index,
+			sitelink_index=sitelink_index,
+			sparse_id_index=sparse_id_index,
+			sqlite_database=sqlite_database
+		)
+
+		# ordered from the least to the most recently registered cursor so that expired and excess cursors are evicted from the front
+		self.__iterator_and_start_entity_index_and_registered_time_per_redis_key = OrderedDict()  # type: OrderedDict[str, Tuple[iter, int, float]]
+
+	def get_json_file_path(self) -> str:
+		return self.__json_file_path
 
-		self.__iterator_and_start_entity_index_pair_per_redis_key = {}  # type: Dict[str, Tuple[iter, int]]
+	def get_cursors_total(self) -> int:
+		self.__remove_expired_cursors()
+		return len(self.__iterator_and_start_entity_index_and_registered_time_per_redis_key)
 
-	def __search_file_handle(self, *, iterator, start_entity_index: int, search_criteria: SearchCriteria, page_criteria: PageCriteria) -> List[Entity]:
+	def __remove_expired_cursors(self):
+		if self.__cursor_expire_seconds is None:
+			return
+		expired_time = time.monotonic() - self.__cursor_expire_seconds
+		while self.__iterator_and_start_entity_index_and_registered_time_per_redis_key:
+			redis_key, (iterator, _, registered_time) = next(iter(self.__iterator_and_start_entity_index_and_registered_time_per_redis_key.items()))
+			if registered_time > expired_time:
+				break
+			del self.__iterator_and_start_entity_index_and_registered_time_per_redis_key[redis_key]
+			iterator.close()
+
+	def __register_cursor(self, *, redis_key: str, iterator, start_entity_index: int):
+		self.__remove_expired_cursors()
+		previous_cursor = self.__iterator_and_start_entity_index_and_registered_time_per_redis_key.pop(redis_key, None)
+		if previous_cursor is not None and previous_cursor[0] is not iterator:
+			previous_cursor[0].close()
+		self.__iterator_and_start_entity_index_and_registered_time_per_redis_key[redis_key] = (iterator, start_entity_index, time.monotonic())
+		if self.__maximum_cursors_total is not None:
+			while len(self.__iterator_and_start_entity_index_and_registered_time_per_redis_key) > self.__maximum_cursors_total:
+				_, (evicted_iterator, _, _) = self.__iterator_and_start_entity_index_and_registered_time_per_redis_key.popitem(last=False)
+				evicted_iterator.close()
+
+	def __pop_cursor(self, *, redis_key: str) -> Tuple[Optional[iter], Optional[int]]:
+		self.__remove_expired_cursors()
+		iterator, start_entity_index, _ = self.__iterator_and_start_entity_index_and_registered_time_per_redis_key.pop(redis_key, (None, None, None))
+		return iterator, start_entity_index
+
+	def __get_enumerated_entity_iterator(self, *, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]], raw_required_parts: Optional[List[bytes]] = None) -> Iterator[Tuple[int, Entity]]:
+		entity_iterator = self.__get_indexed_entity_iterator(
+			language=language,
+			additional_languages=additional_languages,
+			raw_required_parts=raw_required_parts
+		)
+		try:
+			yield from entity_iterator
+		finally:
+			# closes the dump file handle as soon as the cursor is evicted
+			entity_iterator.close()
+
+	@contextmanager
+	def __open_file_handle(self):
+		if self.__json_file_path.endswith(".bz2"):
+			open_method = bz2.open
+		elif self.__json_file_path.endswith(".gz"):
+			open_method = gzip.open
+		elif self.__json_file_path.endswith(".json"):
+			open_method = open
+		else:
+			raise NotImplementedError(f"Unable to parse file type: {self.__json_file_path}")
+
+		if self.__follow_completion_marker_file_path is not None:
+			# the decompressors read through the growing file, so a multistream bz2 file waits at each stream boundary for the next stream
+			with io.BufferedReader(GrowingFileReader(
+				file_path=self.__json_file_path,
+				completion_marker_file_path=self.__follow_completion_marker_file_path,
+				poll_seconds=self.__follow_poll_seconds
+			)) as growing_file_handle:
+				if open_method is open:
+					yield growing_file_handle
+				else:
+					with open_method(growing_file_handle, "rb") as file_handle:
+						yield file_handle
+		else:
+			with open_method(self.__json_file_path, "rb") as file_handle:
+				yield file_handle
+
+	def get_raw_record_iterator(self) -> Iterator[bytes]:
+		# the dump holds one entity per line, so each raw record is a line without its trailing comma
+		with self.__open_file_handle() as file_handle:
+			for line in file_handle:
+				record = line.rstrip(b" \t\r\n,")
+				if record.startswith(b"{"):
+					yield record
+
+	def get_memory_mapped_record_iterator(self, *, start_byte_index: int = 0, end_byte_index: Optional[int] = None) -> Iterator[Tuple[mmap.mmap, int, int]]:
+		# the dump holds one entity per line, so each record is located by scanning for line boundaries within the mapping
+		# a record belongs to the byte range that contains the start of its line
+		if self.__follow_completion_marker_file_path is not None:
+			raise NotImplementedError(f"Unable to memory map file while it is still growing: {self.__json_file_path}")
+		with open(self.__json_file_path, "rb") as file_handle:
+			if os.fstat(file_handle.fileno()).st_size == 0:
+				return
+			memory_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			memory_map_length = len(memory_map)
+			if end_byte_index is None or end_byte_index > memory_map_length:
+				end_byte_index = memory_map_length
+			if start_byte_index == 0:
+				line_start_index = 0
+			else:
+				line_start_index = memory_map.find(b"\n", start_byte_index - 1)
+				line_start_index = memory_map_length if line_start_index == -1 else line_start_index + 1
+			while line_start_index < end_byte_index:
+				line_end_index = memory_map.find(b"\n", line_start_index)
+				if line_end_index == -1:
+					line_end_index = memory_map_length
+				record_end_index = line_end_index
+				while record_end_index > line_start_index and memory_map[record_end_index - 1] in b" \t\r,":
+					record_end_index -= 1
+				if record_end_index > line_start_index and memory_map[line_start_index] == 0x7b:
+					yield memory_map, line_start_index, record_end_index
+				line_start_index = line_end_index + 1
+		finally:
+			memory_map.close()
+
+	def get_entity_json_iterator(self) -> Iterator[Dict]:
+		if self.__is_memory_mapped:
+			for memory_map, record_start_index, record_end_index in self.get_memory_mapped_record_iterator():
+				yield json.loads(memory_map[record_start_index:record_end_index], parse_float=decimal.Decimal)
+		else:
+			with self.__open_file_handle() as file_handle:
+				for entity_json in ijson.items(file_handle, "item"):
+					yield entity_json
+
+	def get_entity_iterator(self, *, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None) -> Iterator[Entity]:
+		for _, entity in self.__get_indexed_entity_iterator(
+			language=language,
+			additional_languages=additional_languages,
+			raw_required_parts=None
+		):
+			yield entity
+
+	def __get_indexed_entity_iterator(self, *, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]], raw_required_parts: Optional[List[bytes]]) -> Iterator[Tuple[int, Entity]]:
+		if self.__entity_cache is not None and self.__entity_cache.is_cached(
+			json_file_path=self.__json_file_path,
+			language=language,
+			additional_languages=additional_languages
+		):
+			yield from enumerate(self.__entity_cache.get_entity_iterator(
+				json_file_path=self.__json_file_path,
+				language=language,
+				additional_languages=additional_languages
+			))
+		else:
+			language_code = language.get_language_code()
+			additional_language_codes = [additional_language.get_language_code() for additional_language in additional_languages or []]
+			if self.__is_memory_mapped:
+				for entity_json_index, (memory_map, record_start_index, record_end_index) in enumerate(self.get_memory_mapped_record_iterator()):
+					# records that lack any required part are skipped by searching the mapping in place, without copying or decoding them
+					if raw_required_parts and any(memory_map.find(raw_required_part, record_start_index, record_end_index) == -1 for raw_required_part in raw_required_parts):
+						continue
+					yield entity_json_index, Entity.parse_json(
+						json_dict=json.loads(memory_map[record_start_index:record_end_index], parse_float=decimal.Decimal),
+						language_code=language_code,
+						additional_language_codes=additional_language_codes
+					)
+			else:
+				for entity_json_index, entity_json in enumerate(self.get_entity_json_iterator()):
+					yield entity_json_index, Entity.parse_json(
+						json_dict=entity_json,
+						language_code=language_code,
+						additional_language_codes=additional_language_codes
+					)
+
+	def __get_partition_record_iterator(self, *, scan_partition: ScanPartition) -> Iterator[Tuple[int, Union[bytes, mmap.mmap], int, int]]:
+		# yields the sort key, buffer and bounds of each record owned by the partition
+		# the sort key orders the records as they appear in the dump: the byte offset for .json and the ordinal for compressed files
+		if self.__json_file_path.endswith(".json"):
+			start_byte_index, end_byte_index = scan_partition.get_byte_range(
+				bytes_total=os.path.getsize(self.__json_file_path)
+			)
+			for memory_map, record_start_index, record_end_index in self.get_memory_mapped_record_iterator(
+				start_byte_index=start_byte_index,
+				end_byte_index=end_byte_index
+			):
+				yield record_start_index, memory_map, record_start_index, record_end_index
+		elif self.__gzip_checkpoint_index is not None:
+			# each partition inflates from its own checkpoints up to the first record of the next partition
+			checkpoints_total = self.__gzip_checkpoint_index.get_checkpoints_total()
+			start_checkpoint_index, end_checkpoint_index = scan_partition.get_index_range(
+				indexes_total=checkpoints_total
+			)
+			if start_checkpoint_index != end_checkpoint_index:
+				for ordinal, record in self.__gzip_checkpoint_index.get_raw_record_iterator(
+					json_file_path=self.__json_file_path,
+					checkpoint_index=start_checkpoint_index,
+					end_line_start_offset=None if end_checkpoint_index == checkpoints_total else self.__gzip_checkpoint_index.get_line_start_offset(checkpoint_index=end_checkpoint_index)
+				):
+					yield ordinal, record, 0, len(record)
+		else:
+			# compressed streams cannot be entered at an arbitrary offset, so every partition decompresses the dump and only decodes the records it owns
+			for ordinal, record in enumerate(self.get_raw_record_iterator()):
+				if scan_partition.is_ordinal_owned(ordinal=ordinal):
+					yield ordinal, record, 0, len(record)
 
+	def search_partition(self, *, search_criteria: SearchCriteria, scan_partition: ScanPartition, partial_file_path: str, page_criteria: Optional[PageCriteria] = None) -> int:
+		# a page can never need more matches from one partition than the index just past the page, so each partition stops there
+		maximum_valid_entities_total = search_criteria.get_maximum_valid_entities_total()
+		if page_criteria is not None:
+			if maximum_valid_entities_total is None or page_criteria.get_end_exclusive_entity_index() < maximum_valid_entities_total:
+				maximum_valid_entities_total = page_criteria.get_end_exclusive_entity_index()
+
+		language_code = search_criteria.get_language().get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in search_criteria.get_additional_languages()]
+		raw_required_parts = search_criteria.get_raw_required_parts()
+		found_entities_total = 0
+		with open(partial_file_path, "wb") as partial_file_handle:
+			if maximum_valid_entities_total != 0:
+				record_iterator = self.__get_partition_record_iterator(
+					scan_partition=scan_partition
+				)
+				try:
+					for sort_key, buffer, record_start_index, record_end_index in record_iterator:
+						if any(buffer.find(raw_required_part, record_start_index, record_end_index) == -1 for raw_required_part in raw_required_parts):
+							continue
+						entity = Entity.parse_json(
+							json_dict=json.loads(buffer[record_start_index:record_end_index], parse_float=decimal.Decimal),
+							language_code=language_code,
+							additional_language_codes=additional_language_codes
+						)
+						if search_criteria.is_valid(
+							entity=entity,
+							hierarchy_index=self.__hierarchy_index
+						):
+							entity_bytes = entity.to_bytes()
+							partial_file_handle.write(struct.pack("<QI", sort_key, len(entity_bytes)))
+							partial_file_handle.write(entity_bytes)
+							found_entities_total += 1
+							if maximum_valid_entities_total is not None and found_entities_total >= maximum_valid_entities_total:
+								break
+				finally:
+					record_iterator.close()
+		return found_entities_total
+
+	@staticmethod
+	def __get_partial_result_iterator(*, partial_file_path: str) -> Iterator[Tuple[int, bytes]]:
+		with open(partial_file_path, "rb") as partial_file_handle:
+			while True:
+				record_header_bytes = partial_file_handle.read(12)
+				if not record_header_bytes:
+					break
+				sort_key, entity_bytes_length = struct.unpack("<QI", record_header_bytes)
+				yield sort_key, partial_file_handle.read(entity_bytes_length)
+
+	@staticmethod
+	def merge_partial_results(*, partial_file_paths: List[str], page_criteria: Optional[PageCriteria] = None) -> List[Entity]:
+		# merging on the sort key restores the order of a single scan, so the page is counted exactly as search would count it
 		entities = []  # type: List[Entity]
+		for found_entity_index, (_, entity_bytes) in enumerate(heapq.merge(*[
+			WikiDataParser.__get_partial_result_iterator(
+				partial_file_path=partial_file_path
+			) for partial_file_path in partial_file_paths
+		], key=lambda pair: pair[0])):
+			if page_criteria is None or page_criteria.is_valid(
+				entity_index=found_entity_index
+			):
+				entities.append(Entity.parse_bytes(
+					entity_bytes=entity_bytes
+				))
+			if page_criteria is not None and page_criteria.is_last_valid_entity_index(
+				entity_index=found_entity_index
+			):
+				break
+		return entities
+
+	def __search_file_handle(self, *, iterator, start_entity_index: int, search_criteria: SearchCriteria, page_criteria: PageCriteria, last_entity_json_index: Optional[int]) -> Iterator[Entity]:
+		# yields the page as it is found and returns the number of rows examined once the page is complete
 
 		# TODO see if it's possible to set the offset of the file_handle instead of burning records
 		if start_entity_index != 0:
@@ -358,61 +1216,416 @@ class WikiDataParser():
 
 		is_last_valid_entry_found = False
 		entity_json_index = -1
-		language_code = search_criteria.get_language().get_language_code()
-		for entity_json_index, entity_json in iterator:
-			entity = Entity.parse_json(
-				json_dict=entity_json,
-				language_code=language_code
+		rows_examined_total = 0
+		maximum_valid_entities_total = search_criteria.get_maximum_valid_entities_total()
+		try:
+			for entity_json_index, entity in iterator:
+				rows_examined_total += 1
+				if search_criteria.is_valid(
+					entity=entity,
+					hierarchy_index=self.__hierarchy_index
+				):
+					if page_criteria.is_valid(
+						entity_index=found_entity_index
+					):
+						yield entity
+						if page_criteria.is_last_valid_entity_index(
+							entity_index=found_entity_index
+						):
+							is_last_valid_entry_found = True
+
+					found_entity_index += 1
+
+				if is_last_valid_entry_found:
+					break
+
+				if last_entity_json_index is not None and entity_json_index >= last_entity_json_index:
+					break
+
+				if maximum_valid_entities_total is not None and found_entity_index >= maximum_valid_entities_total:
+					break
+		except GeneratorExit:
+			# a page that is abandoned part way through leaves no cursor behind
+			iterator.close()
+			raise
+
+		# a criteria that matches at most one entity is fully answered by the first page, so no cursor is kept for the next page
+		if maximum_valid_entities_total is None:
+			self.__register_cursor(
+				redis_key=search_criteria.get_redis_key() + page_criteria.get_next_redis_key(),
+				iterator=iterator,
+				start_entity_index=entity_json_index + 1
 			)
-			if search_criteria.is_valid(
-				entity=entity
-			):
-				if page_criteria.is_valid(
-					entity_index=found_entity_index
+		else:
+			iterator.close()
+
+		return rows_examined_total
+
+	def __search_record_locations(self, *, record_locations: List[Tuple[int, int]], search_criteria: SearchCriteria, page_criteria: PageCriteria) -> Iterator[Entity]:
+		# the candidates are in dump order, so counting the valid ones gives the same pages as a scan
+		rows_examined_total = 0
+		if not record_locations:
+			return rows_examined_total
+		language_code = search_criteria.get_language().get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in search_criteria.get_additional_languages()]
+		found_entity_index = 0
+		with open(self.__json_file_path, "rb") as file_handle:
+			memory_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			for _, offset in record_locations:
+				line_end_index = memory_map.find(b"\n", offset)
+				record = memory_map[offset:len(memory_map) if line_end_index == -1 else line_end_index].rstrip(b" \t\r,")
+				entity = Entity.parse_json(
+					json_dict=json.loads(record, parse_float=decimal.Decimal),
+					language_code=language_code,
+					additional_language_codes=additional_language_codes
+				)
+				rows_examined_total += 1
+				if search_criteria.is_valid(
+					entity=entity,
+					hierarchy_index=self.__hierarchy_index
 				):
-					entities.append(entity)
+					if page_criteria.is_valid(
+						entity_index=found_entity_index
+					):
+						yield entity
 					if page_criteria.is_last_valid_entity_index(
 						entity_index=found_entity_index
 					):
-						is_last_valid_entry_found = True
+						break
+					found_entity_index += 1
+		finally:
+			memory_map.close()
+		return rows_examined_total
 
-				found_entity_index += 1
+	def __get_block_record_iterator(self, *, memory_map: mmap.mmap, block_location: Tuple[int, int, int, int]) -> Iterator[Tuple[int, bytes]]:
+		offset, records_total, minimum_entity_integer, maximum_entity_integer = block_location
+		memory_map_length = len(memory_map)
+		line_start_index = offset
+		for _ in range(records_total):
+			line_end_index = memory_map.find(b"\n", line_start_index)
+			if line_end_index == -1:
+				line_end_index = memory_map_length
+			record = memory_map[line_start_index:line_end_index].rstrip(b" \t\r,")
+			line_start_index = line_end_index + 1
+			if not record.startswith(b"{"):
+				raise Exception(f"Sparse id index does not match the records of the file: {self.__json_file_path}")
+			entity_integer = convert_entity_id_to_integer(entity_id=WikiDataDumpDiff.get_record_entity_id(record=record))
+			if not minimum_entity_integer <= entity_integer <= maximum_entity_integer:
+				raise Exception(f"Sparse id index does not match the records of the file: {self.__json_file_path}")
+			yield entity_integer, record
 
-			if is_last_valid_entry_found:
-				break
+	def __search_blocks(self, *, block_locations: List[Tuple[int, int, int, int]], search_criteria: SearchCriteria, page_criteria: PageCriteria) -> Iterator[Entity]:
+		# only the blocks whose id bounds overlap the range are read, and every id read is checked against the bounds of its block
+		rows_examined_total = 0
+		if not block_locations:
+			return rows_examined_total
+		language_code = search_criteria.get_language().get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in search_criteria.get_additional_languages()]
+		found_entity_index = 0
+		with open(self.__json_file_path, "rb") as file_handle:
+			memory_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			for block_location in block_locations:
+				for entity_integer, record in self.__get_block_record_iterator(memory_map=memory_map, block_location=block_location):
+					if not search_criteria.is_entity_integer_in_range(entity_integer=entity_integer):
+						continue
+					entity = Entity.parse_json(
+						json_dict=json.loads(record, parse_float=decimal.Decimal),
+						language_code=language_code,
+						additional_language_codes=additional_language_codes
+					)
+					rows_examined_total += 1
+					if search_criteria.is_valid(
+						entity=entity,
+						hierarchy_index=self.__hierarchy_index
+					):
+						if page_criteria.is_valid(
+							entity_index=found_entity_index
+						):
+							yield entity
+						if page_criteria.is_last_valid_entity_index(
+							entity_index=found_entity_index
+						):
+							return rows_examined_total
+						found_entity_index += 1
+		finally:
+			memory_map.close()
+		return rows_examined_total
+
+	def get_query_plan(self, *, search_criteria: SearchCriteria) -> QueryPlan:
+		return self.__query_planner.get_query_plan(
+			search_criteria=search_criteria
+		)
 
-		next_redis_key = search_criteria.get_redis_key() + page_criteria.get_next_redis_key()
-		self.__iterator_and_start_entity_index_pair_per_redis_key[next_redis_key] = (iterator, entity_json_index + 1)
+	@staticmethod
+	def __get_entities_and_rows_examined_total(*, entity_iterator: Iterator[Entity]) -> Tuple[List[Entity], int]:
+		entities = []  # type: List[Entity]
+		while True:
+			try:
+				entities.append(next(entity_iterator))
+			except StopIteration as stop_iteration:
+				return entities, stop_iteration.value
 
-		return entities
+	def explain(self, *, search_criteria: SearchCriteria, page_criteria: PageCriteria) -> QueryPlanExplanation:
+		# runs the search, so a cursor for the next page is kept just as search would keep it
+		start_time = time.perf_counter()
+		query_plan = self.__query_planner.get_query_plan(
+			search_criteria=search_criteria
+		)
+		entities, rows_examined_total = WikiDataParser.__get_entities_and_rows_examined_total(
+			entity_iterator=self.__get_search_iterator(
+				search_criteria=search_criteria,
+				page_criteria=page_criteria,
+				query_plan=query_plan
+			)
+		)
+		return QueryPlanExplanation(
+			query_plan=query_plan,
+			actual_rows_examined_total=rows_examined_total,
+			actual_rows_returned_total=len(entities),
+			elapsed_seconds=time.perf_counter() - start_time
+		)
 
 	def search(self, *, search_criteria: SearchCriteria, page_criteria: PageCriteria) -> List[Entity]:
-		redis_key = search_criteria.get_redis_key() + page_criteria.get_current_redis_key()
+		entities, _ = WikiDataParser.__get_entities_and_rows_examined_total(
+			entity_iterator=self.search_iterator(
+				search_criteria=search_criteria,
+				page_criteria=page_criteria
+			)
+		)
+		return entities
 
-		iterator, start_entity_index = self.__iterator_and_start_entity_index_pair_per_redis_key.pop(redis_key, (None, None))
-		if iterator is None:
+	def search_iterator(self, *, search_criteria: SearchCriteria, page_criteria: PageCriteria) -> Iterator[Entity]:
+		# yields each entity of the page as soon as it is found, and the cursor for the next page is only kept once the page is complete
+		return self.__get_search_iterator(
+			search_criteria=search_criteria,
+			page_criteria=page_criteria,
+			query_plan=self.__query_planner.get_query_plan(
+				search_criteria=search_criteria
+			)
+		)
+
+	def __get_block_sample_estimate_iterator(self, *, search_criteria: SearchCriteria, confidence: float, z_score: float, target_margin_of_error: Optional[float], minimum_records_sampled_total: int, random_seed: Optional[int]) -> Iterator[ApproximateEstimate]:
+		# whole blocks are sampled in random order without replacement, so the fraction is a ratio estimate over clusters of records
+		block_locations = self.__sparse_id_index.get_block_locations(
+			minimum_entity_integer=0,
+			maximum_entity_integer=2 ** 63 - 1
+		)
+		random.Random(random_seed).shuffle(block_locations)
+		blocks_total = len(block_locations)
+		records_total = sum(records_total for _, records_total, _, _ in block_locations)
+		raw_required_parts = search_criteria.get_raw_required_parts()
+		language_code = search_criteria.get_language().get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in search_criteria.get_additional_languages()]
+		block_records_totals = []  # type: List[int]
+		block_matches_totals = []  # type: List[int]
+		if not block_locations:
+			yield ApproximateEstimate(records_sampled_total=0, matches_total=0, records_total=0, fraction=0.0, margin_of_error=0.0, confidence=confidence, is_exact=True)
+			return
+		with open(self.__json_file_path, "rb") as file_handle:
+			memory_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			for block_location in block_locations:
+				block_matches_total = 0
+				for _, record in self.__get_block_record_iterator(memory_map=memory_map, block_location=block_location):
+					if raw_required_parts and any(record.find(raw_required_part) == -1 for raw_required_part in raw_required_parts):
+						continue
+					if search_criteria.is_valid(
+						entity=Entity.parse_json(
+							json_dict=json.loads(record, parse_float=decimal.Decimal),
+							language_code=language_code,
+							additional_language_codes=additional_language_codes
+						),
+						hierarchy_index=self.__hierarchy_index
+					):
+						block_matches_total += 1
+				block_records_totals.append(block_location[1])
+				block_matches_totals.append(block_matches_total)
+
+				blocks_sampled_total = len(block_records_totals)
+				records_sampled_total = sum(block_records_totals)
+				matches_total = sum(block_matches_totals)
+				fraction = matches_total / records_sampled_total if records_sampled_total else 0.0
+				if blocks_sampled_total == blocks_total:
+					margin_of_error = 0.0
+				elif blocks_sampled_total < 2 or records_sampled_total == 0:
+					margin_of_error = math.inf
+				else:
+					average_block_records_total = records_sampled_total / blocks_sampled_total
+					residual_variance = sum((block_matches_total - fraction * block_records_total) ** 2 for block_matches_total, block_records_total in zip(block_matches_totals, block_records_totals)) / (blocks_sampled_total - 1)
+					margin_of_error = z_score * math.sqrt((1 - blocks_sampled_total / blocks_total) * residual_variance / (blocks_sampled_total * average_block_records_total ** 2))
+				yield ApproximateEstimate(
+					records_sampled_total=records_sampled_total,
+					matches_total=matches_total,
+					records_total=records_total,
+					fraction=fraction,
+					margin_of_error=margin_of_error,
+					confidence=confidence,
+					is_exact=blocks_sampled_total == blocks_total
+				)
+				if target_margin_of_error is not None and records_sampled_total >= minimum_records_sampled_total and margin_of_error <= target_margin_of_error:
+					return
+		finally:
+			memory_map.close()
+
+	def __get_prefix_sample_estimate_iterator(self, *, search_criteria: SearchCriteria, confidence: float, z_score: float, target_margin_of_error: Optional[float], minimum_records_sampled_total: int, records_per_estimate: int) -> Iterator[ApproximateEstimate]:
+		# without a sparse id index the sample is the start of the dump, which is only as representative as the dump order allows
+		records_total = None if self.__offset_index is None else self.__offset_index.get_entities_total()
+		records_sampled_total = 0
+		matches_total = 0
 
-			if self.__json_file_path.endswith(".bz2"):
-				open_method = bz2.open
-			elif self.__json_file_path.endswith(".gz"):
-				open_method = gzip.open
-			elif self.__json_file_path.endswith(".json"):
-				open_method = open
+		def get_estimate(*, is_exact: bool) -> ApproximateEstimate:
+			fraction = matches_total / records_sampled_total if records_sampled_total else 0.0
+			if is_exact:
+				margin_of_error = 0.0
+			elif records_sampled_total == 0:
+				margin_of_error = math.inf
 			else:
-				raise NotImplementedError(f"Unable to parse file type: {self.__json_file_path}")
+				finite_population_correction = 1.0 if records_total is None or records_total <= 1 else max(0.0, (records_total - records_sampled_total) / (records_total - 1))
+				margin_of_error = z_score * math.sqrt(fraction * (1 - fraction) / records_sampled_total * finite_population_correction)
+			return ApproximateEstimate(
+				records_sampled_total=records_sampled_total,
+				matches_total=matches_total,
+				records_total=records_sampled_total if is_exact else records_total,
+				fraction=fraction,
+				margin_of_error=margin_of_error,
+				confidence=confidence,
+				is_exact=is_exact
+			)
+
+		entity_iterator = self.__get_indexed_entity_iterator(
+			language=search_criteria.get_language(),
+			additional_languages=search_criteria.get_additional_languages(),
+			raw_required_parts=None
+		)
+		try:
+			for _, entity in entity_iterator:
+				records_sampled_total += 1
+				if search_criteria.is_valid(
+					entity=entity,
+					hierarchy_index=self.__hierarchy_index
+				):
+					matches_total += 1
+				if records_sampled_total % records_per_estimate == 0:
+					approximate_estimate = get_estimate(
+						is_exact=False
+					)
+					yield approximate_estimate
+					if target_margin_of_error is not None and records_sampled_total >= minimum_records_sampled_total and approximate_estimate.get_margin_of_error() <= target_margin_of_error:
+						return
+		finally:
+			entity_iterator.close()
+		yield get_estimate(
+			is_exact=True
+		)
+
+	def get_approximate_estimate_iterator(self, *, search_criteria: SearchCriteria, confidence: float = 0.95, target_margin_of_error: Optional[float] = None, minimum_records_sampled_total: int = 1000, records_per_estimate: int = 10000, random_seed: Optional[int] = None) -> Iterator[ApproximateEstimate]:
+		# each estimate refines the previous one, and the iteration stops early once the margin of error of the fraction reaches the target
+		z_score = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+		if self.__sparse_id_index is not None:
+			yield from self.__get_block_sample_estimate_iterator(
+				search_criteria=search_criteria,
+				confidence=confidence,
+				z_score=z_score,
+				target_margin_of_error=target_margin_of_error,
+				minimum_records_sampled_total=minimum_records_sampled_total,
+				random_seed=random_seed
+			)
+		else:
+			yield from self.__get_prefix_sample_estimate_iterator(
+				search_criteria=search_criteria,
+				confidence=confidence,
+				z_score=z_score,
+				target_margin_of_error=target_margin_of_error,
+				minimum_records_sampled_total=minimum_records_sampled_total,
+				records_per_estimate=records_per_estimate
+			)
+
+	def estimate(self, *, search_criteria: SearchCriteria, confidence: float = 0.95, target_margin_of_error: float = 0.01, minimum_records_sampled_total: int = 1000, records_per_estimate: int = 10000, random_seed: Optional[int] = None) -> ApproximateEstimate:
+		approximate_estimate = None  # type: Optional[ApproximateEstimate]
+		for approximate_estimate in self.get_approximate_estimate_iterator(
+			search_criteria=search_criteria,
+			confidence=confidence,
+			target_margin_of_error=target_margin_of_error,
+			minimum_records_sampled_total=minimum_records_sampled_total,
+			records_per_estimate=records_per_estimate,
+			random_seed=random_seed
+		):
+			pass
+		return approximate_estimate
+
+	def get_incoming_links(self, *, entity_id: str, property_id: Optional[str] = None) -> List[Tuple[str, str]]:
+		if self.__reverse_link_index is None:
+			raise Exception(f"A reverse link index is required in order to get the incoming links of {entity_id}.")
+		return [
+			(self.__reverse_link_index.get_entity_id(entity_json_index=entity_json_index), link_property_id)
+			for entity_json_index, link_property_id in self.__reverse_link_index.get_incoming_link_entity_json_indexes(
+				entity_id=entity_id,
+				property_id=property_id
+			)
+		]
+
+	def __get_search_iterator(self, *, search_criteria: SearchCriteria, page_criteria: PageCriteria, query_plan: QueryPlan) -> Iterator[Entity]:
+		maximum_valid_entities_total = search_criteria.get_maximum_valid_entities_total()
+		if maximum_valid_entities_total is not None and page_criteria.get_first_valid_entity_index() >= maximum_valid_entities_total:
+			return 0
+
+		if query_plan.get_query_plan_type() == QueryPlanTypeEnum.DatabaseQuery:
+			return (yield from self.__sqlite_database.get_search_iterator(
+				search_criteria=search_criteria,
+				page_criteria=page_criteria,
+				hierarchy_index=self.__hierarchy_index
+			))
+
+		if query_plan.get_query_plan_type() == QueryPlanTypeEnum.RangeScan:
+			return (yield from self.__search_blocks(
+				block_locations=self.__query_planner.get_block_locations(
+					search_criteria=search_criteria
+				),
+				search_criteria=search_criteria,
+				page_criteria=page_criteria
+			))
+
+		if query_plan.get_query_plan_type() != QueryPlanTypeEnum.FullScan:
+			return (yield from self.__search_record_locations(
+				record_locations=self.__query_planner.get_record_locations(
+					search_criteria=search_criteria,
+					query_plan=query_plan
+				),
+				search_criteria=search_criteria,
+				page_criteria=page_criteria
+			))
+
+		last_entity_json_index = None  # type: Optional[int]
+		if self.__sitelink_index is not None and search_criteria.get_sitelink_site_id() is not None:
+			last_entity_json_index = self.__sitelink_index.get_entity_json_index(
+				site_id=search_criteria.get_sitelink_site_id(),
+				title=search_criteria.get_sitelink_title()
+			)
+			if last_entity_json_index is None:
+				return 0
+
+		redis_key = search_criteria.get_redis_key() + page_criteria.get_current_redis_key()
 
-			file_handle = open_method(self.__json_file_path, "rb")
-			iterator = enumerate(ijson.items(file_handle, "item"))
+		iterator, start_entity_index = self.__pop_cursor(
+			redis_key=redis_key
+		)
+		if iterator is None:
+			iterator = self.__get_enumerated_entity_iterator(
+				language=search_criteria.get_language(),
+				additional_languages=search_criteria.get_additional_languages(),
+				raw_required_parts=search_criteria.get_raw_required_parts()
+			)
 			start_entity_index = 0
 
-		entities = self.__search_file_handle(
+		return (yield from self.__search_file_handle(
 			iterator=iterator,
 			start_entity_index=start_entity_index,
 			search_criteria=search_criteria,
-			page_criteria=page_criteria
-		)
-
-		return entities
+			page_criteria=page_criteria,
+			last_entity_json_index=last_entity_json_index
+		))
 
 
 class WikiDataParserIterator():
@@ -448,3 +1661,2466 @@ class WikiDataParserIterator():
 		if entities:
 			return entities[0]
 		raise StopIteration
+
+
+class ExternalSorter():
+
+	def __init__(self, *, maximum_items_in_memory: int, temporary_directory_path: Optional[str] = None, key=None):
+		self.__maximum_items_in_memory = maximum_items_in_memory
+		self.__temporary_directory_path = temporary_directory_path
+		self.__key = key
+
+		self.__items = []
+		self.__run_directory_path = None  # type: Optional[str]
+		self.__run_file_paths = []  # type: List[str]
+
+	def add(self, *, item):
+		self.__items.append(item)
+		if len(self.__items) >= self.__maximum_items_in_memory:
+			self.__write_run()
+
+	def __write_run(self):
+		if self.__run_directory_path is None:
+			self.__run_directory_path = tempfile.mkdtemp(dir=self.__temporary_directory_path)
+		self.__items.sort(key=self.__key)
+		run_file_path = os.path.join(self.__run_directory_path, f"{len(self.__run_file_paths)}.run")
+		with open(run_file_path, "wb") as file_handle:
+			for item_index in range(0, len(self.__items), 10000):
+				pickle.dump(self.__items[item_index:item_index + 10000], file_handle, protocol=pickle.HIGHEST_PROTOCOL)
+		self.__run_file_paths.append(run_file_path)
+		self.__items = []
+
+	@staticmethod
+	def __get_run_iterator(*, run_file_path: str):
+		with open(run_file_path, "rb") as file_handle:
+			while True:
+				try:
+					items = pickle.load(file_handle)
+				except EOFError:
+					break
+				yield from items
+
+	def get_sorted_iterator(self) -> Iterator:
+		self.__items.sort(key=self.__key)
+		if not self.__run_file_paths:
+			yield from self.__items
+		else:
+			yield from heapq.merge(
+				*[ExternalSorter.__get_run_iterator(run_file_path=run_file_path) for run_file_path in self.__run_file_paths],
+				self.__items,
+				key=self.__key
+			)
+
+	def dispose(self):
+		self.__items = []
+		if self.__run_directory_path is not None:
+			shutil.rmtree(self.__run_directory_path, ignore_errors=True)
+			self.__run_directory_path = None
+			self.__run_file_paths = []
+
+
+class CompressedSparseRowGraph():
+
+	def __init__(self, *, source_integers: Sequence[int], offsets: Sequence[int], target_integers: Sequence[int]):
+		self.__source_integers = source_integers
+		self.__offsets = offsets
+		self.__target_integers = target_integers
+
+	def get_source_integers(self) -> Sequence[int]:
+		return self.__source_integers
+
+	def get_offsets(self) -> Sequence[int]:
+		return self.__offsets
+
+	def get_target_integers(self) -> Sequence[int]:
+		return self.__target_integers
+
+	def get_edges_total(self) -> int:
+		return len(self.__target_integers)
+
+	def get_targets(self, *, source_integer: int) -> Sequence[int]:
+		source_index = bisect.bisect_left(self.__source_integers, source_integer)
+		if source_index == len(self.__source_integers) or self.__source_integers[source_index] != source_integer:
+			return ()
+		return self.__target_integers[self.__offsets[source_index]:self.__offsets[source_index + 1]]
+
+	def get_reachable_integers(self, *, source_integer: int) -> Set[int]:
+		reachable_integers = set()  # type: Set[int]
+		pending_integers = deque([source_integer])
+		while pending_integers:
+			for target_integer in self.get_targets(source_integer=pending_integers.popleft()):
+				if target_integer not in reachable_integers:
+					reachable_integers.add(target_integer)
+					pending_integers.append(target_integer)
+		reachable_integers.discard(source_integer)
+		return reachable_integers
+
+	@classmethod
+	def build(cls, *, sorted_edges: Iterator[Tuple[int, int]]) -> CompressedSparseRowGraph:
+		source_integers = array("q")
+		offsets = array("q")
+		target_integers = array("q")
+		previous_edge = None
+		for edge in sorted_edges:
+			if edge == previous_edge:
+				continue
+			if previous_edge is None or edge[0] != previous_edge[0]:
+				source_integers.append(edge[0])
+				offsets.append(len(target_integers))
+			target_integers.append(edge[1])
+			previous_edge = edge
+		offsets.append(len(target_integers))
+		return CompressedSparseRowGraph(
+			source_integers=source_integers,
+			offsets=offsets,
+			target_integers=target_integers
+		)
+
+
+class WikiDataHierarchyIndex():
+
+	def __init__(self, *, subclass_of_graph: CompressedSparseRowGraph, superclass_of_graph: CompressedSparseRowGraph, instance_of_graph: CompressedSparseRowGraph, has_instance_graph: CompressedSparseRowGraph):
+		self.__subclass_of_graph = subclass_of_graph
+		self.__superclass_of_graph = superclass_of_graph
+		self.__instance_of_graph = instance_of_graph
+		self.__has_instance_graph = has_instance_graph
+
+		self.__subclass_integers_per_class_integer = {}  # type: Dict[int, Set[int]]
+		self.__superclass_integers_per_class_integer = {}  # type: Dict[int, Set[int]]
+
+	def __get_subclass_integers(self, *, class_integer: int) -> Set[int]:
+		subclass_integers = self.__subclass_integers_per_class_integer.get(class_integer, None)
+		if subclass_integers is None:
+			subclass_integers = self.__superclass_of_graph.get_reachable_integers(
+				source_integer=class_integer
+			)
+			self.__subclass_integers_per_class_integer[class_integer] = subclass_integers
+		return subclass_integers
+
+	def __get_superclass_integers(self, *, class_integer: int) -> Set[int]:
+		superclass_integers = self.__superclass_integers_per_class_integer.get(class_integer, None)
+		if superclass_integers is None:
+			superclass_integers = self.__subclass_of_graph.get_reachable_integers(
+				source_integer=class_integer
+			)
+			self.__superclass_integers_per_class_integer[class_integer] = superclass_integers
+		return superclass_integers
+
+	def get_subclass_ids(self, *, class_id: str, is_transitive: bool) -> Set[str]:
+		class_integer = convert_entity_id_to_integer(entity_id=class_id)
+		if is_transitive:
+			subclass_integers = self.__get_subclass_integers(class_integer=class_integer)
+		else:
+			subclass_integers = self.__superclass_of_graph.get_targets(source_integer=class_integer)
+		return {convert_integer_to_entity_id(integer=subclass_integer) for subclass_integer in subclass_integers}
+
+	def get_superclass_ids(self, *, class_id: str, is_transitive: bool) -> Set[str]:
+		class_integer = convert_entity_id_to_integer(entity_id=class_id)
+		if is_transitive:
+			superclass_integers = self.__get_superclass_integers(class_integer=class_integer)
+		else:
+			superclass_integers = self.__subclass_of_graph.get_targets(source_integer=class_integer)
+		return {convert_integer_to_entity_id(integer=superclass_integer) for superclass_integer in superclass_integers}
+
+	def get_class_ids(self, *, entity_id: str, is_transitive: bool) -> Set[str]:
+		class_integers = set(self.__instance_of_graph.get_targets(
+			source_integer=convert_entity_id_to_integer(entity_id=entity_id)
+		))
+		if is_transitive:
+			for class_integer in list(class_integers):
+				class_integers.update(self.__get_superclass_integers(class_integer=class_integer))
+		return {convert_integer_to_entity_id(integer=class_integer) for class_integer in class_integers}
+
+	def get_instance_ids(self, *, class_id: str, is_transitive: bool) -> Set[str]:
+		class_integers = {convert_entity_id_to_integer(entity_id=class_id)}
+		if is_transitive:
+			class_integers.update(self.__get_subclass_integers(class_integer=next(iter(class_integers))))
+		instance_ids = set()  # type: Set[str]
+		for class_integer in class_integers:
+			for instance_integer in self.__has_instance_graph.get_targets(source_integer=class_integer):
+				instance_ids.add(convert_integer_to_entity_id(integer=instance_integer))
+		return instance_ids
+
+	def get_maximum_instances_total(self, *, class_id: str, is_transitive: bool) -> int:
+		# counts the instance edges without collecting them, so an entity that is an instance of several of the classes is counted once per class
+		class_integers = {convert_entity_id_to_integer(entity_id=class_id)}
+		if is_transitive:
+			class_integers.update(self.__get_subclass_integers(class_integer=next(iter(class_integers))))
+		return sum(len(self.__has_instance_graph.get_targets(source_integer=class_integer)) for class_integer in class_integers)
+
+	def is_instance_of(self, *, entity_id: str, class_id: str, is_transitive: bool) -> bool:
+		class_integer = convert_entity_id_to_integer(entity_id=class_id)
+		if is_transitive:
+			subclass_integers = self.__get_subclass_integers(class_integer=class_integer)
+		else:
+			subclass_integers = ()
+		for instance_of_integer in self.__instance_of_graph.get_targets(source_integer=convert_entity_id_to_integer(entity_id=entity_id)):
+			if instance_of_integer == class_integer or instance_of_integer in subclass_integers:
+				return True
+		return False
+
+	def save(self, *, index_file_path: str):
+		integer_arrays = {}  # type: Dict[str, array]
+		for graph_name, graph in [
+			("subclass_of", self.__subclass_of_graph),
+			("superclass_of", self.__superclass_of_graph),
+			("instance_of", self.__instance_of_graph),
+			("has_instance", self.__has_instance_graph)
+		]:
+			integer_arrays[f"{graph_name}_source_integers"] = array("q", graph.get_source_integers())
+			integer_arrays[f"{graph_name}_offsets"] = array("q", graph.get_offsets())
+			integer_arrays[f"{graph_name}_target_integers"] = array("q", graph.get_target_integers())
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays=integer_arrays
+		)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataHierarchyIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		graph_per_graph_name = {}  # type: Dict[str, CompressedSparseRowGraph]
+		for graph_name in ["subclass_of", "superclass_of", "instance_of", "has_instance"]:
+			graph_per_graph_name[graph_name] = CompressedSparseRowGraph(
+				source_integers=integer_arrays[f"{graph_name}_source_integers"],
+				offsets=integer_arrays[f"{graph_name}_offsets"],
+				target_integers=integer_arrays[f"{graph_name}_target_integers"]
+			)
+		return WikiDataHierarchyIndex(
+			subclass_of_graph=graph_per_graph_name["subclass_of"],
+			superclass_of_graph=graph_per_graph_name["superclass_of"],
+			instance_of_graph=graph_per_graph_name["instance_of"],
+			has_instance_graph=graph_per_graph_name["has_instance"]
+		)
+
+	@staticmethod
+	def get_item_value_ids(*, entity_json: Dict, property_id: str) -> List[str]:
+		item_value_ids = []  # type: List[str]
+		for claim_json in entity_json["claims"].get(property_id, []):
+			mainsnak_json = claim_json["mainsnak"]
+			if mainsnak_json.get("datatype", None) == "wikibase-item" and "datavalue" in mainsnak_json:
+				item_value_ids.append(mainsnak_json["datavalue"]["value"]["id"])
+		return item_value_ids
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, maximum_edges_in_memory: int = 10000000, temporary_directory_path: Optional[str] = None) -> WikiDataHierarchyIndex:
+		return WikiDataHierarchyIndex.__build(
+			entity_id_and_item_value_ids_per_property_id_pairs=((entity_json["id"], {
+				property_id: WikiDataHierarchyIndex.get_item_value_ids(entity_json=entity_json, property_id=property_id) for property_id in ["P31", "P279"]
+			}) for entity_json in wiki_data_parser.get_entity_json_iterator()),
+			maximum_edges_in_memory=maximum_edges_in_memory,
+			temporary_directory_path=temporary_directory_path
+		)
+
+	@classmethod
+	def build_from_manifest(cls, *, index_manifest: WikiDataIndexManifest, maximum_edges_in_memory: int = 10000000, temporary_directory_path: Optional[str] = None) -> WikiDataHierarchyIndex:
+		return WikiDataHierarchyIndex.__build(
+			entity_id_and_item_value_ids_per_property_id_pairs=((entity_id, payload["item_value_ids_per_property_id"]) for _, entity_id, payload in index_manifest.get_payload_iterator()),
+			maximum_edges_in_memory=maximum_edges_in_memory,
+			temporary_directory_path=temporary_directory_path
+		)
+
+	@staticmethod
+	def __build(*, entity_id_and_item_value_ids_per_property_id_pairs: Iterator[Tuple[str, Dict[str, List[str]]]], maximum_edges_in_memory: int, temporary_directory_path: Optional[str]) -> WikiDataHierarchyIndex:
+		external_sorter_per_graph_name = {
+			graph_name: ExternalSorter(
+				maximum_items_in_memory=maximum_edges_in_memory,
+				temporary_directory_path=temporary_directory_path
+			) for graph_name in ["subclass_of", "superclass_of", "instance_of", "has_instance"]
+		}  # type: Dict[str, ExternalSorter]
+		try:
+			for entity_id, item_value_ids_per_property_id in entity_id_and_item_value_ids_per_property_id_pairs:
+				entity_integer = convert_entity_id_to_integer(entity_id=entity_id)
+				for forward_graph_name, reverse_graph_name, property_id in [
+					("subclass_of", "superclass_of", "P279"),
+					("instance_of", "has_instance", "P31")
+				]:
+					for item_value_id in item_value_ids_per_property_id.get(property_id, []):
+						item_value_integer = convert_entity_id_to_integer(entity_id=item_value_id)
+						external_sorter_per_graph_name[forward_graph_name].add(item=(entity_integer, item_value_integer))
+						external_sorter_per_graph_name[reverse_graph_name].add(item=(item_value_integer, entity_integer))
+
+			graph_per_graph_name = {
+				graph_name: CompressedSparseRowGraph.build(
+					sorted_edges=external_sorter.get_sorted_iterator()
+				) for graph_name, external_sorter in external_sorter_per_graph_name.items()
+			}  # type: Dict[str, CompressedSparseRowGraph]
+		finally:
+			for external_sorter in external_sorter_per_graph_name.values():
+				external_sorter.dispose()
+
+		return WikiDataHierarchyIndex(
+			subclass_of_graph=graph_per_graph_name["subclass_of"],
+			superclass_of_graph=graph_per_graph_name["superclass_of"],
+			instance_of_graph=graph_per_graph_name["instance_of"],
+			has_instance_graph=graph_per_graph_name["has_instance"]
+		)
+
+
+class SpillingIntegerMapper():
+
+	def __init__(self, *, database_file_path: str, maximum_integers_in_memory: int):
+		self.__database_file_path = database_file_path
+		self.__maximum_integers_in_memory = maximum_integers_in_memory
+
+		self.__mapped_integer_per_integer = {}  # type: Dict[int, int]
+		self.__mapped_integers_total = 0
+		self.__connection = None  # type: Optional[sqlite3.Connection]
+
+	def __spill(self):
+		if self.__connection is None:
+			if os.path.exists(self.__database_file_path):
+				os.remove(self.__database_file_path)
+			self.__connection = sqlite3.connect(self.__database_file_path)
+			self.__connection.execute("CREATE TABLE integer_map (integer INTEGER PRIMARY KEY, mapped_integer INTEGER NOT NULL)")
+			self.__connection.execute("CREATE TEMPORARY TABLE integer_lookup (integer INTEGER PRIMARY KEY)")
+		with self.__connection:
+			self.__connection.executemany("INSERT INTO integer_map (integer, mapped_integer) VALUES (?, ?)", self.__mapped_integer_per_integer.items())
+		self.__mapped_integer_per_integer.clear()
+
+	def __get_spilled_mapped_integer_per_integer(self, *, integers: List[int]) -> Dict[int, int]:
+		# the whole batch is resolved with one join instead of one query per integer
+		with self.__connection:
+			self.__connection.execute("DELETE FROM integer_lookup")
+			self.__connection.executemany("INSERT OR IGNORE INTO integer_lookup (integer) VALUES (?)", ((integer,) for integer in integers))
+			return dict(self.__connection.execute("SELECT integer_map.integer, integer_map.mapped_integer FROM integer_lookup JOIN integer_map ON integer_map.integer = integer_lookup.integer"))
+
+	def get_or_add_mapped_integers(self, *, integers: List[int]) -> Tuple[Dict[int, int], List[int]]:
+		mapped_integer_per_integer = {}  # type: Dict[int, int]
+		missing_integers = []  # type: List[int]
+		for integer in integers:
+			mapped_integer = self.__mapped_integer_per_integer.get(integer, None)
+			if mapped_integer is None:
+				missing_integers.append(integer)
+			else:
+				mapped_integer_per_integer[integer] = mapped_integer
+		if missing_integers and self.__connection is not None:
+			mapped_integer_per_integer.update(self.__get_spilled_mapped_integer_per_integer(
+				integers=missing_integers
+			))
+		added_integers = []  # type: List[int]
+		for integer in missing_integers:
+			if integer in mapped_integer_per_integer:
+				continue
+			if len(self.__mapped_integer_per_integer) >= self.__maximum_integers_in_memory:
+				self.__spill()
+			self.__mapped_integer_per_integer[integer] = self.__mapped_integers_total
+			mapped_integer_per_integer[integer] = self.__mapped_integers_total
+			added_integers.append(integer)
+			self.__mapped_integers_total += 1
+		return mapped_integer_per_integer, added_integers
+
+	def get_mapped_integers_total(self) -> int:
+		return self.__mapped_integers_total
+
+	def dispose(self):
+		self.__mapped_integer_per_integer.clear()
+		if self.__connection is not None:
+			self.__connection.close()
+			self.__connection = None
+			os.remove(self.__database_file_path)
+
+
+class WikiDataItemGraph():
+
+	def __init__(self, *, entity_integers: Sequence[int], source_integers: Sequence[int], property_integers: Sequence[int], target_integers: Sequence[int]):
+		self.__entity_integers = entity_integers
+		self.__source_integers = source_integers
+		self.__property_integers = property_integers
+		self.__target_integers = target_integers
+
+	def get_ids_total(self) -> int:
+		return len(self.__entity_integers)
+
+	def get_edges_total(self) -> int:
+		return len(self.__source_integers)
+
+	def get_id(self, *, integer: int) -> str:
+		return convert_integer_to_entity_id(integer=self.__entity_integers[integer])
+
+	def get_source_integers(self) -> Sequence[int]:
+		return self.__source_integers
+
+	def get_property_integers(self) -> Sequence[int]:
+		return self.__property_integers
+
+	def get_target_integers(self) -> Sequence[int]:
+		return self.__target_integers
+
+	def get_edge(self, *, edge_index: int) -> Tuple[str, str, str]:
+		return self.get_id(integer=self.__source_integers[edge_index]), \
+			self.get_id(integer=self.__property_integers[edge_index]), \
+			self.get_id(integer=self.__target_integers[edge_index])
+
+	@classmethod
+	def load(cls, *, directory_path: str) -> WikiDataItemGraph:
+		with open(os.path.join(directory_path, "graph.json"), "r") as file_handle:
+			graph_json = json.load(file_handle)
+		typecode = graph_json["typecode"]
+
+		def get_memory_mapped_integers(file_name: str, typecode: str) -> Sequence[int]:
+			file_path = os.path.join(directory_path, file_name)
+			if os.path.getsize(file_path) == 0:
+				return array(typecode)
+			with open(file_path, "rb") as file_handle:
+				return memoryview(mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)).cast(typecode)
+
+		return WikiDataItemGraph(
+			entity_integers=get_memory_mapped_integers("ids.bin", "q"),
+			source_integers=get_memory_mapped_integers("sources.bin", typecode),
+			property_integers=get_memory_mapped_integers("properties.bin", typecode),
+			target_integers=get_memory_mapped_integers("targets.bin", typecode)
+		)
+
+	@classmethod
+	def export(cls, *, wiki_data_parser: WikiDataParser, directory_path: str, is_64_bit: bool = False, maximum_ids_in_memory: int = 10000000, maximum_edges_in_memory: int = 1000000):
+		typecode = "q" if is_64_bit else "i"
+		maximum_integer = 2 ** 63 - 1 if is_64_bit else 2 ** 31 - 1
+		os.makedirs(directory_path, exist_ok=True)
+
+		integer_mapper = SpillingIntegerMapper(
+			database_file_path=os.path.join(directory_path, "ids.sqlite"),
+			maximum_integers_in_memory=maximum_ids_in_memory
+		)
+		# edges are buffered with their entity integers so that the ids of a whole buffer are mapped in one batch
+		buffered_edge_entity_integers = array("q")
+		edges_total = 0
+		file_handles = [open(os.path.join(directory_path, file_name), "wb") for file_name in ["ids.bin", "sources.bin", "properties.bin", "targets.bin"]]
+		try:
+			ids_file_handle, edge_file_handles = file_handles[0], file_handles[1:]
+
+			def write_buffered_edges():
+				mapped_integer_per_integer, added_integers = integer_mapper.get_or_add_mapped_integers(
+					integers=list(dict.fromkeys(buffered_edge_entity_integers))
+				)
+				if integer_mapper.get_mapped_integers_total() - 1 > maximum_integer:
+					raise Exception(f"Unable to map more than {maximum_integer + 1} ids without is_64_bit.")
+				array("q", added_integers).tofile(ids_file_handle)
+				for edge_file_index, edge_file_handle in enumerate(edge_file_handles):
+					array(typecode, [mapped_integer_per_integer[entity_integer] for entity_integer in buffered_edge_entity_integers[edge_file_index::3]]).tofile(edge_file_handle)
+				del buffered_edge_entity_integers[:]
+
+			for entity_json in wiki_data_parser.get_entity_json_iterator():
+				source_integer = None
+				for property_id, claim_property_value_json_dicts in entity_json["claims"].items():
+					property_integer = None
+					for claim_property_value_json_dict in claim_property_value_json_dicts:
+						mainsnak_json = claim_property_value_json_dict["mainsnak"]
+						if mainsnak_json.get("datatype", None) != "wikibase-item" or "datavalue" not in mainsnak_json:
+							continue
+						is_successful, claim_property_value = ClaimPropertyValue.try_parse_json(
+							json_dict=mainsnak_json
+						)
+						if not is_successful:
+							continue
+						if source_integer is None:
+							source_integer = convert_entity_id_to_integer(entity_id=entity_json["id"])
+						if property_integer is None:
+							property_integer = convert_entity_id_to_integer(entity_id=property_id)
+						buffered_edge_entity_integers.append(source_integer)
+						buffered_edge_entity_integers.append(property_integer)
+						buffered_edge_entity_integers.append(convert_entity_id_to_integer(entity_id=claim_property_value.get_value()))
+						edges_total += 1
+						if len(buffered_edge_entity_integers) >= maximum_edges_in_memory * 3:
+							write_buffered_edges()
+
+			write_buffered_edges()
+		finally:
+			for file_handle in file_handles:
+				file_handle.close()
+			ids_total = integer_mapper.get_mapped_integers_total()
+			integer_mapper.dispose()
+
+		with open(os.path.join(directory_path, "graph.json"), "w") as file_handle:
+			json.dump({
+				"typecode": typecode,
+				"ids_total": ids_total,
+				"edges_total": edges_total
+			}, file_handle)
+
+
+class WikiDataEntityCache():
+
+	def __init__(self, *, directory_path: str):
+		self.__directory_path = directory_path
+
+		os.makedirs(self.__directory_path, exist_ok=True)
+
+	def get_cache_file_path(self, *, json_file_path: str, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None) -> str:
+		json_file_stat = os.stat(json_file_path)
+		language_codes = [language.get_language_code()] + sorted({additional_language.get_language_code() for additional_language in additional_languages or []} - {language.get_language_code()})
+		cache_key = hashlib.sha1(f"{os.path.abspath(json_file_path)}\u0000{json_file_stat.st_size}\u0000{json_file_stat.st_mtime_ns}\u0000{','.join(language_codes)}".encode()).hexdigest()
+		return os.path.join(self.__directory_path, f"{cache_key}.entities")
+
+	def is_cached(self, *, json_file_path: str, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None) -> bool:
+		return os.path.exists(self.get_cache_file_path(
+			json_file_path=json_file_path,
+			language=language,
+			additional_languages=additional_languages
+		))
+
+	def build(self, *, wiki_data_parser: WikiDataParser, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None):
+		cache_file_path = self.get_cache_file_path(
+			json_file_path=wiki_data_parser.get_json_file_path(),
+			language=language,
+			additional_languages=additional_languages
+		)
+		language_code = language.get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in additional_languages or []]
+		# written to a uniquely named temporary file first so that an interrupted or concurrent build is never mistaken for a complete cache
+		temporary_file_descriptor, temporary_cache_file_path = tempfile.mkstemp(dir=self.__directory_path, suffix=".tmp")
+		try:
+			with os.fdopen(temporary_file_descriptor, "wb") as file_handle:
+				for entity_json in wiki_data_parser.get_entity_json_iterator():
+					entity_bytes = Entity.parse_json(
+						json_dict=entity_json,
+						language_code=language_code,
+						additional_language_codes=additional_language_codes
+					).to_bytes()
+					file_handle.write(struct.pack("<I", len(entity_bytes)))
+					file_handle.write(entity_bytes)
+			os.replace(temporary_cache_file_path, cache_file_path)
+		except BaseException:
+			os.remove(temporary_cache_file_path)
+			raise
+
+	def get_entity_iterator(self, *, json_file_path: str, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None) -> Iterator[Entity]:
+		with open(self.get_cache_file_path(json_file_path=json_file_path, language=language, additional_languages=additional_languages), "rb") as file_handle:
+			while True:
+				entity_length_bytes = file_handle.read(4)
+				if not entity_length_bytes:
+					break
+				entity_length, = struct.unpack("<I", entity_length_bytes)
+				yield Entity.parse_bytes(
+					entity_bytes=file_handle.read(entity_length)
+				)
+
+	def remove(self, *, json_file_path: str, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None):
+		cache_file_path = self.get_cache_file_path(
+			json_file_path=json_file_path,
+			language=language,
+			additional_languages=additional_languages
+		)
+		if os.path.exists(cache_file_path):
+			os.remove(cache_file_path)
+
+
+class WikiDataParserServer():
+
+	def __init__(self, *, wiki_data_parser: WikiDataParser, address: Union[str, Tuple[str, int]], authkey: Optional[bytes] = None):
+		self.__wiki_data_parser = wiki_data_parser
+		self.__address = address
+		self.__authkey = authkey
+
+		if not isinstance(self.__address, str) and not self.__authkey:
+			# requests are unpickled, so an unauthenticated TCP listener would let any local user run code inside the server
+			raise Exception("An authkey is required when listening on a TCP address.")
+
+		self.__listener = None  # type: Optional[Listener]
+		self.__listener_thread = None  # type: Optional[threading.Thread]
+		self.__search_lock = threading.Lock()
+		self.__is_stopping = False
+
+	def get_address(self) -> Union[str, Tuple[str, int]]:
+		if self.__listener is not None:
+			return self.__listener.address
+		return self.__address
+
+	def __process_connection(self, *, connection):
+		with connection:
+			while True:
+				try:
+					request = connection.recv()
+				except (EOFError, OSError):
+					break
+				method_name, search_criteria, page_criteria = request
+				try:
+					if method_name != "search":
+						raise NotImplementedError(f"Method not implemented: {method_name}")
+					# the parser and its cursor cache are shared by every client, so searches are processed one at a time
+					with self.__search_lock:
+						entities = self.__wiki_data_parser.search(
+							search_criteria=search_criteria,
+							page_criteria=page_criteria
+						)
+					response = (True, entities)
+				except Exception as ex:
+					response = (False, ex)
+				try:
+					connection.send(response)
+				except (EOFError, OSError):
+					break
+
+	def __accept_connections(self):
+		while not self.__is_stopping:
+			try:
+				connection = self.__listener.accept()
+			except (EOFError, OSError, AuthenticationError):
+				if self.__is_stopping:
+					break
+				continue
+			if self.__is_stopping:
+				connection.close()
+				break
+			threading.Thread(
+				target=self.__process_connection,
+				kwargs={
+					"connection": connection
+				},
+				daemon=True
+			).start()
+
+	def start(self):
+		if self.__listener is not None:
+			raise Exception("Server already started.")
+		if isinstance(self.__address, str) and os.path.exists(self.__address):
+			# remove the socket file left behind by a previous server process
+			os.remove(self.__address)
+		self.__is_stopping = False
+		if isinstance(self.__address, str):
+			# the socket file is created with owner-only permissions so that other local users cannot connect
+			previous_umask = os.umask(0o177)
+			try:
+				self.__listener = Listener(self.__address, authkey=self.__authkey)
+			finally:
+				os.umask(previous_umask)
+		else:
+			self.__listener = Listener(self.__address, authkey=self.__authkey)
+		self.__listener_thread = threading.Thread(
+			target=self.__accept_connections,
+			daemon=True
+		)
+		self.__listener_thread.start()
+
+	def serve_forever(self):
+		self.start()
+		self.__listener_thread.join()
+
+	def stop(self):
+		if self.__listener is None:
+			raise Exception("Server not started.")
+		self.__is_stopping = True
+		# closing the listener does not interrupt a blocked accept on every platform, so connect once to release it
+		try:
+			Client(self.__listener.address, authkey=self.__authkey).close()
+		except (EOFError, OSError, AuthenticationError):
+			pass
+		self.__listener_thread.join()
+		self.__listener.close()
+		self.__listener = None
+		self.__listener_thread = None
+
+
+class WikiDataParserClient():
+
+	def __init__(self, *, address: Union[str, Tuple[str, int]], authkey: Optional[bytes] = None):
+		self.__address = address
+		self.__authkey = authkey
+
+	def search(self, *, search_criteria: SearchCriteria, page_criteria: PageCriteria) -> List[Entity]:
+		with Client(self.__address, authkey=self.__authkey) as connection:
+			connection.send(("search", search_criteria, page_criteria))
+			is_successful, response = connection.recv()
+		if not is_successful:
+			raise response
+		return response
+
+
+class WikiDataSitelinkIndex():
+
+	def __init__(self, *, slot_hash_highs: Sequence[int], slot_hash_lows: Sequence[int], slot_entity_integers: Sequence[int], slot_entity_json_indexes: Sequence[int]):
+		self.__slot_hash_highs = slot_hash_highs
+		self.__slot_hash_lows = slot_hash_lows
+		self.__slot_entity_integers = slot_entity_integers
+		self.__slot_entity_json_indexes = slot_entity_json_indexes
+
+	@staticmethod
+	def get_sitelink_hash(*, site_id: str, title: str) -> Tuple[int, int]:
+		# a 128-bit hash makes collisions negligible, so titles do not need to be stored for verification
+		return struct.unpack("<qq", hashlib.blake2b(f"{site_id}\u0000{normalize_sitelink_title(site_id=site_id, title=title)}".encode(), digest_size=16).digest())
+
+	def __get_slot_index(self, *, site_id: str, title: str) -> Optional[int]:
+		slots_total = len(self.__slot_entity_integers)
+		if slots_total == 0:
+			return None
+		hash_high, hash_low = WikiDataSitelinkIndex.get_sitelink_hash(
+			site_id=site_id,
+			title=title
+		)
+		slot_index = hash_low % slots_total
+		while self.__slot_entity_integers[slot_index] != -1:
+			if self.__slot_hash_highs[slot_index] == hash_high and self.__slot_hash_lows[slot_index] == hash_low:
+				return slot_index
+			slot_index = (slot_index + 1) % slots_total
+		return None
+
+	def get_entity_id(self, *, site_id: str, title: str) -> Optional[str]:
+		slot_index = self.__get_slot_index(
+			site_id=site_id,
+			title=title
+		)
+		if slot_index is None:
+			return None
+		return convert_integer_to_entity_id(integer=self.__slot_entity_integers[slot_index])
+
+	def get_entity_json_index(self, *, site_id: str, title: str) -> Optional[int]:
+		slot_index = self.__get_slot_index(
+			site_id=site_id,
+			title=title
+		)
+		if slot_index is None:
+			return None
+		return self.__slot_entity_json_indexes[slot_index]
+
+	def save(self, *, index_file_path: str):
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays={
+				"slot_hash_highs": array("q", self.__slot_hash_highs),
+				"slot_hash_lows": array("q", self.__slot_hash_lows),
+				"slot_entity_integers": array("q", self.__slot_entity_integers),
+				"slot_entity_json_indexes": array("q", self.__slot_entity_json_indexes)
+			}
+		)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataSitelinkIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		return WikiDataSitelinkIndex(
+			slot_hash_highs=integer_arrays["slot_hash_highs"],
+			slot_hash_lows=integer_arrays["slot_hash_lows"],
+			slot_entity_integers=integer_arrays["slot_entity_integers"],
+			slot_entity_json_indexes=integer_arrays["slot_entity_json_indexes"]
+		)
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, site_ids: Optional[List[str]] = None, load_factor: float = 0.7) -> WikiDataSitelinkIndex:
+		return WikiDataSitelinkIndex.__build(
+			entity_json_index_and_entity_id_and_title_per_site_id_tuples=((entity_json_index, entity_json["id"], {
+				site_id: sitelink_json["title"] for site_id, sitelink_json in entity_json.get("sitelinks", {}).items()
+			}) for entity_json_index, entity_json in enumerate(wiki_data_parser.get_entity_json_iterator())),
+			site_ids=site_ids,
+			load_factor=load_factor
+		)
+
+	@classmethod
+	def build_from_manifest(cls, *, index_manifest: WikiDataIndexManifest, site_ids: Optional[List[str]] = None, load_factor: float = 0.7) -> WikiDataSitelinkIndex:
+		return WikiDataSitelinkIndex.__build(
+			entity_json_index_and_entity_id_and_title_per_site_id_tuples=((entity_json_index, entity_id, payload["title_per_site_id"]) for entity_json_index, entity_id, payload in index_manifest.get_payload_iterator()),
+			site_ids=site_ids,
+			load_factor=load_factor
+		)
+
+	@staticmethod
+	def __build(*, entity_json_index_and_entity_id_and_title_per_site_id_tuples: Iterator[Tuple[int, str, Dict[str, str]]], site_ids: Optional[List[str]], load_factor: float) -> WikiDataSitelinkIndex:
+		hash_highs = array("q")
+		hash_lows = array("q")
+		entity_integers = array("q")
+		entity_json_indexes = array("q")
+		for entity_json_index, entity_id, title_per_site_id in entity_json_index_and_entity_id_and_title_per_site_id_tuples:
+			entity_integer = None
+			for site_id, title in title_per_site_id.items():
+				if site_ids is not None and site_id not in site_ids:
+					continue
+				if entity_integer is None:
+					entity_integer = convert_entity_id_to_integer(entity_id=entity_id)
+				hash_high, hash_low = WikiDataSitelinkIndex.get_sitelink_hash(
+					site_id=site_id,
+					title=title
+				)
+				hash_highs.append(hash_high)
+				hash_lows.append(hash_low)
+				entity_integers.append(entity_integer)
+				entity_json_indexes.append(entity_json_index)
+
+		slots_total = int(len(entity_integers) / load_factor) + 1
+		slot_hash_highs = array("q", bytes(slots_total * 8))
+		slot_hash_lows = array("q", bytes(slots_total * 8))
+		slot_entity_integers = array("q", [-1]) * slots_total
+		slot_entity_json_indexes = array("q", bytes(slots_total * 8))
+		for hash_high, hash_low, entity_integer, entity_json_index in zip(hash_highs, hash_lows, entity_integers, entity_json_indexes):
+			slot_index = hash_low % slots_total
+			while slot_entity_integers[slot_index] != -1:
+				slot_index = (slot_index + 1) % slots_total
+			slot_hash_highs[slot_index] = hash_high
+			slot_hash_lows[slot_index] = hash_low
+			slot_entity_integers[slot_index] = entity_integer
+			slot_entity_json_indexes[slot_index] = entity_json_index
+		return WikiDataSitelinkIndex(
+			slot_hash_highs=slot_hash_highs,
+			slot_hash_lows=slot_hash_lows,
+			slot_entity_integers=slot_entity_integers,
+			slot_entity_json_indexes=slot_entity_json_indexes
+		)
+
+
+class WikiDataIndexManifest():
+
+	def __init__(self, *, manifest_file_path: str):
+		self.__manifest_file_path = manifest_file_path
+
+	def get_manifest_file_path(self) -> str:
+		return self.__manifest_file_path
+
+	def __get_change_total(self, *, change_name: str) -> int:
+		connection = sqlite3.connect(self.__manifest_file_path)
+		try:
+			return connection.execute("SELECT total FROM change_total WHERE change_name = ?", (change_name,)).fetchone()[0]
+		finally:
+			connection.close()
+
+	def get_added_entities_total(self) -> int:
+		return self.__get_change_total(change_name="added")
+
+	def get_removed_entities_total(self) -> int:
+		return self.__get_change_total(change_name="removed")
+
+	def get_changed_entities_total(self) -> int:
+		return self.__get_change_total(change_name="changed")
+
+	def get_unchanged_entities_total(self) -> int:
+		return self.__get_change_total(change_name="unchanged")
+
+	def get_payload_iterator(self) -> Iterator[Tuple[int, str, Dict]]:
+		connection = sqlite3.connect(self.__manifest_file_path)
+		try:
+			for entity_json_index, entity_id, payload_json in connection.execute("SELECT entity_json_index, entity_id, payload FROM entity ORDER BY entity_json_index"):
+				yield entity_json_index, entity_id, json.loads(payload_json)
+		finally:
+			connection.close()
+
+	@staticmethod
+	def get_fingerprint(*, record: bytes) -> bytes:
+		return hashlib.blake2b(record, digest_size=16).digest()
+
+	@staticmethod
+	def get_payload(*, entity_json: Dict) -> Dict:
+		# everything the derived indexes need from an entity, so that they can be rebuilt without decoding the dump again
+		return {
+			"item_value_ids_per_property_id": {
+				property_id: WikiDataHierarchyIndex.get_item_value_ids(entity_json=entity_json, property_id=property_id) for property_id in ["P31", "P279"]
+			},
+			"title_per_site_id": {
+				site_id: sitelink_json["title"] for site_id, sitelink_json in entity_json.get("sitelinks", {}).items()
+			}
+		}
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, manifest_file_path: str, previous_index_manifest: Optional[WikiDataIndexManifest] = None, batch_size: int = 10000) -> WikiDataIndexManifest:
+		# records whose raw line is unchanged since the previous manifest carry their payload forward without being decoded
+		temporary_file_descriptor, temporary_manifest_file_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(manifest_file_path)), suffix=".tmp")
+		os.close(temporary_file_descriptor)
+		try:
+			connection = sqlite3.connect(temporary_manifest_file_path)
+			try:
+				connection.execute("CREATE TABLE entity (entity_json_index INTEGER PRIMARY KEY, entity_id TEXT NOT NULL, fingerprint BLOB NOT NULL, payload TEXT NOT NULL)")
+				connection.execute("CREATE TABLE change_total (change_name TEXT PRIMARY KEY, total INTEGER NOT NULL)")
+				if previous_index_manifest is not None:
+					connection.execute("ATTACH DATABASE ? AS previous", (previous_index_manifest.get_manifest_file_path(),))
+				change_total_per_change_name = {
+					"added": 0,
+					"removed": 0,
+					"changed": 0,
+					"unchanged": 0
+				}
+				rows = []  # type: List[Tuple[int, str, bytes, str]]
+				with connection:
+					for entity_json_index, record in enumerate(wiki_data_parser.get_raw_record_iterator()):
+						fingerprint = WikiDataIndexManifest.get_fingerprint(
+							record=record
+						)
+						previous_row = None
+						if previous_index_manifest is not None:
+							previous_row = connection.execute("SELECT entity_id, payload FROM previous.entity WHERE fingerprint = ?", (fingerprint,)).fetchone()
+						if previous_row is not None:
+							entity_id, payload_json = previous_row
+							change_total_per_change_name["unchanged"] += 1
+						else:
+							entity_json = json.loads(record, parse_float=decimal.Decimal)
+							entity_id = entity_json["id"]
+							payload_json = json.dumps(WikiDataIndexManifest.get_payload(
+								entity_json=entity_json
+							))
+							if previous_index_manifest is not None and connection.execute("SELECT 1 FROM previous.entity WHERE entity_id = ?", (entity_id,)).fetchone() is not None:
+								change_total_per_change_name["changed"] += 1
+							else:
+								change_total_per_change_name["added"] += 1
+						rows.append((entity_json_index, entity_id, fingerprint, payload_json))
+						if len(rows) >= batch_size:
+							connection.executemany("INSERT INTO entity (entity_json_index, entity_id, fingerprint, payload) VALUES (?, ?, ?, ?)", rows)
+							rows.clear()
+					connection.executemany("INSERT INTO entity (entity_json_index, entity_id, fingerprint, payload) VALUES (?, ?, ?, ?)", rows)
+					rows.clear()
+
+					# the lookup indexes are created after loading, since maintaining them per insert is slower
+					connection.execute("CREATE INDEX entity_fingerprint_index ON entity (fingerprint)")
+					connection.execute("CREATE INDEX entity_entity_id_index ON entity (entity_id)")
+					if previous_index_manifest is not None:
+						change_total_per_change_name["removed"] = connection.execute("SELECT COUNT(*) FROM previous.entity WHERE NOT EXISTS (SELECT 1 FROM main.entity WHERE main.entity.entity_id = previous.entity.entity_id)").fetchone()[0]
+					connection.executemany("INSERT INTO change_total (change_name, total) VALUES (?, ?)", change_total_per_change_name.items())
+			finally:
+				connection.close()
+			os.replace(temporary_manifest_file_path, manifest_file_path)
+		except BaseException:
+			if os.path.exists(temporary_manifest_file_path):
+				os.remove(temporary_manifest_file_path)
+			raise
+		return WikiDataIndexManifest(
+			manifest_file_path=manifest_file_path
+		)
+
+
+class EntityDiffTypeEnum(StringEnum):
+	Added = "added"
+	Removed = "removed"
+	Changed = "changed"
+
+
+class EntityDiff():
+
+	def __init__(self, *, entity_diff_type: EntityDiffTypeEnum, entity_id: str, previous_entity: Optional[Entity], entity: Optional[Entity], removed_claim_jsons_per_property_id: Dict[str, List[Dict]], added_claim_jsons_per_property_id: Dict[str, List[Dict]]):
+		self.__entity_diff_type = entity_diff_type
+		self.__entity_id = entity_id
+		self.__previous_entity = previous_entity
+		self.__entity = entity
+		self.__removed_claim_jsons_per_property_id = removed_claim_jsons_per_property_id
+		self.__added_claim_jsons_per_property_id = added_claim_jsons_per_property_id
+
+	def get_entity_diff_type(self) -> EntityDiffTypeEnum:
+		return self.__entity_diff_type
+
+	def get_entity_id(self) -> str:
+		return self.__entity_id
+
+	def get_previous_entity(self) -> Optional[Entity]:
+		return self.__previous_entity
+
+	def get_entity(self) -> Optional[Entity]:
+		return self.__entity
+
+	def get_removed_claim_jsons_per_property_id(self) -> Dict[str, List[Dict]]:
+		return self.__removed_claim_jsons_per_property_id
+
+	def get_added_claim_jsons_per_property_id(self) -> Dict[str, List[Dict]]:
+		return self.__added_claim_jsons_per_property_id
+
+	def get_changed_property_ids(self) -> List[str]:
+		return sorted(set(self.__removed_claim_jsons_per_property_id.keys()) | set(self.__added_claim_jsons_per_property_id.keys()))
+
+
+class WikiDataDumpDiff():
+
+	def __init__(self, *, previous_wiki_data_parser: WikiDataParser, wiki_data_parser: WikiDataParser, maximum_records_in_memory: int = 100000, temporary_directory_path: Optional[str] = None, are_dumps_id_ordered: bool = False):
+		self.__previous_wiki_data_parser = previous_wiki_data_parser
+		self.__wiki_data_parser = wiki_data_parser
+		self.__maximum_records_in_memory = maximum_records_in_memory
+		self.__temporary_directory_path = temporary_directory_path
+		self.__are_dumps_id_ordered = are_dumps_id_ordered
+
+	@staticmethod
+	def get_record_entity_id(*, record: bytes) -> str:
+		# the top level id precedes the claims in every dump record, and any "id" key within the claims belongs to a statement
+		id_index = record.find(b'"id":"')
+		if id_index != -1:
+			claims_index = record.find(b'"claims":')
+			if claims_index == -1 or id_index < claims_index:
+				id_start_index = id_index + 6
+				return record[id_start_index:record.index(b'"', id_start_index)].decode()
+		return json.loads(record, parse_float=decimal.Decimal)["id"]
+
+	def __get_sorted_record_iterator(self, *, wiki_data_parser: WikiDataParser) -> Iterator[Tuple[int, bytes]]:
+		if self.__are_dumps_id_ordered:
+			previous_entity_integer = None
+			for record in wiki_data_parser.get_raw_record_iterator():
+				entity_integer = convert_entity_id_to_integer(entity_id=WikiDataDumpDiff.get_record_entity_id(record=record))
+				if previous_entity_integer is not None and entity_integer <= previous_entity_integer:
+					raise Exception(f"Dump is not ordered by entity id at {convert_integer_to_entity_id(integer=entity_integer)}: {wiki_data_parser.get_json_file_path()}")
+				previous_entity_integer = entity_integer
+				yield entity_integer, record
+		else:
+			external_sorter = ExternalSorter(
+				maximum_items_in_memory=self.__maximum_records_in_memory,
+				temporary_directory_path=self.__temporary_directory_path,
+				key=lambda pair: pair[0]
+			)
+			try:
+				for record in wiki_data_parser.get_raw_record_iterator():
+					external_sorter.add(item=(convert_entity_id_to_integer(entity_id=WikiDataDumpDiff.get_record_entity_id(record=record)), record))
+				yield from external_sorter.get_sorted_iterator()
+			finally:
+				external_sorter.dispose()
+
+	@staticmethod
+	def __get_claim_json_string_per_claim_json_string_per_property_id(*, entity_json: Dict) -> Dict[str, Dict[str, Dict]]:
+		return {
+			property_id: {
+				json.dumps(claim_json, sort_keys=True, default=str): claim_json for claim_json in claim_jsons
+			} for property_id, claim_jsons in entity_json.get("claims", {}).items()
+		}
+
+	def get_entity_diff_iterator(self, *, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None) -> Iterator[EntityDiff]:
+		# both dumps are merge-joined on the entity id, and identical raw records are skipped without being decoded
+		language_code = language.get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in additional_languages or []]
+
+		def get_entity(entity_json: Dict) -> Entity:
+			return Entity.parse_json(
+				json_dict=entity_json,
+				language_code=language_code,
+				additional_language_codes=additional_language_codes
+			)
+
+		previous_record_iterator = self.__get_sorted_record_iterator(
+			wiki_data_parser=self.__previous_wiki_data_parser
+		)
+		record_iterator = self.__get_sorted_record_iterator(
+			wiki_data_parser=self.__wiki_data_parser
+		)
+		try:
+			previous_pair = next(previous_record_iterator, None)
+			pair = next(record_iterator, None)
+			while previous_pair is not None or pair is not None:
+				if pair is None or (previous_pair is not None and previous_pair[0] < pair[0]):
+					previous_entity_json = json.loads(previous_pair[1], parse_float=decimal.Decimal)
+					yield EntityDiff(
+						entity_diff_type=EntityDiffTypeEnum.Removed,
+						entity_id=previous_entity_json["id"],
+						previous_entity=get_entity(previous_entity_json),
+						entity=None,
+						removed_claim_jsons_per_property_id={property_id: claim_jsons for property_id, claim_jsons in previous_entity_json.get("claims", {}).items() if claim_jsons},
+						added_claim_jsons_per_property_id={}
+					)
+					previous_pair = next(previous_record_iterator, None)
+				elif previous_pair is None or pair[0] < previous_pair[0]:
+					entity_json = json.loads(pair[1], parse_float=decimal.Decimal)
+					yield EntityDiff(
+						entity_diff_type=EntityDiffTypeEnum.Added,
+						entity_id=entity_json["id"],
+						previous_entity=None,
+						entity=get_entity(entity_json),
+						removed_claim_jsons_per_property_id={},
+						added_claim_jsons_per_property_id={property_id: claim_jsons for property_id, claim_jsons in entity_json.get("claims", {}).items() if claim_jsons}
+					)
+					pair = next(record_iterator, None)
+				else:
+					if previous_pair[1] != pair[1]:
+						previous_entity_json = json.loads(previous_pair[1], parse_float=decimal.Decimal)
+						entity_json = json.loads(pair[1], parse_float=decimal.Decimal)
+						previous_claim_json_per_claim_json_string_per_property_id = WikiDataDumpDiff.__get_claim_json_string_per_claim_json_string_per_property_id(
+							entity_json=previous_entity_json
+						)
+						claim_json_per_claim_json_string_per_property_id = WikiDataDumpDiff.__get_claim_json_string_per_claim_json_string_per_property_id(
+							entity_json=entity_json
+						)
+						removed_claim_jsons_per_property_id = {}  # type: Dict[str, List[Dict]]
+						added_claim_jsons_per_property_id = {}  # type: Dict[str, List[Dict]]
+						for property_id in set(previous_claim_json_per_claim_json_string_per_property_id.keys()) | set(claim_json_per_claim_json_string_per_property_id.keys()):
+							previous_claim_json_per_claim_json_string = previous_claim_json_per_claim_json_string_per_property_id.get(property_id, {})
+							claim_json_per_claim_json_string = claim_json_per_claim_json_string_per_property_id.get(property_id, {})
+							removed_claim_jsons = [claim_json for claim_json_string, claim_json in previous_claim_json_per_claim_json_string.items() if claim_json_string not in claim_json_per_claim_json_string]
+							added_claim_jsons = [claim_json for claim_json_string, claim_json in claim_json_per_claim_json_string.items() if claim_json_string not in previous_claim_json_per_claim_json_string]
+							if removed_claim_jsons:
+								removed_claim_jsons_per_property_id[property_id] = removed_claim_jsons
+							if added_claim_jsons:
+								added_claim_jsons_per_property_id[property_id] = added_claim_jsons
+						# records that only differ in their serialization, such as the key order, decode to the same json
+						if previous_entity_json != entity_json:
+							yield EntityDiff(
+								entity_diff_type=EntityDiffTypeEnum.Changed,
+								entity_id=entity_json["id"],
+								previous_entity=get_entity(previous_entity_json),
+								entity=get_entity(entity_json),
+								removed_claim_jsons_per_property_id=removed_claim_jsons_per_property_id,
+								added_claim_jsons_per_property_id=added_claim_jsons_per_property_id
+							)
+					previous_pair = next(previous_record_iterator, None)
+					pair = next(record_iterator, None)
+		finally:
+			previous_record_iterator.close()
+			record_iterator.close()
+
+
+class WikiDataOffsetIndex():
+
+	def __init__(self, *, sorted_entity_integers: Sequence[int], offsets: Sequence[int], entity_json_indexes: Sequence[int], file_size: int):
+		self.__sorted_entity_integers = sorted_entity_integers
+		self.__offsets = offsets
+		self.__entity_json_indexes = entity_json_indexes
+		self.__file_size = file_size
+
+	def get_entities_total(self) -> int:
+		return len(self.__sorted_entity_integers)
+
+	def get_file_size(self) -> int:
+		return self.__file_size
+
+	def get_entity_json_index_and_offset(self, *, entity_id: str) -> Optional[Tuple[int, int]]:
+		entity_integer = convert_entity_id_to_integer(entity_id=entity_id)
+		entity_index = bisect.bisect_left(self.__sorted_entity_integers, entity_integer)
+		if entity_index == len(self.__sorted_entity_integers) or self.__sorted_entity_integers[entity_index] != entity_integer:
+			return None
+		return self.__entity_json_indexes[entity_index], self.__offsets[entity_index]
+
+	def save(self, *, index_file_path: str):
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays={
+				"sorted_entity_integers": array("q", self.__sorted_entity_integers),
+				"offsets": array("q", self.__offsets),
+				"entity_json_indexes": array("q", self.__entity_json_indexes),
+				"file_size": array("q", [self.__file_size])
+			}
+		)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataOffsetIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		return WikiDataOffsetIndex(
+			sorted_entity_integers=integer_arrays["sorted_entity_integers"],
+			offsets=integer_arrays["offsets"],
+			entity_json_indexes=integer_arrays["entity_json_indexes"],
+			file_size=integer_arrays["file_size"][0]
+		)
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, maximum_entities_in_memory: int = 10000000, temporary_directory_path: Optional[str] = None) -> WikiDataOffsetIndex:
+		# offsets are only meaningful within an uncompressed dump, which is read through the memory-mapped record reader
+		if not wiki_data_parser.get_json_file_path().endswith(".json"):
+			raise NotImplementedError(f"Unable to index offsets of compressed file: {wiki_data_parser.get_json_file_path()}")
+		external_sorter = ExternalSorter(
+			maximum_items_in_memory=maximum_entities_in_memory,
+			temporary_directory_path=temporary_directory_path
+		)
+		try:
+			for entity_json_index, (memory_map, record_start_index, record_end_index) in enumerate(wiki_data_parser.get_memory_mapped_record_iterator()):
+				external_sorter.add(item=(
+					convert_entity_id_to_integer(entity_id=WikiDataDumpDiff.get_record_entity_id(record=memory_map[record_start_index:record_end_index])),
+					record_start_index,
+					entity_json_index
+				))
+			sorted_entity_integers = array("q")
+			offsets = array("q")
+			entity_json_indexes = array("q")
+			for entity_integer, offset, entity_json_index in external_sorter.get_sorted_iterator():
+				sorted_entity_integers.append(entity_integer)
+				offsets.append(offset)
+				entity_json_indexes.append(entity_json_index)
+		finally:
+			external_sorter.dispose()
+		return WikiDataOffsetIndex(
+			sorted_entity_integers=sorted_entity_integers,
+			offsets=offsets,
+			entity_json_indexes=entity_json_indexes,
+			file_size=os.path.getsize(wiki_data_parser.get_json_file_path())
+		)
+
+
+class QueryPlanTypeEnum(StringEnum):
+	FullScan = "full_scan"
+	IndexLookup = "index_lookup"
+	IndexIntersection = "index_intersection"
+	RangeScan = "range_scan"
+	DatabaseQuery = "database_query"
+
+
+class QueryPlan():
+
+	def __init__(self, *, query_plan_type: QueryPlanTypeEnum, index_names: List[str], estimated_rows_examined_total: Optional[int], estimated_cost: Optional[float]):
+		self.__query_plan_type = query_plan_type
+		self.__index_names = index_names
+		self.__estimated_rows_examined_total = estimated_rows_examined_total
+		self.__estimated_cost = estimated_cost
+
+	def __str__(self):
+		return f"{self.__query_plan_type.value}{' using ' + ', '.join(self.__index_names) if self.__index_names else ''}: estimated {'unknown' if self.__estimated_rows_examined_total is None else self.__estimated_rows_examined_total} rows examined at cost {'unknown' if self.__estimated_cost is None else self.__estimated_cost}."
+
+	def get_query_plan_type(self) -> QueryPlanTypeEnum:
+		return self.__query_plan_type
+
+	def get_index_names(self) -> List[str]:
+		return self.__index_names
+
+	def get_estimated_rows_examined_total(self) -> Optional[int]:
+		return self.__estimated_rows_examined_total
+
+	def get_estimated_cost(self) -> Optional[float]:
+		return self.__estimated_cost
+
+
+class QueryPlanExplanation():
+
+	def __init__(self, *, query_plan: QueryPlan, actual_rows_examined_total: int, actual_rows_returned_total: int, elapsed_seconds: float):
+		self.__query_plan = query_plan
+		self.__actual_rows_examined_total = actual_rows_examined_total
+		self.__actual_rows_returned_total = actual_rows_returned_total
+		self.__elapsed_seconds = elapsed_seconds
+
+	def __str__(self):
+		return f"{self.__query_plan} Actually examined {self.__actual_rows_examined_total} rows and returned {self.__actual_rows_returned_total} in {self.__elapsed_seconds:.6f} seconds."
+
+	def get_query_plan(self) -> QueryPlan:
+		return self.__query_plan
+
+	def get_actual_rows_examined_total(self) -> int:
+		return self.__actual_rows_examined_total
+
+	def get_actual_rows_returned_total(self) -> int:
+		return self.__actual_rows_returned_total
+
+	def get_elapsed_seconds(self) -> float:
+		return self.__elapsed_seconds
+
+
+class ApproximateEstimate():
+
+	def __init__(self, *, records_sampled_total: int, matches_total: int, records_total: Optional[int], fraction: float, margin_of_error: float, confidence: float, is_exact: bool):
+		self.__records_sampled_total = records_sampled_total
+		self.__matches_total = matches_total
+		self.__records_total = records_total
+		self.__fraction = fraction
+		self.__margin_of_error = margin_of_error
+		self.__confidence = confidence
+		self.__is_exact = is_exact
+
+	def __str__(self):
+		minimum_fraction, maximum_fraction = self.get_fraction_interval()
+		return f"{self.__fraction:.6f} ({minimum_fraction:.6f} to {maximum_fraction:.6f} at {self.__confidence:.0%} confidence) from {self.__matches_total} matches in {self.__records_sampled_total} sampled records{'' if self.__records_total is None else f' of {self.__records_total}'}."
+
+	def get_records_sampled_total(self) -> int:
+		return self.__records_sampled_total
+
+	def get_matches_total(self) -> int:
+		return self.__matches_total
+
+	def get_records_total(self) -> Optional[int]:
+		return self.__records_total
+
+	def get_fraction(self) -> float:
+		return self.__fraction
+
+	def get_margin_of_error(self) -> float:
+		return self.__margin_of_error
+
+	def get_confidence(self) -> float:
+		return self.__confidence
+
+	def is_exact(self) -> bool:
+		return self.__is_exact
+
+	def get_fraction_interval(self) -> Tuple[float, float]:
+		return max(0.0, self.__fraction - self.__margin_of_error), min(1.0, self.__fraction + self.__margin_of_error)
+
+	def get_estimated_matches_total(self) -> Optional[float]:
+		if self.__records_total is None:
+			return None
+		return self.__fraction * self.__records_total
+
+	def get_estimated_matches_total_interval(self) -> Optional[Tuple[float, float]]:
+		if self.__records_total is None:
+			return None
+		minimum_fraction, maximum_fraction = self.get_fraction_interval()
+		return minimum_fraction * self.__records_total, maximum_fraction * self.__records_total
+
+
+class WikiDataQueryPlanner():
+
+	def __init__(self, *, offset_index: Optional[WikiDataOffsetIndex], hierarchy_index: Optional[WikiDataHierarchyIndex], sitelink_index: Optional[WikiDataSitelinkIndex], sparse_id_index: Optional[WikiDataSparseIdIndex] = None, sqlite_database: Optional[WikiDataSqliteDatabase] = None, scan_cost_per_row: float = 1.0, lookup_cost_per_row: float = 4.0, candidate_cost_per_row: float = 0.05):
+		self.__offset_index = offset_index
+		self.__sqlite_database = sqlite_database
+		self.__sparse_id_index = sparse_id_index
+		self.__hierarchy_index = hierarchy_index
+		self.__sitelink_index = sitelink_index
+		self.__scan_cost_per_row = scan_cost_per_row
+		self.__lookup_cost_per_row = lookup_cost_per_row
+		self.__candidate_cost_per_row = candidate_cost_per_row
+
+	def __get_estimated_candidates_total_per_index_name(self, *, search_criteria: SearchCriteria) -> Dict[str, int]:
+		# every index lookup resolves entity ids that are then located through the offset index
+		estimated_candidates_total_per_index_name = {}  # type: Dict[str, int]
+		if self.__offset_index is None:
+			return estimated_candidates_total_per_index_name
+		if search_criteria.get_id() is not None:
+			estimated_candidates_total_per_index_name["offset"] = 1
+		if self.__sitelink_index is not None and search_criteria.get_sitelink_site_id() is not None:
+			estimated_candidates_total_per_index_name["sitelink"] = 1
+		if self.__hierarchy_index is not None and search_criteria.get_instance_of_ids() is not None:
+			estimated_candidates_total_per_index_name["hierarchy"] = sum(self.__hierarchy_index.get_maximum_instances_total(
+				class_id=instance_of_id,
+				is_transitive=search_criteria.is_instance_of_transitive()
+			) for instance_of_id in search_criteria.get_instance_of_ids())
+		return estimated_candidates_total_per_index_name
+
+	def get_query_plan(self, *, search_criteria: SearchCriteria) -> QueryPlan:
+		# a materialized database answers every query without reading the dump, so it is always preferred
+		if self.__sqlite_database is not None:
+			return QueryPlan(
+				query_plan_type=QueryPlanTypeEnum.DatabaseQuery,
+				index_names=["sqlite"],
+				estimated_rows_examined_total=None,
+				estimated_cost=None
+			)
+		if self.__offset_index is not None:
+			entities_total = self.__offset_index.get_entities_total()
+		elif self.__sparse_id_index is not None:
+			entities_total = self.__sparse_id_index.get_records_total()
+		else:
+			return QueryPlan(
+				query_plan_type=QueryPlanTypeEnum.FullScan,
+				index_names=[],
+				estimated_rows_examined_total=None,
+				estimated_cost=None
+			)
+
+		query_plans = [QueryPlan(
+			query_plan_type=QueryPlanTypeEnum.FullScan,
+			index_names=[],
+			estimated_rows_examined_total=entities_total,
+			estimated_cost=entities_total * self.__scan_cost_per_row
+		)]
+		if self.__sparse_id_index is not None and search_criteria.get_entity_integer_range() is not None:
+			# the blocks are read sequentially, so their records cost as much as a scan of the same records
+			estimated_rows_examined_total = sum(records_total for _, records_total, _, _ in self.get_block_locations(
+				search_criteria=search_criteria
+			))
+			query_plans.append(QueryPlan(
+				query_plan_type=QueryPlanTypeEnum.RangeScan,
+				index_names=["sparse_id"],
+				estimated_rows_examined_total=estimated_rows_examined_total,
+				estimated_cost=estimated_rows_examined_total * self.__scan_cost_per_row
+			))
+		estimated_candidates_total_per_index_name = self.__get_estimated_candidates_total_per_index_name(
+			search_criteria=search_criteria
+		)
+		for index_name, estimated_candidates_total in estimated_candidates_total_per_index_name.items():
+			query_plans.append(QueryPlan(
+				query_plan_type=QueryPlanTypeEnum.IndexLookup,
+				index_names=[index_name],
+				estimated_rows_examined_total=estimated_candidates_total,
+				estimated_cost=estimated_candidates_total * (self.__candidate_cost_per_row + self.__lookup_cost_per_row)
+			))
+		if len(estimated_candidates_total_per_index_name) > 1:
+			# the predicates are assumed to be independent when estimating the size of the intersection
+			estimated_intersection_total = entities_total
+			for estimated_candidates_total in estimated_candidates_total_per_index_name.values():
+				estimated_intersection_total *= min(1.0, estimated_candidates_total / max(1, entities_total))
+			estimated_intersection_total = math.ceil(estimated_intersection_total)
+			query_plans.append(QueryPlan(
+				query_plan_type=QueryPlanTypeEnum.IndexIntersection,
+				index_names=sorted(estimated_candidates_total_per_index_name.keys()),
+				estimated_rows_examined_total=estimated_intersection_total,
+				estimated_cost=sum(estimated_candidates_total_per_index_name.values()) * self.__candidate_cost_per_row + estimated_intersection_total * self.__lookup_cost_per_row
+			))
+		return min(query_plans, key=lambda query_plan: query_plan.get_estimated_cost())
+
+	def __get_candidate_entity_ids(self, *, search_criteria: SearchCriteria, index_name: str) -> Set[str]:
+		if index_name == "offset":
+			return {search_criteria.get_id()}
+		if index_name == "sitelink":
+			entity_id = self.__sitelink_index.get_entity_id(
+				site_id=search_criteria.get_sitelink_site_id(),
+				title=search_criteria.get_sitelink_title()
+			)
+			return set() if entity_id is None else {entity_id}
+		if index_name == "hierarchy":
+			candidate_entity_ids = set()  # type: Set[str]
+			for instance_of_id in search_criteria.get_instance_of_ids():
+				candidate_entity_ids.update(self.__hierarchy_index.get_instance_ids(
+					class_id=instance_of_id,
+					is_transitive=search_criteria.is_instance_of_transitive()
+				))
+			return candidate_entity_ids
+		raise NotImplementedError(f"Unexpected index name: {index_name}")
+
+	def get_block_locations(self, *, search_criteria: SearchCriteria) -> List[Tuple[int, int, int, int]]:
+		minimum_entity_integer, maximum_entity_integer = search_criteria.get_entity_integer_range()
+		return self.__sparse_id_index.get_block_locations(
+			minimum_entity_integer=minimum_entity_integer,
+			maximum_entity_integer=maximum_entity_integer
+		)
+
+	def get_record_locations(self, *, search_criteria: SearchCriteria, query_plan: QueryPlan) -> List[Tuple[int, int]]:
+		# candidates are returned as (entity json index, offset) pairs in dump order
+		candidate_entity_ids = None  # type: Optional[Set[str]]
+		for index_name in query_plan.get_index_names():
+			index_candidate_entity_ids = self.__get_candidate_entity_ids(
+				search_criteria=search_criteria,
+				index_name=index_name
+			)
+			candidate_entity_ids = index_candidate_entity_ids if candidate_entity_ids is None else candidate_entity_ids & index_candidate_entity_ids
+		record_locations = []  # type: List[Tuple[int, int]]
+		for candidate_entity_id in candidate_entity_ids or ():
+			record_location = self.__offset_index.get_entity_json_index_and_offset(
+				entity_id=candidate_entity_id
+			)
+			if record_location is not None:
+				record_locations.append(record_location)
+		record_locations.sort()
+		return record_locations
+
+
+class WikiDataSparseIdIndex():
+
+	def __init__(self, *, block_offsets: Sequence[int], block_records_totals: Sequence[int], block_minimum_entity_integers: Sequence[int], block_maximum_entity_integers: Sequence[int], file_size: int):
+		self.__block_offsets = block_offsets
+		self.__block_records_totals = block_records_totals
+		self.__block_minimum_entity_integers = block_minimum_entity_integers
+		self.__block_maximum_entity_integers = block_maximum_entity_integers
+		self.__file_size = file_size
+
+	def get_blocks_total(self) -> int:
+		return len(self.__block_offsets)
+
+	def get_records_total(self) -> int:
+		return sum(self.__block_records_totals)
+
+	def get_file_size(self) -> int:
+		return self.__file_size
+
+	def get_block_locations(self, *, minimum_entity_integer: int, maximum_entity_integer: int) -> List[Tuple[int, int, int, int]]:
+		# every block whose id bounds overlap the range, as (offset, records total, minimum entity integer, maximum entity integer) in dump order
+		# the bounds are kept per block rather than assuming the dump is sorted, so a mostly sorted dump only reads the few blocks that are out of place
+		block_locations = []  # type: List[Tuple[int, int, int, int]]
+		for block_index in range(len(self.__block_offsets)):
+			block_minimum_entity_integer = self.__block_minimum_entity_integers[block_index]
+			block_maximum_entity_integer = self.__block_maximum_entity_integers[block_index]
+			if block_minimum_entity_integer <= maximum_entity_integer and block_maximum_entity_integer >= minimum_entity_integer:
+				block_locations.append((self.__block_offsets[block_index], self.__block_records_totals[block_index], block_minimum_entity_integer, block_maximum_entity_integer))
+		return block_locations
+
+	def save(self, *, index_file_path: str):
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays={
+				"block_offsets": array("q", self.__block_offsets),
+				"block_records_totals": array("q", self.__block_records_totals),
+				"block_minimum_entity_integers": array("q", self.__block_minimum_entity_integers),
+				"block_maximum_entity_integers": array("q", self.__block_maximum_entity_integers),
+				"file_size": array("q", [self.__file_size])
+			}
+		)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataSparseIdIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		return WikiDataSparseIdIndex(
+			block_offsets=integer_arrays["block_offsets"],
+			block_records_totals=integer_arrays["block_records_totals"],
+			block_minimum_entity_integers=integer_arrays["block_minimum_entity_integers"],
+			block_maximum_entity_integers=integer_arrays["block_maximum_entity_integers"],
+			file_size=integer_arrays["file_size"][0]
+		)
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, records_per_block: int = 1000) -> WikiDataSparseIdIndex:
+		if not wiki_data_parser.get_json_file_path().endswith(".json"):
+			raise NotImplementedError(f"Unable to index offsets of compressed file: {wiki_data_parser.get_json_file_path()}")
+		block_offsets = array("q")
+		block_records_totals = array("q")
+		block_minimum_entity_integers = array("q")
+		block_maximum_entity_integers = array("q")
+		for entity_json_index, (memory_map, record_start_index, record_end_index) in enumerate(wiki_data_parser.get_memory_mapped_record_iterator()):
+			entity_integer = convert_entity_id_to_integer(entity_id=WikiDataDumpDiff.get_record_entity_id(record=memory_map[record_start_index:record_end_index]))
+			if entity_json_index % records_per_block == 0:
+				block_offsets.append(record_start_index)
+				block_records_totals.append(1)
+				block_minimum_entity_integers.append(entity_integer)
+				block_maximum_entity_integers.append(entity_integer)
+			else:
+				block_records_totals[-1] += 1
+				if entity_integer < block_minimum_entity_integers[-1]:
+					block_minimum_entity_integers[-1] = entity_integer
+				if entity_integer > block_maximum_entity_integers[-1]:
+					block_maximum_entity_integers[-1] = entity_integer
+		return WikiDataSparseIdIndex(
+			block_offsets=block_offsets,
+			block_records_totals=block_records_totals,
+			block_minimum_entity_integers=block_minimum_entity_integers,
+			block_maximum_entity_integers=block_maximum_entity_integers,
+			file_size=os.path.getsize(wiki_data_parser.get_json_file_path())
+		)
+
+
+class ZStream(ctypes.Structure):
+	_fields_ = [
+		("next_in", ctypes.c_void_p),
+		("avail_in", ctypes.c_uint),
+		("total_in", ctypes.c_ulong),
+		("next_out", ctypes.c_void_p),
+		("avail_out", ctypes.c_uint),
+		("total_out", ctypes.c_ulong),
+		("msg", ctypes.c_char_p),
+		("state", ctypes.c_void_p),
+		("zalloc", ctypes.c_void_p),
+		("zfree", ctypes.c_void_p),
+		("opaque", ctypes.c_void_p),
+		("data_type", ctypes.c_int),
+		("adler", ctypes.c_ulong),
+		("reserved", ctypes.c_ulong)
+	]
+
+
+class ZlibInflater():
+
+	__library = None
+
+	# zlib return codes and flush values
+	__z_ok = 0
+	__z_stream_end = 1
+	__z_buf_error = -5
+	__z_no_flush = 0
+	__z_block = 5
+
+	def __init__(self, *, window_bits: int):
+		self.__library = ZlibInflater.get_library()
+		self.__z_stream = ZStream()
+		self.__input_buffer = None
+		if self.__library.inflateInit2_(ctypes.byref(self.__z_stream), window_bits, self.__library.zlibVersion(), ctypes.sizeof(ZStream)) != ZlibInflater.__z_ok:
+			raise Exception("Unable to initialize zlib inflate.")
+
+	@classmethod
+	def get_library(cls):
+		# the python zlib module does not expose inflatePrime or the block boundaries, so the shared library is called directly
+		if cls.__library is None:
+			library_path = ctypes.util.find_library("z")
+			if library_path is None:
+				raise NotImplementedError("Unable to find the zlib shared library.")
+			library = ctypes.CDLL(library_path)
+			library.zlibVersion.restype = ctypes.c_char_p
+			library.inflateInit2_.argtypes = [ctypes.POINTER(ZStream), ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+			library.inflate.argtypes = [ctypes.POINTER(ZStream), ctypes.c_int]
+			library.inflateEnd.argtypes = [ctypes.POINTER(ZStream)]
+			library.inflateReset2.argtypes = [ctypes.POINTER(ZStream), ctypes.c_int]
+			library.inflatePrime.argtypes = [ctypes.POINTER(ZStream), ctypes.c_int, ctypes.c_int]
+			library.inflateSetDictionary.argtypes = [ctypes.POINTER(ZStream), ctypes.c_char_p, ctypes.c_uint]
+			cls.__library = library
+		return cls.__library
+
+	def set_input(self, *, input_bytes: bytes):
+		self.__input_buffer = ctypes.create_string_buffer(input_bytes, len(input_bytes))
+		self.__z_stream.next_in = ctypes.addressof(self.__input_buffer)
+		self.__z_stream.avail_in = len(input_bytes)
+
+	def skip_input(self, *, bytes_total: int) -> int:
+		skipped_bytes_total = min(bytes_total, self.__z_stream.avail_in)
+		self.__z_stream.next_in += skipped_bytes_total
+		self.__z_stream.avail_in -= skipped_bytes_total
+		return skipped_bytes_total
+
+	def get_available_input_total(self) -> int:
+		return self.__z_stream.avail_in
+
+	def get_data_type(self) -> int:
+		return self.__z_stream.data_type
+
+	def prime(self, *, bits: int, value: int):
+		if self.__library.inflatePrime(ctypes.byref(self.__z_stream), bits, value) != ZlibInflater.__z_ok:
+			raise Exception("Unable to prime zlib inflate.")
+
+	def set_dictionary(self, *, dictionary: bytes):
+		if self.__library.inflateSetDictionary(ctypes.byref(self.__z_stream), dictionary, len(dictionary)) != ZlibInflater.__z_ok:
+			raise Exception("Unable to set the zlib inflate dictionary.")
+
+	def reset(self, *, window_bits: int):
+		if self.__library.inflateReset2(ctypes.byref(self.__z_stream), window_bits) != ZlibInflater.__z_ok:
+			raise Exception("Unable to reset zlib inflate.")
+
+	def inflate(self, *, output_buffer, is_stopped_at_block: bool) -> Tuple[bytes, bool]:
+		# returns the inflated bytes and whether the end of the current gzip member or deflate stream was reached
+		self.__z_stream.next_out = ctypes.addressof(output_buffer)
+		self.__z_stream.avail_out = len(output_buffer)
+		return_code = self.__library.inflate(ctypes.byref(self.__z_stream), ZlibInflater.__z_block if is_stopped_at_block else ZlibInflater.__z_no_flush)
+		if return_code not in (ZlibInflater.__z_ok, ZlibInflater.__z_stream_end, ZlibInflater.__z_buf_error):
+			raise Exception(f"Unable to inflate: {self.__z_stream.msg}")
+		return ctypes.string_at(output_buffer, len(output_buffer) - self.__z_stream.avail_out), return_code == ZlibInflater.__z_stream_end
+
+	def dispose(self):
+		if self.__z_stream is not None:
+			self.__library.inflateEnd(ctypes.byref(self.__z_stream))
+			self.__z_stream = None
+
+
+class WikiDataGzipCheckpointIndex():
+
+	__window_size = 32768
+	__chunk_size = 65536
+
+	def __init__(self, *, compressed_offsets: Sequence[int], bits: Sequence[int], uncompressed_offsets: Sequence[int], line_start_offsets: Sequence[int], entity_ordinals: Sequence[int], window_offsets: Sequence[int], compressed_windows: Union[bytes, mmap.mmap], file_size: int):
+		self.__compressed_offsets = compressed_offsets
+		self.__bits = bits
+		self.__uncompressed_offsets = uncompressed_offsets
+		self.__line_start_offsets = line_start_offsets
+		self.__entity_ordinals = entity_ordinals
+		self.__window_offsets = window_offsets
+		self.__compressed_windows = compressed_windows
+		self.__file_size = file_size
+
+	def get_checkpoints_total(self) -> int:
+		return len(self.__compressed_offsets)
+
+	def get_file_size(self) -> int:
+		return self.__file_size
+
+	def get_line_start_offset(self, *, checkpoint_index: int) -> int:
+		return self.__line_start_offsets[checkpoint_index]
+
+	def get_entity_ordinal(self, *, checkpoint_index: int) -> int:
+		return self.__entity_ordinals[checkpoint_index]
+
+	def get_checkpoint_index(self, *, entity_ordinal: int) -> int:
+		# the last checkpoint whose first record is at or before the entity
+		return max(0, bisect.bisect_right(self.__entity_ordinals, entity_ordinal) - 1)
+
+	def __get_window(self, *, checkpoint_index: int) -> bytes:
+		return zlib.decompress(self.__compressed_windows[self.__window_offsets[checkpoint_index]:self.__window_offsets[checkpoint_index + 1]])
+
+	def get_uncompressed_chunk_iterator(self, *, json_file_path: str, checkpoint_index: int) -> Iterator[bytes]:
+		# inflates from the checkpoint, which starts a raw deflate block that may begin part way through a byte
+		zlib_inflater = ZlibInflater(
+			window_bits=-15
+		)
+		try:
+			output_buffer = ctypes.create_string_buffer(WikiDataGzipCheckpointIndex.__chunk_size)
+			bits = self.__bits[checkpoint_index]
+			with open(json_file_path, "rb") as file_handle:
+				file_handle.seek(self.__compressed_offsets[checkpoint_index] - (1 if bits else 0))
+				if bits:
+					zlib_inflater.prime(
+						bits=bits,
+						value=file_handle.read(1)[0] >> (8 - bits)
+					)
+				zlib_inflater.set_dictionary(
+					dictionary=self.__get_window(
+						checkpoint_index=checkpoint_index
+					)
+				)
+				# the gzip trailer that follows the raw deflate stream is skipped, after which any further members are read as gzip, which consumes their own trailers
+				is_raw_deflate = True
+				is_member_ended = False
+				trailer_bytes_total = 0
+				is_file_read = False
+				while True:
+					if zlib_inflater.get_available_input_total() == 0:
+						input_bytes = file_handle.read(WikiDataGzipCheckpointIndex.__chunk_size)
+						if not input_bytes:
+							is_file_read = True
+						else:
+							zlib_inflater.set_input(
+								input_bytes=input_bytes
+							)
+					if is_member_ended:
+						trailer_bytes_total -= zlib_inflater.skip_input(
+							bytes_total=trailer_bytes_total
+						)
+						if trailer_bytes_total or zlib_inflater.get_available_input_total() == 0:
+							if is_file_read:
+								break
+							continue
+						zlib_inflater.reset(
+							window_bits=31
+						)
+						is_member_ended = False
+					uncompressed_bytes, is_stream_end = zlib_inflater.inflate(
+						output_buffer=output_buffer,
+						is_stopped_at_block=False
+					)
+					if uncompressed_bytes:
+						yield uncompressed_bytes
+					if is_stream_end:
+						is_member_ended = True
+						trailer_bytes_total = 8 if is_raw_deflate else 0
+						is_raw_deflate = False
+					elif not uncompressed_bytes and is_file_read:
+						break
+		finally:
+			zlib_inflater.dispose()
+
+	def get_raw_record_iterator(self, *, json_file_path: str, checkpoint_index: int, end_line_start_offset: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+		# yields the ordinal and raw record of every record from the first line of the checkpoint until the line that starts at the end offset
+		line_start_offset = self.__line_start_offsets[checkpoint_index]
+		skipped_bytes_total = line_start_offset - self.__uncompressed_offsets[checkpoint_index]
+		entity_ordinal = self.__entity_ordinals[checkpoint_index]
+		pending_bytes = b""
+		chunk_iterator = self.get_uncompressed_chunk_iterator(
+			json_file_path=json_file_path,
+			checkpoint_index=checkpoint_index
+		)
+		try:
+			for uncompressed_bytes in chunk_iterator:
+				if skipped_bytes_total:
+					# the bytes between the checkpoint and the start of its first line belong to the previous record
+					chunk_skipped_bytes_total = min(len(uncompressed_bytes), skipped_bytes_total)
+					skipped_bytes_total -= chunk_skipped_bytes_total
+					uncompressed_bytes = uncompressed_bytes[chunk_skipped_bytes_total:]
+					if not uncompressed_bytes:
+						continue
+				pending_bytes += uncompressed_bytes
+				line_start_index = 0
+				while True:
+					if end_line_start_offset is not None and line_start_offset >= end_line_start_offset:
+						return
+					line_end_index = pending_bytes.find(b"\n", line_start_index)
+					if line_end_index == -1:
+						break
+					record = pending_bytes[line_start_index:line_end_index].rstrip(b" \t\r,")
+					if record.startswith(b"{"):
+						yield entity_ordinal, record
+						entity_ordinal += 1
+					line_start_offset += line_end_index + 1 - line_start_index
+					line_start_index = line_end_index + 1
+				pending_bytes = pending_bytes[line_start_index:]
+			record = pending_bytes.rstrip(b" \t\r\n,")
+			if record.startswith(b"{") and (end_line_start_offset is None or line_start_offset < end_line_start_offset):
+				yield entity_ordinal, record
+		finally:
+			chunk_iterator.close()
+
+	def save(self, *, index_file_path: str):
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays={
+				"compressed_offsets": array("q", self.__compressed_offsets),
+				"bits": array("q", self.__bits),
+				"uncompressed_offsets": array("q", self.__uncompressed_offsets),
+				"line_start_offsets": array("q", self.__line_start_offsets),
+				"entity_ordinals": array("q", self.__entity_ordinals),
+				"window_offsets": array("q", self.__window_offsets),
+				"file_size": array("q", [self.__file_size])
+			}
+		)
+		with open(f"{index_file_path}.windows", "wb") as file_handle:
+			file_handle.write(self.__compressed_windows)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataGzipCheckpointIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		with open(f"{index_file_path}.windows", "rb") as file_handle:
+			compressed_windows = file_handle.read()
+		return WikiDataGzipCheckpointIndex(
+			compressed_offsets=integer_arrays["compressed_offsets"],
+			bits=integer_arrays["bits"],
+			uncompressed_offsets=integer_arrays["uncompressed_offsets"],
+			line_start_offsets=integer_arrays["line_start_offsets"],
+			entity_ordinals=integer_arrays["entity_ordinals"],
+			window_offsets=integer_arrays["window_offsets"],
+			compressed_windows=compressed_windows,
+			file_size=integer_arrays["file_size"][0]
+		)
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, span_bytes: int = 16777216) -> WikiDataGzipCheckpointIndex:
+		# a checkpoint is taken at the first deflate block boundary after every span of inflated bytes, with the window needed to resume from it
+		# each checkpoint is also tied to the first line that starts after it, so that records can be read from the checkpoint with their ordinals
+		json_file_path = wiki_data_parser.get_json_file_path()
+		if not json_file_path.endswith(".gz"):
+			raise NotImplementedError(f"Unable to index checkpoints of non-gzip file: {json_file_path}")
+
+		compressed_offsets = array("q")
+		bits = array("q")
+		uncompressed_offsets = array("q")
+		line_start_offsets = array("q")
+		entity_ordinals = array("q")
+		window_offsets = array("q", [0])
+		compressed_windows = bytearray()
+		window = bytearray(WikiDataGzipCheckpointIndex.__window_size)
+		unresolved_checkpoints_total = 0
+
+		zlib_inflater = ZlibInflater(
+			window_bits=47
+		)
+		try:
+			output_buffer = ctypes.create_string_buffer(WikiDataGzipCheckpointIndex.__chunk_size)
+			compressed_offset = 0
+			uncompressed_offset = 0
+			last_checkpoint_uncompressed_offset = None  # type: Optional[int]
+			is_line_start_pending = True
+			records_total = 0
+			with open(json_file_path, "rb") as file_handle:
+				is_file_read = False
+				while True:
+					if zlib_inflater.get_available_input_total() == 0 and not is_file_read:
+						input_bytes = file_handle.read(WikiDataGzipCheckpointIndex.__chunk_size)
+						if not input_bytes:
+							is_file_read = True
+						else:
+							zlib_inflater.set_input(
+								input_bytes=input_bytes
+							)
+					available_input_total = zlib_inflater.get_available_input_total()
+					uncompressed_bytes, is_stream_end = zlib_inflater.inflate(
+						output_buffer=output_buffer,
+						is_stopped_at_block=True
+					)
+					compressed_offset += available_input_total - zlib_inflater.get_available_input_total()
+
+					line_start_index = 0
+					while line_start_index < len(uncompressed_bytes):
+						if is_line_start_pending:
+							while unresolved_checkpoints_total:
+								line_start_offsets.append(uncompressed_offset + line_start_index)
+								entity_ordinals.append(records_total)
+								unresolved_checkpoints_total -= 1
+							if uncompressed_bytes[line_start_index] == 0x7b:
+								records_total += 1
+							is_line_start_pending = False
+						line_end_index = uncompressed_bytes.find(b"\n", line_start_index)
+						if line_end_index == -1:
+							break
+						line_start_index = line_end_index + 1
+						is_line_start_pending = True
+					uncompressed_offset += len(uncompressed_bytes)
+					window = (window + uncompressed_bytes)[-WikiDataGzipCheckpointIndex.__window_size:]
+
+					if is_stream_end:
+						# a following gzip member is read after resetting, while anything else after the member ends the file
+						if zlib_inflater.get_available_input_total() == 0:
+							input_bytes = file_handle.read(WikiDataGzipCheckpointIndex.__chunk_size)
+							if not input_bytes:
+								break
+							zlib_inflater.set_input(
+								input_bytes=input_bytes
+							)
+						zlib_inflater.reset(
+							window_bits=31
+						)
+						continue
+
+					data_type = zlib_inflater.get_data_type()
+					if data_type & 128 and not data_type & 64 and (last_checkpoint_uncompressed_offset is None or uncompressed_offset - last_checkpoint_uncompressed_offset >= span_bytes):
+						compressed_offsets.append(compressed_offset)
+						bits.append(data_type & 7)
+						uncompressed_offsets.append(uncompressed_offset)
+						compressed_windows.extend(zlib.compress(bytes(window)))
+						window_offsets.append(len(compressed_windows))
+						unresolved_checkpoints_total += 1
+						last_checkpoint_uncompressed_offset = uncompressed_offset
+
+					if not uncompressed_bytes and zlib_inflater.get_available_input_total() == 0 and is_file_read:
+						raise Exception(f"Gzip file ended before the end of its stream: {json_file_path}")
+		finally:
+			zlib_inflater.dispose()
+
+		# checkpoints after the start of the last line have no record to start from
+		checkpoints_total = len(line_start_offsets)
+		return WikiDataGzipCheckpointIndex(
+			compressed_offsets=compressed_offsets[:checkpoints_total],
+			bits=bits[:checkpoints_total],
+			uncompressed_offsets=uncompressed_offsets[:checkpoints_total],
+			line_start_offsets=line_start_offsets,
+			entity_ordinals=entity_ordinals,
+			window_offsets=window_offsets[:checkpoints_total + 1],
+			compressed_windows=bytes(compressed_windows[:window_offsets[checkpoints_total]]),
+			file_size=os.path.getsize(json_file_path)
+		)
+
+
+class TopEntityIntegers():
+
+	def __init__(self, *, top_entities_total: int):
+		self.__top_entities_total = top_entities_total
+
+		self.__heap = []  # type: List[Tuple[int, int]]
+		self.__entity_integers = set()  # type: Set[int]
+
+	def add(self, *, popularity: int, entity_integer: int):
+		# an entity has the same popularity under each of its keys, so once evicted it can never qualify again
+		if entity_integer in self.__entity_integers or self.__top_entities_total <= 0:
+			return
+		heap_item = (popularity, -entity_integer)
+		if len(self.__heap) < self.__top_entities_total:
+			heapq.heappush(self.__heap, heap_item)
+			self.__entity_integers.add(entity_integer)
+		elif self.__heap[0] < heap_item:
+			_, evicted_negative_entity_integer = heapq.heapreplace(self.__heap, heap_item)
+			self.__entity_integers.discard(-evicted_negative_entity_integer)
+			self.__entity_integers.add(entity_integer)
+
+	def get_entity_integers(self) -> List[int]:
+		return [-negative_entity_integer for _, negative_entity_integer in sorted(self.__heap, reverse=True)]
+
+
+class WikiDataPrefixIndex():
+
+	def __init__(self, *, key_offsets: Sequence[int], popularities: Sequence[int], entity_integers: Sequence[int], precomputed_key_offsets: Sequence[int], precomputed_entity_offsets: Sequence[int], precomputed_entity_integers: Sequence[int], top_entities_total: int, precomputed_prefix_length: int, key_strings: Union[bytes, mmap.mmap]):
+		self.__key_offsets = key_offsets
+		self.__popularities = popularities
+		self.__entity_integers = entity_integers
+		self.__precomputed_key_offsets = precomputed_key_offsets
+		self.__precomputed_entity_offsets = precomputed_entity_offsets
+		self.__precomputed_entity_integers = precomputed_entity_integers
+		self.__top_entities_total = top_entities_total
+		self.__precomputed_prefix_length = precomputed_prefix_length
+		self.__key_strings = key_strings
+
+	@staticmethod
+	def normalize_text(*, text: str) -> str:
+		return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+	@staticmethod
+	def get_popularity(*, entity_json: Dict) -> int:
+		# sitelinks rank first and the number of statements breaks ties
+		return (len(entity_json.get("sitelinks", {})) << 32) | min(sum(len(statement_jsons) for statement_jsons in entity_json["claims"].values()), 0xffffffff)
+
+	def get_keys_total(self) -> int:
+		return len(self.__popularities)
+
+	def __bisect_left(self, *, key_offsets: Sequence[int], key_bytes: bytes) -> int:
+		low_index = 0
+		high_index = len(key_offsets) - 1
+		while low_index < high_index:
+			middle_index = (low_index + high_index) // 2
+			if self.__key_strings[key_offsets[middle_index]:key_offsets[middle_index + 1]] < key_bytes:
+				low_index = middle_index + 1
+			else:
+				high_index = middle_index
+		return low_index
+
+	def get_entity_ids(self, *, prefix: str, language: LanguageEnum, limit: int = 10) -> List[str]:
+		normalized_prefix = WikiDataPrefixIndex.normalize_text(text=prefix)
+		prefix_bytes = f"{language.get_language_code()}\u0000{normalized_prefix}".encode()
+		if 0 < len(normalized_prefix) <= self.__precomputed_prefix_length and limit <= self.__top_entities_total:
+			precomputed_index = self.__bisect_left(
+				key_offsets=self.__precomputed_key_offsets,
+				key_bytes=prefix_bytes
+			)
+			if precomputed_index == len(self.__precomputed_key_offsets) - 1 or self.__key_strings[self.__precomputed_key_offsets[precomputed_index]:self.__precomputed_key_offsets[precomputed_index + 1]] != prefix_bytes:
+				return []
+			start_index = self.__precomputed_entity_offsets[precomputed_index]
+			end_index = min(self.__precomputed_entity_offsets[precomputed_index + 1], start_index + limit)
+			return [convert_integer_to_entity_id(integer=entity_integer) for entity_integer in self.__precomputed_entity_integers[start_index:end_index]]
+
+		# utf-8 never contains the byte 0xff, so every key starting with the prefix sorts before the prefix followed by it
+		start_index = self.__bisect_left(
+			key_offsets=self.__key_offsets,
+			key_bytes=prefix_bytes
+		)
+		end_index = self.__bisect_left(
+			key_offsets=self.__key_offsets,
+			key_bytes=prefix_bytes + b"\xff"
+		)
+		top_entities = TopEntityIntegers(
+			top_entities_total=limit
+		)
+		for key_index in range(start_index, end_index):
+			top_entities.add(
+				popularity=self.__popularities[key_index],
+				entity_integer=self.__entity_integers[key_index]
+			)
+		return [convert_integer_to_entity_id(integer=entity_integer) for entity_integer in top_entities.get_entity_integers()]
+
+	def save(self, *, index_file_path: str):
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays={
+				"key_offsets": array("q", self.__key_offsets),
+				"popularities": array("q", self.__popularities),
+				"entity_integers": array("q", self.__entity_integers),
+				"precomputed_key_offsets": array("q", self.__precomputed_key_offsets),
+				"precomputed_entity_offsets": array("q", self.__precomputed_entity_offsets),
+				"precomputed_entity_integers": array("q", self.__precomputed_entity_integers),
+				"top_entities_total": array("q", [self.__top_entities_total]),
+				"precomputed_prefix_length": array("q", [self.__precomputed_prefix_length])
+			}
+		)
+		with open(f"{index_file_path}.strings", "wb") as file_handle:
+			file_handle.write(self.__key_strings)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataPrefixIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		with open(f"{index_file_path}.strings", "rb") as file_handle:
+			if os.fstat(file_handle.fileno()).st_size == 0:
+				key_strings = b""
+			else:
+				key_strings = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		return WikiDataPrefixIndex(
+			key_offsets=integer_arrays["key_offsets"],
+			popularities=integer_arrays["popularities"],
+			entity_integers=integer_arrays["entity_integers"],
+			precomputed_key_offsets=integer_arrays["precomputed_key_offsets"],
+			precomputed_entity_offsets=integer_arrays["precomputed_entity_offsets"],
+			precomputed_entity_integers=integer_arrays["precomputed_entity_integers"],
+			top_entities_total=integer_arrays["top_entities_total"][0],
+			precomputed_prefix_length=integer_arrays["precomputed_prefix_length"][0],
+			key_strings=key_strings
+		)
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, languages: List[LanguageEnum], top_entities_total: int = 10, precomputed_prefix_length: int = 3, maximum_keys_in_memory: int = 10000000, temporary_directory_path: Optional[str] = None) -> WikiDataPrefixIndex:
+		# every normalized label and alias becomes a "<language code>\0<text>" key, sorted so that the keys sharing a prefix are contiguous
+		external_sorter = ExternalSorter(
+			maximum_items_in_memory=maximum_keys_in_memory,
+			temporary_directory_path=temporary_directory_path
+		)
+		try:
+			language_codes = [language.get_language_code() for language in languages]
+			for entity_json in wiki_data_parser.get_entity_json_iterator():
+				popularity = None
+				for language_code in language_codes:
+					texts = set()  # type: Set[str]
+					if language_code in entity_json["labels"]:
+						texts.add(WikiDataPrefixIndex.normalize_text(text=entity_json["labels"][language_code]["value"]))
+					for alias_json in entity_json.get("aliases", {}).get(language_code, []):
+						texts.add(WikiDataPrefixIndex.normalize_text(text=alias_json["value"]))
+					texts.discard("")
+					if texts and popularity is None:
+						popularity = WikiDataPrefixIndex.get_popularity(entity_json=entity_json)
+						entity_integer = convert_entity_id_to_integer(entity_id=entity_json["id"])
+					for text in texts:
+						external_sorter.add(item=(f"{language_code}\u0000{text}".encode(), popularity, entity_integer))
+
+			key_strings = bytearray()
+			key_offsets = array("q", [0])
+			popularities = array("q")
+			entity_integers = array("q")
+			# the top entities of every short prefix are gathered while its contiguous run of keys is read
+			precomputed_prefixes = [None] * precomputed_prefix_length  # type: List[Optional[bytes]]
+			precomputed_top_entities = [None] * precomputed_prefix_length  # type: List[Optional[TopEntityIntegers]]
+			precomputed_entity_integers_per_prefix = {}  # type: Dict[bytes, List[int]]
+			for key_bytes, popularity, entity_integer in external_sorter.get_sorted_iterator():
+				key_strings += key_bytes
+				key_offsets.append(len(key_strings))
+				popularities.append(popularity)
+				entity_integers.append(entity_integer)
+				language_code, text = key_bytes.decode().split("\u0000", 1)
+				for prefix_length_index in range(min(precomputed_prefix_length, len(text))):
+					prefix_bytes = f"{language_code}\u0000{text[:prefix_length_index + 1]}".encode()
+					if precomputed_prefixes[prefix_length_index] != prefix_bytes:
+						if precomputed_prefixes[prefix_length_index] is not None:
+							precomputed_entity_integers_per_prefix[precomputed_prefixes[prefix_length_index]] = precomputed_top_entities[prefix_length_index].get_entity_integers()
+						precomputed_prefixes[prefix_length_index] = prefix_bytes
+						precomputed_top_entities[prefix_length_index] = TopEntityIntegers(
+							top_entities_total=top_entities_total
+						)
+					precomputed_top_entities[prefix_length_index].add(
+						popularity=popularity,
+						entity_integer=entity_integer
+					)
+			for prefix_bytes, top_entities in zip(precomputed_prefixes, precomputed_top_entities):
+				if prefix_bytes is not None:
+					precomputed_entity_integers_per_prefix[prefix_bytes] = top_entities.get_entity_integers()
+		finally:
+			external_sorter.dispose()
+
+		# the precomputed prefixes are stored after the keys in the same string table
+		precomputed_key_offsets = array("q", [len(key_strings)])
+		precomputed_entity_offsets = array("q", [0])
+		precomputed_entity_integers = array("q")
+		for prefix_bytes in sorted(precomputed_entity_integers_per_prefix.keys()):
+			key_strings += prefix_bytes
+			precomputed_key_offsets.append(len(key_strings))
+			precomputed_entity_integers.extend(precomputed_entity_integers_per_prefix[prefix_bytes])
+			precomputed_entity_offsets.append(len(precomputed_entity_integers))
+		return WikiDataPrefixIndex(
+			key_offsets=key_offsets,
+			popularities=popularities,
+			entity_integers=entity_integers,
+			precomputed_key_offsets=precomputed_key_offsets,
+			precomputed_entity_offsets=precomputed_entity_offsets,
+			precomputed_entity_integers=precomputed_entity_integers,
+			top_entities_total=top_entities_total,
+			precomputed_prefix_length=precomputed_prefix_length,
+			key_strings=bytes(key_strings)
+		)
+
+
+class WikiDataReverseLinkIndex():
+
+	def __init__(self, *, target_integers: Sequence[int], posting_offsets: Sequence[int], entity_integers: Sequence[int], links_total: int, file_size: int, postings: Union[bytes, mmap.mmap]):
+		self.__target_integers = target_integers
+		self.__posting_offsets = posting_offsets
+		self.__entity_integers = entity_integers
+		self.__links_total = links_total
+		self.__file_size = file_size
+		self.__postings = postings
+
+	@staticmethod
+	def __append_varint(*, byte_array: bytearray, integer: int):
+		while integer >= 0x80:
+			byte_array.append((integer & 0x7f) | 0x80)
+			integer >>= 7
+		byte_array.append(integer)
+
+	@staticmethod
+	def __read_varint(*, postings: Union[bytes, mmap.mmap], offset: int) -> Tuple[int, int]:
+		integer = 0
+		shift = 0
+		while True:
+			byte = postings[offset]
+			offset += 1
+			integer |= (byte & 0x7f) << shift
+			if byte < 0x80:
+				return integer, offset
+			shift += 7
+
+	def get_targets_total(self) -> int:
+		return len(self.__target_integers)
+
+	def get_links_total(self) -> int:
+		return self.__links_total
+
+	def get_file_size(self) -> int:
+		return self.__file_size
+
+	def get_entity_id(self, *, entity_json_index: int) -> str:
+		return convert_integer_to_entity_id(integer=self.__entity_integers[entity_json_index])
+
+	def get_incoming_link_entity_json_indexes(self, *, entity_id: str, property_id: Optional[str] = None) -> List[Tuple[int, str]]:
+		target_integer = convert_entity_id_to_integer(entity_id=entity_id)
+		target_index = bisect.bisect_left(self.__target_integers, target_integer)
+		if target_index == len(self.__target_integers) or self.__target_integers[target_index] != target_integer:
+			return []
+		property_integer_filter = None if property_id is None else convert_entity_id_to_integer(entity_id=property_id)
+		entity_json_index_and_property_id_tuples = []  # type: List[Tuple[int, str]]
+		offset = self.__posting_offsets[target_index]
+		end_offset = self.__posting_offsets[target_index + 1]
+		while offset < end_offset:
+			property_integer, offset = WikiDataReverseLinkIndex.__read_varint(postings=self.__postings, offset=offset)
+			sources_total, offset = WikiDataReverseLinkIndex.__read_varint(postings=self.__postings, offset=offset)
+			sources_length, offset = WikiDataReverseLinkIndex.__read_varint(postings=self.__postings, offset=offset)
+			if property_integer_filter is not None and property_integer != property_integer_filter:
+				offset += sources_length
+				continue
+			property_id = convert_integer_to_entity_id(integer=property_integer)
+			entity_json_index = 0
+			for _ in range(sources_total):
+				entity_json_index_delta, offset = WikiDataReverseLinkIndex.__read_varint(postings=self.__postings, offset=offset)
+				entity_json_index += entity_json_index_delta
+				entity_json_index_and_property_id_tuples.append((entity_json_index, property_id))
+		return entity_json_index_and_property_id_tuples
+
+	def save(self, *, index_file_path: str):
+		write_integer_arrays(
+			file_path=index_file_path,
+			integer_arrays={
+				"target_integers": array("q", self.__target_integers),
+				"posting_offsets": array("q", self.__posting_offsets),
+				"entity_integers": array("q", self.__entity_integers),
+				"links_total": array("q", [self.__links_total]),
+				"file_size": array("q", [self.__file_size])
+			}
+		)
+		with open(f"{index_file_path}.postings", "wb") as file_handle:
+			file_handle.write(self.__postings)
+
+	@classmethod
+	def load(cls, *, index_file_path: str) -> WikiDataReverseLinkIndex:
+		integer_arrays = read_integer_arrays(
+			file_path=index_file_path
+		)
+		with open(f"{index_file_path}.postings", "rb") as file_handle:
+			if os.fstat(file_handle.fileno()).st_size == 0:
+				postings = b""
+			else:
+				postings = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		return WikiDataReverseLinkIndex(
+			target_integers=integer_arrays["target_integers"],
+			posting_offsets=integer_arrays["posting_offsets"],
+			entity_integers=integer_arrays["entity_integers"],
+			links_total=integer_arrays["links_total"][0],
+			file_size=integer_arrays["file_size"][0],
+			postings=postings
+		)
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, maximum_links_in_memory: int = 10000000, temporary_directory_path: Optional[str] = None) -> WikiDataReverseLinkIndex:
+		# the postings of a target are grouped by property, each group holding its byte length so that a property filter can skip the others
+		# within a group the source ordinals ascend and are stored as varint deltas
+		external_sorter = ExternalSorter(
+			maximum_items_in_memory=maximum_links_in_memory,
+			temporary_directory_path=temporary_directory_path
+		)
+		try:
+			entity_integers = array("q")
+			for entity_json_index, entity_json in enumerate(wiki_data_parser.get_entity_json_iterator()):
+				entity_integers.append(convert_entity_id_to_integer(entity_id=entity_json["id"]))
+				for property_id, claim_property_value_json_dicts in entity_json["claims"].items():
+					property_integer = None
+					for claim_property_value_json_dict in claim_property_value_json_dicts:
+						mainsnak_json = claim_property_value_json_dict["mainsnak"]
+						if mainsnak_json.get("datatype", None) != "wikibase-item" or "datavalue" not in mainsnak_json:
+							continue
+						if property_integer is None:
+							property_integer = convert_entity_id_to_integer(entity_id=property_id)
+						external_sorter.add(item=(
+							convert_entity_id_to_integer(entity_id=mainsnak_json["datavalue"]["value"]["id"]),
+							property_integer,
+							entity_json_index
+						))
+
+			target_integers = array("q")
+			posting_offsets = array("q")
+			postings = bytearray()
+			links_total = 0
+			sources = bytearray()
+			sources_total = 0
+			previous_link = None
+
+			def append_sources():
+				WikiDataReverseLinkIndex.__append_varint(byte_array=postings, integer=previous_link[1])
+				WikiDataReverseLinkIndex.__append_varint(byte_array=postings, integer=sources_total)
+				WikiDataReverseLinkIndex.__append_varint(byte_array=postings, integer=len(sources))
+				postings.extend(sources)
+
+			for link in external_sorter.get_sorted_iterator():
+				if link == previous_link:
+					continue
+				target_integer, property_integer, entity_json_index = link
+				if previous_link is None or previous_link[:2] != link[:2]:
+					if previous_link is not None:
+						append_sources()
+					if previous_link is None or previous_link[0] != target_integer:
+						target_integers.append(target_integer)
+						posting_offsets.append(len(postings))
+					sources = bytearray()
+					sources_total = 0
+					previous_entity_json_index = 0
+				WikiDataReverseLinkIndex.__append_varint(byte_array=sources, integer=entity_json_index - previous_entity_json_index)
+				previous_entity_json_index = entity_json_index
+				sources_total += 1
+				links_total += 1
+				previous_link = link
+			if previous_link is not None:
+				append_sources()
+			posting_offsets.append(len(postings))
+		finally:
+			external_sorter.dispose()
+		return WikiDataReverseLinkIndex(
+			target_integers=target_integers,
+			posting_offsets=posting_offsets,
+			entity_integers=entity_integers,
+			links_total=links_total,
+			file_size=os.path.getsize(wiki_data_parser.get_json_file_path()),
+			postings=bytes(postings)
+		)
+
+
+class WikiDataSqliteDatabase():
+
+	def __init__(self, *, database_file_path: str):
+		self.__database_file_path = database_file_path
+
+		connection = sqlite3.connect(self.__database_file_path)
+		try:
+			metadata_value_per_name = dict(connection.execute("SELECT name, value FROM metadata"))
+		finally:
+			connection.close()
+		self.__language_codes = json.loads(metadata_value_per_name["language_codes"])  # type: List[str]
+		self.__file_size = int(metadata_value_per_name["file_size"])
+		self.__entities_total = int(metadata_value_per_name["entities_total"])
+
+	def get_database_file_path(self) -> str:
+		return self.__database_file_path
+
+	def get_language_codes(self) -> List[str]:
+		return self.__language_codes.copy()
+
+	def get_file_size(self) -> int:
+		return self.__file_size
+
+	def get_entities_total(self) -> int:
+		return self.__entities_total
+
+	@staticmethod
+	def __get_language_entity(*, entity: Entity, language: LanguageEnum, additional_languages: List[LanguageEnum]) -> Entity:
+		# the stored entity holds every loaded language, so only the languages of the criteria are kept, as a search of the dump would
+		language_codes = {language.get_language_code()} | {additional_language.get_language_code() for additional_language in additional_languages}
+		return Entity(
+			entity_type=entity.get_entity_type(),
+			id=entity.get_id(),
+			label=entity.get_label(language=language),
+			description=entity.get_description(language=language),
+			claims=entity.get_claims(),
+			label_per_language_code={language_code: label for language_code, label in entity.get_label_per_language_code().items() if language_code in language_codes},
+			description_per_language_code={language_code: description for language_code, description in entity.get_description_per_language_code().items() if language_code in language_codes},
+			aliases_per_language_code={language_code: aliases for language_code, aliases in entity.get_aliases_per_language_code().items() if language_code in language_codes},
+			title_per_site_id=entity.get_title_per_site_id()
+		)
+
+	@staticmethod
+	def __get_where_clauses_and_parameters(*, search_criteria: SearchCriteria, hierarchy_index: Optional[WikiDataHierarchyIndex]) -> Tuple[List[str], List]:
+		# the clauses only narrow the candidates, and each candidate is still checked against the criteria itself
+		where_clauses = []  # type: List[str]
+		parameters = []
+		entity_types = search_criteria.get_entity_types()
+		if search_criteria.get_entity_types_set_compliment_type() == SetComplimentTypeEnum.Inclusive:
+			where_clauses.append(f"entity.entity_type IN ({', '.join('?' for _ in entity_types)})")
+			parameters.extend(entity_type.value for entity_type in entity_types)
+		elif entity_types:
+			where_clauses.append(f"entity.entity_type NOT IN ({', '.join('?' for _ in entity_types)})")
+			parameters.extend(entity_type.value for entity_type in entity_types)
+		if search_criteria.get_id() is not None:
+			where_clauses.append("entity.entity_id = ?")
+			parameters.append(search_criteria.get_id())
+		if search_criteria.get_entity_integer_range() is not None:
+			minimum_entity_integer, maximum_entity_integer = search_criteria.get_entity_integer_range()
+			where_clauses.append("entity.entity_integer BETWEEN ? AND ? AND (entity.entity_integer & 3) = ?")
+			parameters.extend([minimum_entity_integer, maximum_entity_integer, minimum_entity_integer & 3])
+		if search_criteria.get_sitelink_site_id() is not None:
+			where_clauses.append("EXISTS (SELECT 1 FROM sitelink WHERE sitelink.entity_json_index = entity.entity_json_index AND sitelink.site_id = ? AND sitelink.title = ?)")
+			parameters.extend([search_criteria.get_sitelink_site_id(), search_criteria.get_sitelink_title()])
+		for claim_property_id in search_criteria.get_claim_property_ids() or []:
+			where_clauses.append("EXISTS (SELECT 1 FROM claim WHERE claim.entity_json_index = entity.entity_json_index AND claim.property_id = ?)")
+			parameters.append(claim_property_id)
+		if search_criteria.get_instance_of_ids() is not None and (not search_criteria.is_instance_of_transitive() or hierarchy_index is not None):
+			instance_of_class_ids = set(search_criteria.get_instance_of_ids())
+			if search_criteria.is_instance_of_transitive():
+				for instance_of_id in search_criteria.get_instance_of_ids():
+					instance_of_class_ids.update(hierarchy_index.get_subclass_ids(
+						class_id=instance_of_id,
+						is_transitive=True
+					))
+			where_clauses.append(f"EXISTS (SELECT 1 FROM claim WHERE claim.entity_json_index = entity.entity_json_index AND claim.property_id = 'P31' AND claim.value IN ({', '.join('?' for _ in instance_of_class_ids)}))")
+			parameters.extend(sorted(instance_of_class_ids))
+		text_parts_per_column_name_and_language_code = {}  # type: Dict[Tuple[str, str], List[str]]
+		language_code = search_criteria.get_language().get_language_code()
+		for column_name, text_parts, text_parts_per_language in [
+			("label", search_criteria.get_label_parts(), search_criteria.get_label_parts_per_language()),
+			("description", search_criteria.get_description_parts(), search_criteria.get_description_parts_per_language())
+		]:
+			if text_parts is not None:
+				text_parts_per_column_name_and_language_code.setdefault((column_name, language_code), []).extend(text_parts)
+			for text_language, language_text_parts in (text_parts_per_language or {}).items():
+				text_parts_per_column_name_and_language_code.setdefault((column_name, text_language.get_language_code()), []).extend(language_text_parts)
+		for (column_name, text_language_code), text_parts in text_parts_per_column_name_and_language_code.items():
+			# instr matches case-sensitive substrings, just as the criteria does
+			where_clauses.append(f"EXISTS (SELECT 1 FROM entity_text WHERE entity_text.entity_json_index = entity.entity_json_index AND entity_text.language_code = ?{''.join(f' AND instr(entity_text.{column_name}, ?) > 0' for _ in text_parts)})")
+			parameters.append(text_language_code)
+			parameters.extend(text_parts)
+		return where_clauses, parameters
+
+	def get_search_iterator(self, *, search_criteria: SearchCriteria, page_criteria: PageCriteria, hierarchy_index: Optional[WikiDataHierarchyIndex] = None) -> Iterator[Entity]:
+		# returns the number of rows examined once the page is complete
+		for language in [search_criteria.get_language()] + search_criteria.get_additional_languages():
+			if language.get_language_code() not in self.__language_codes:
+				raise Exception(f"Language {language.value} was not loaded into the database: {self.__database_file_path}")
+		where_clauses, parameters = WikiDataSqliteDatabase.__get_where_clauses_and_parameters(
+			search_criteria=search_criteria,
+			hierarchy_index=hierarchy_index
+		)
+		rows_examined_total = 0
+		found_entity_index = 0
+		connection = sqlite3.connect(self.__database_file_path)
+		try:
+			for entity_bytes, in connection.execute(f"SELECT entity.entity_bytes FROM entity{' WHERE ' + ' AND '.join(where_clauses) if where_clauses else ''} ORDER BY entity.entity_json_index", parameters):
+				rows_examined_total += 1
+				entity = WikiDataSqliteDatabase.__get_language_entity(
+					entity=Entity.parse_bytes(
+						entity_bytes=entity_bytes
+					),
+					language=search_criteria.get_language(),
+					additional_languages=search_criteria.get_additional_languages()
+				)
+				if search_criteria.is_valid(
+					entity=entity,
+					hierarchy_index=hierarchy_index
+				):
+					if page_criteria.is_valid(
+						entity_index=found_entity_index
+					):
+						yield entity
+					if page_criteria.is_last_valid_entity_index(
+						entity_index=found_entity_index
+					):
+						return rows_examined_total
+					found_entity_index += 1
+		finally:
+			connection.close()
+		return rows_examined_total
+
+	def execute(self, *, sql: str, parameters: Optional[Sequence] = None) -> List[Tuple]:
+		connection = sqlite3.connect(self.__database_file_path)
+		try:
+			return connection.execute(sql, parameters or ()).fetchall()
+		finally:
+			connection.close()
+
+	@classmethod
+	def build(cls, *, wiki_data_parser: WikiDataParser, database_file_path: str, language: LanguageEnum, additional_languages: Optional[List[LanguageEnum]] = None, batch_size: int = 10000) -> WikiDataSqliteDatabase:
+		# the database is written to a temporary file without a journal, so an interrupted build leaves nothing behind to be mistaken for a complete one
+		language_code = language.get_language_code()
+		additional_language_codes = [additional_language.get_language_code() for additional_language in additional_languages or [] if additional_language.get_language_code() != language_code]
+		temporary_file_descriptor, temporary_database_file_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(database_file_path)), suffix=".tmp")
+		os.close(temporary_file_descriptor)
+		try:
+			connection = sqlite3.connect(temporary_database_file_path)
+			try:
+				connection.execute("PRAGMA journal_mode = OFF")
+				connection.execute("PRAGMA synchronous = OFF")
+				connection.execute("CREATE TABLE metadata (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+				connection.execute("CREATE TABLE entity (entity_json_index INTEGER PRIMARY KEY, entity_id TEXT NOT NULL, entity_integer INTEGER NOT NULL, entity_type TEXT NOT NULL, entity_bytes BLOB NOT NULL)")
+				connection.execute("CREATE TABLE entity_text (entity_json_index INTEGER NOT NULL, language_code TEXT NOT NULL, label TEXT, description TEXT)")
+				connection.execute("CREATE TABLE claim (entity_json_index INTEGER NOT NULL, property_id TEXT NOT NULL, value_type TEXT NOT NULL, value TEXT NOT NULL)")
+				connection.execute("CREATE TABLE sitelink (entity_json_index INTEGER NOT NULL, site_id TEXT NOT NULL, title TEXT NOT NULL)")
+				entity_rows = []  # type: List[Tuple[int, str, int, str, bytes]]
+				entity_text_rows = []  # type: List[Tuple[int, str, Optional[str], Optional[str]]]
+				claim_rows = []  # type: List[Tuple[int, str, str, str]]
+				sitelink_rows = []  # type: List[Tuple[int, str, str]]
+
+				def insert_rows():
+					with connection:
+						connection.executemany("INSERT INTO entity (entity_json_index, entity_id, entity_integer, entity_type, entity_bytes) VALUES (?, ?, ?, ?, ?)", entity_rows)
+						connection.executemany("INSERT INTO entity_text (entity_json_index, language_code, label, description) VALUES (?, ?, ?, ?)", entity_text_rows)
+						connection.executemany("INSERT INTO claim (entity_json_index, property_id, value_type, value) VALUES (?, ?, ?, ?)", claim_rows)
+						connection.executemany("INSERT INTO sitelink (entity_json_index, site_id, title) VALUES (?, ?, ?)", sitelink_rows)
+					for rows in [entity_rows, entity_text_rows, claim_rows, sitelink_rows]:
+						rows.clear()
+
+				entities_total = 0
+				for entity_json_index, entity_json in enumerate(wiki_data_parser.get_entity_json_iterator()):
+					entity = Entity.parse_json(
+						json_dict=entity_json,
+						language_code=language_code,
+						additional_language_codes=additional_language_codes
+					)
+					entity_rows.append((entity_json_index, entity.get_id(), convert_entity_id_to_integer(entity_id=entity.get_id()), entity.get_entity_type().value, entity.to_bytes()))
+					label_per_language_code = entity.get_label_per_language_code()
+					description_per_language_code = entity.get_description_per_language_code()
+					for text_language_code in label_per_language_code.keys() | description_per_language_code.keys():
+						entity_text_rows.append((entity_json_index, text_language_code, label_per_language_code.get(text_language_code, None), description_per_language_code.get(text_language_code, None)))
+					for claim in entity.get_claims():
+						for property_value in claim.get_property_values():
+							claim_rows.append((entity_json_index, claim.get_property_id(), property_value.get_type().value, property_value.get_value()))
+					for site_id, title in entity.get_title_per_site_id().items():
+						sitelink_rows.append((entity_json_index, site_id, normalize_sitelink_title(site_id=site_id, title=title)))
+					entities_total += 1
+					if len(entity_rows) >= batch_size:
+						insert_rows()
+				insert_rows()
+
+				# the indexes are created after loading, since maintaining them per insert is slower
+				with connection:
+					connection.execute("CREATE UNIQUE INDEX entity_entity_id_index ON entity (entity_id)")
+					connection.execute("CREATE INDEX entity_entity_integer_index ON entity (entity_integer)")
+					connection.execute("CREATE INDEX entity_text_entity_json_index_index ON entity_text (entity_json_index, language_code)")
+					connection.execute("CREATE INDEX entity_text_label_index ON entity_text (language_code, label)")
+					connection.execute("CREATE INDEX claim_entity_json_index_index ON claim (entity_json_index, property_id)")
+					connection.execute("CREATE INDEX claim_property_id_index ON claim (property_id, value)")
+					connection.execute("CREATE INDEX sitelink_entity_json_index_index ON sitelink (entity_json_index)")
+					connection.execute("CREATE INDEX sitelink_title_index ON sitelink (site_id, title)")
+					connection.executemany("INSERT INTO metadata (name, value) VALUES (?, ?)", [
+						("language_codes", json.dumps([language_code] + additional_language_codes)),
+						("file_size", str(os.path.getsize(wiki_data_parser.get_json_file_path()))),
+						("entities_total", str(entities_total))
+					])
+				connection.execute("ANALYZE")
+			finally:
+				connection.close()
+			os.replace(temporary_database_file_path, database_file_path)
+		except BaseException:
+			if os.path.exists(temporary_database_file_path):
+				os.remove(temporary_database_file_path)
+			raise
+		return WikiDataSqliteDatabase(
+			database_file_path=database_file_path
+		)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import random
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataSparseIdIndex
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json
+
+
+class ApproximateEstimateTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		# roughly a third of the entities have a country claim
+		random_instance = random.Random(0)
+		self.__entity_jsons = [
+			create_entity_json(entity_id=f"Q{entity_number}", labels={"en": f"entity {entity_number}"}, item_claims={"P17": ["Q142"]} if random_instance.random() < 0.3 else None)
+			for entity_number in range(1, 2001)
+		]
+		self.__matches_total = sum(1 for entity_json in self.__entity_jsons if entity_json["claims"])
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path,
+			entity_jsons=self.__entity_jsons
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def __get_search_criteria(self) -> SearchCriteria:
+		return SearchCriteria(
+			entity_types=[],
+			entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+			id=None,
+			label_parts=None,
+			description_parts=None,
+			language=LanguageEnum.English,
+			claim_property_ids=["P17"]
+		)
+
+	def test_prefix_sample(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+
+		approximate_estimates = list(wiki_data_parser.get_approximate_estimate_iterator(
+			search_criteria=self.__get_search_criteria(),
+			records_per_estimate=300
+		))
+
+		self.assertEqual(7, len(approximate_estimates))
+		self.assertEqual([300, 600, 900, 1200, 1500, 1800, 2000], [approximate_estimate.get_records_sampled_total() for approximate_estimate in approximate_estimates])
+		self.assertIsNone(approximate_estimates[0].get_estimated_matches_total())
+		self.assertTrue(approximate_estimates[-1].is_exact())
+		self.assertEqual(self.__matches_total, approximate_estimates[-1].get_matches_total())
+		self.assertEqual(self.__matches_total, approximate_estimates[-1].get_estimated_matches_total())
+		self.assertEqual(0.0, approximate_estimates[-1].get_margin_of_error())
+
+		approximate_estimate = wiki_data_parser.estimate(
+			search_criteria=self.__get_search_criteria(),
+			target_margin_of_error=0.05,
+			minimum_records_sampled_total=300,
+			records_per_estimate=300
+		)
+
+		self.assertFalse(approximate_estimate.is_exact())
+		self.assertEqual(600, approximate_estimate.get_records_sampled_total())
+		self.assertLessEqual(approximate_estimate.get_margin_of_error(), 0.05)
+
+	def test_block_sample(self):
+
+		sparse_id_index = WikiDataSparseIdIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			records_per_block=20
+		)
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			sparse_id_index=sparse_id_index
+		)
+
+		approximate_estimates = list(wiki_data_parser.get_approximate_estimate_iterator(
+			search_criteria=self.__get_search_criteria(),
+			random_seed=1
+		))
+
+		self.assertEqual(100, len(approximate_estimates))
+		self.assertEqual(float("inf"), approximate_estimates[0].get_margin_of_error())
+		self.assertTrue(approximate_estimates[-1].is_exact())
+		self.assertEqual(2000, approximate_estimates[-1].get_records_sampled_total())
+		self.assertEqual(self.__matches_total, approximate_estimates[-1].get_matches_total())
+
+		approximate_estimate = wiki_data_parser.estimate(
+			search_criteria=self.__get_search_criteria(),
+			target_margin_of_error=0.05,
+			minimum_records_sampled_total=100,
+			random_seed=1
+		)
+
+		self.assertFalse(approximate_estimate.is_exact())
+		self.assertLess(approximate_estimate.get_records_sampled_total(), 2000)
+		self.assertLessEqual(approximate_estimate.get_margin_of_error(), 0.05)
+		self.assertEqual(2000, approximate_estimate.get_records_total())
+		minimum_matches_total, maximum_matches_total = approximate_estimate.get_estimated_matches_total_interval()
+		self.assertLessEqual(minimum_matches_total, self.__matches_total)
+		self.assertLessEqual(self.__matches_total, maximum_matches_total)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import random
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, LanguageEnum, WikiDataDumpDiff, EntityDiffTypeEnum
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json, get_default_entity_jsons
+
+
+class DumpDiffTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__previous_json_file_path = os.path.join(self.__temporary_directory.name, "previous.json")
+		create_wiki_data_dump_file(
+			file_path=self.__previous_json_file_path
+		)
+		entity_jsons = []
+		for entity_json in get_default_entity_jsons():
+			if entity_json["id"] == "Q89":
+				continue
+			if entity_json["id"] == "Q64":
+				entity_json = create_entity_json(entity_id="Q64", labels={"en": "Berlin", "de": "Berlin"}, descriptions={"en": "capital and largest city of Germany"}, item_claims={"P31": ["Q515"], "P17": ["Q183"]}, sitelinks={"enwiki": "Berlin", "dewiki": "Berlin"})
+			if entity_json["id"] == "Q142":
+				entity_json = create_entity_json(entity_id="Q142", labels={"en": "France", "fr": "France", "de": "Frankreich"}, descriptions={"en": "country in Western Europe"}, sitelinks={"enwiki": "France"})
+			entity_jsons.append(entity_json)
+		entity_jsons.append(create_entity_json(entity_id="Q183", labels={"en": "Germany"}))
+		random.Random(0).shuffle(entity_jsons)
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.gz")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path,
+			entity_jsons=entity_jsons
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_diff(self):
+
+		entity_diffs = list(WikiDataDumpDiff(
+			previous_wiki_data_parser=WikiDataParser(
+				json_file_path=self.__previous_json_file_path
+			),
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			maximum_records_in_memory=3,
+			temporary_directory_path=self.__temporary_directory.name
+		).get_entity_diff_iterator(
+			language=LanguageEnum.English,
+			additional_languages=[LanguageEnum.German]
+		))
+
+		entity_diff_per_entity_id = {entity_diff.get_entity_id(): entity_diff for entity_diff in entity_diffs}
+		self.assertEqual({"Q89", "Q64", "Q142", "Q183"}, set(entity_diff_per_entity_id.keys()))
+		self.assertEqual(4, len(entity_diffs))
+
+		self.assertEqual(EntityDiffTypeEnum.Removed, entity_diff_per_entity_id["Q89"].get_entity_diff_type())
+		self.assertIsNone(entity_diff_per_entity_id["Q89"].get_entity())
+		self.assertEqual(EntityDiffTypeEnum.Added, entity_diff_per_entity_id["Q183"].get_entity_diff_type())
+		self.assertEqual("Germany", entity_diff_per_entity_id["Q183"].get_entity().get_label())
+
+		berlin_entity_diff = entity_diff_per_entity_id["Q64"]
+		self.assertEqual(EntityDiffTypeEnum.Changed, berlin_entity_diff.get_entity_diff_type())
+		self.assertEqual(["P17", "P31"], berlin_entity_diff.get_changed_property_ids())
+		self.assertEqual(["Q1549591"], [claim_json["mainsnak"]["datavalue"]["value"]["id"] for claim_json in berlin_entity_diff.get_removed_claim_jsons_per_property_id()["P31"]])
+		self.assertEqual(["Q183"], [claim_json["mainsnak"]["datavalue"]["value"]["id"] for claim_json in berlin_entity_diff.get_added_claim_jsons_per_property_id()["P17"]])
+		self.assertNotIn("P31", berlin_entity_diff.get_added_claim_jsons_per_property_id())
+
+		france_entity_diff = entity_diff_per_entity_id["Q142"]
+		self.assertEqual(EntityDiffTypeEnum.Changed, france_entity_diff.get_entity_diff_type())
+		self.assertEqual([], france_entity_diff.get_changed_property_ids())
+		self.assertIsNone(france_entity_diff.get_previous_entity().get_label(language=LanguageEnum.German))
+		self.assertEqual("Frankreich", france_entity_diff.get_entity().get_label(language=LanguageEnum.German))
+
+	def test_unordered_dump_with_id_ordered_flag(self):
+
+		with self.assertRaises(Exception):
+			list(WikiDataDumpDiff(
+				previous_wiki_data_parser=WikiDataParser(
+					json_file_path=self.__previous_json_file_path
+				),
+				wiki_data_parser=WikiDataParser(
+					json_file_path=self.__json_file_path
+				),
+				are_dumps_id_ordered=True
+			).get_entity_diff_iterator(
+				language=LanguageEnum.English
+			))
+
+	def test_record_entity_id(self):
+
+		self.assertEqual("Q42", WikiDataDumpDiff.get_record_entity_id(record=b'{"type":"item","id":"Q42","claims":{"P31":[{"id":"Q42$1"}]}}'))
+		self.assertEqual("Q42", WikiDataDumpDiff.get_record_entity_id(record=b'{"claims":{"P31":[{"id":"Q42$1"}]},"id":"Q42"}'))
+
+
+if __name__ == "__main__":
+	unittest.main()
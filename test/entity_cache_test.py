@@ -0,0 +1,92 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataEntityCache, WikiDataParserIterator, Entity
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class EntityCacheTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.gz")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+		self.__entity_cache = WikiDataEntityCache(
+			directory_path=os.path.join(self.__temporary_directory.name, "cache")
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_entity_bytes_round_trip(self):
+
+		for entity in WikiDataParser(json_file_path=self.__json_file_path).get_entity_iterator(language=LanguageEnum.English):
+			self.assertEqual(entity, Entity.parse_bytes(entity_bytes=entity.to_bytes()))
+
+	def test_search_from_cache(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			entity_cache=self.__entity_cache
+		)
+		self.assertFalse(self.__entity_cache.is_cached(json_file_path=self.__json_file_path, language=LanguageEnum.English))
+		uncached_entities = list(WikiDataParserIterator(
+			wiki_data_parser=wiki_data_parser,
+			search_criteria=None
+		))
+
+		self.__entity_cache.build(
+			wiki_data_parser=wiki_data_parser,
+			language=LanguageEnum.English
+		)
+		self.assertTrue(self.__entity_cache.is_cached(json_file_path=self.__json_file_path, language=LanguageEnum.English))
+
+		cached_entities = list(WikiDataParserIterator(
+			wiki_data_parser=wiki_data_parser,
+			search_criteria=None
+		))
+		self.assertEqual(uncached_entities, cached_entities)
+
+		entities = wiki_data_parser.search(
+			search_criteria=SearchCriteria(
+				entity_types=[],
+				entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+				id=None,
+				label_parts=["apple"],
+				description_parts=None,
+				language=LanguageEnum.English
+			),
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=10
+			)
+		)
+		self.assertEqual(["Q89"], [entity.get_id() for entity in entities])
+
+	def test_cache_invalidated_by_modified_dump(self):
+
+		self.__entity_cache.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			language=LanguageEnum.English
+		)
+		self.assertTrue(self.__entity_cache.is_cached(json_file_path=self.__json_file_path, language=LanguageEnum.English))
+
+		json_file_stat = os.stat(self.__json_file_path)
+		os.utime(self.__json_file_path, ns=(json_file_stat.st_atime_ns, json_file_stat.st_mtime_ns + 1000000000))
+		self.assertFalse(self.__entity_cache.is_cached(json_file_path=self.__json_file_path, language=LanguageEnum.English))
+
+	def test_build_leaves_no_temporary_files(self):
+
+		for _ in range(2):
+			self.__entity_cache.build(
+				wiki_data_parser=WikiDataParser(
+					json_file_path=self.__json_file_path
+				),
+				language=LanguageEnum.English
+			)
+		self.assertEqual(1, len(os.listdir(os.path.join(self.__temporary_directory.name, "cache"))))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import json
+import bz2
+import time
+import threading
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, LanguageEnum
+from test.wiki_data_dump_creator import get_default_entity_jsons
+
+
+class FollowTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_follow_growing_file(self):
+
+		entity_jsons = get_default_entity_jsons()
+		dump_lines = ["[\n"] + [json.dumps(entity_json, separators=(",", ":")) + (",\n" if entity_index + 1 < len(entity_jsons) else "\n") for entity_index, entity_json in enumerate(entity_jsons)] + ["]\n"]
+
+		for file_name in ["dump.json", "dump.json.bz2"]:
+			json_file_path = os.path.join(self.__temporary_directory.name, file_name)
+			completion_marker_file_path = json_file_path + ".complete"
+
+			entity_ids = []
+
+			def read_entities():
+				for entity in WikiDataParser(
+					json_file_path=json_file_path,
+					follow_completion_marker_file_path=completion_marker_file_path,
+					follow_poll_seconds=0.01
+				).get_entity_iterator(
+					language=LanguageEnum.English
+				):
+					entity_ids.append(entity.get_id())
+
+			reader_thread = threading.Thread(
+				target=read_entities
+			)
+			reader_thread.start()
+
+			# the file does not exist yet when the reader starts
+			time.sleep(0.05)
+			with open(json_file_path, "wb") as file_handle:
+				for dump_line in dump_lines:
+					dump_line_bytes = dump_line.encode()
+					if file_name.endswith(".bz2"):
+						# every line is its own bz2 stream, as in a multistream dump
+						dump_line_bytes = bz2.compress(dump_line_bytes)
+					file_handle.write(dump_line_bytes)
+					file_handle.flush()
+					time.sleep(0.01)
+
+			time.sleep(0.1)
+			self.assertTrue(reader_thread.is_alive())
+
+			with open(completion_marker_file_path, "wb"):
+				pass
+			reader_thread.join(timeout=10)
+			self.assertFalse(reader_thread.is_alive())
+			self.assertEqual([entity_json["id"] for entity_json in entity_jsons], entity_ids)
+
+	def test_memory_mapped_growing_file(self):
+
+		with self.assertRaises(NotImplementedError):
+			WikiDataParser(
+				json_file_path=os.path.join(self.__temporary_directory.name, "dump.json"),
+				is_memory_mapped=True,
+				follow_completion_marker_file_path=os.path.join(self.__temporary_directory.name, "dump.json.complete")
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
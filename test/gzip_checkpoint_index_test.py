@@ -0,0 +1,144 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import gzip
+import random
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataGzipCheckpointIndex, ScanPartition
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json
+
+
+class GzipCheckpointIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.gz")
+		random_instance = random.Random(0)
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path,
+			entity_jsons=[create_entity_json(entity_id=f"Q{entity_number}", labels={"en": "".join(random_instance.choice("abcdefghijklmnop ") for _ in range(random_instance.randint(10, 400)))}) for entity_number in range(1, 2001)]
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_records_from_every_checkpoint(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		gzip_checkpoint_index = WikiDataGzipCheckpointIndex.build(
+			wiki_data_parser=wiki_data_parser,
+			span_bytes=65536
+		)
+		index_file_path = os.path.join(self.__temporary_directory.name, "gzip.index")
+		gzip_checkpoint_index.save(
+			index_file_path=index_file_path
+		)
+		loaded_gzip_checkpoint_index = WikiDataGzipCheckpointIndex.load(
+			index_file_path=index_file_path
+		)
+		self.assertLess(4, loaded_gzip_checkpoint_index.get_checkpoints_total())
+
+		records = list(wiki_data_parser.get_raw_record_iterator())
+		for checkpoint_index in range(loaded_gzip_checkpoint_index.get_checkpoints_total()):
+			entity_ordinal = loaded_gzip_checkpoint_index.get_entity_ordinal(checkpoint_index=checkpoint_index)
+			self.assertEqual(
+				list(enumerate(records))[entity_ordinal:],
+				list(loaded_gzip_checkpoint_index.get_raw_record_iterator(
+					json_file_path=self.__json_file_path,
+					checkpoint_index=checkpoint_index
+				))
+			)
+
+		# random access to a record starts from the closest checkpoint before it
+		checkpoint_index = loaded_gzip_checkpoint_index.get_checkpoint_index(entity_ordinal=1500)
+		self.assertLessEqual(loaded_gzip_checkpoint_index.get_entity_ordinal(checkpoint_index=checkpoint_index), 1500)
+		for entity_ordinal, record in loaded_gzip_checkpoint_index.get_raw_record_iterator(json_file_path=self.__json_file_path, checkpoint_index=checkpoint_index):
+			if entity_ordinal == 1500:
+				self.assertTrue(record.startswith(b'{"type":"item","id":"Q1501"'))
+				break
+
+	def test_multiple_members(self):
+
+		with gzip.open(self.__json_file_path, "rb") as file_handle:
+			dump_bytes = file_handle.read()
+		with open(self.__json_file_path, "wb") as file_handle:
+			for member_index in range(3):
+				file_handle.write(gzip.compress(dump_bytes[len(dump_bytes) * member_index // 3:len(dump_bytes) * (member_index + 1) // 3]))
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		gzip_checkpoint_index = WikiDataGzipCheckpointIndex.build(
+			wiki_data_parser=wiki_data_parser,
+			span_bytes=65536
+		)
+		records = list(wiki_data_parser.get_raw_record_iterator())
+		self.assertEqual(2000, len(records))
+		for checkpoint_index in range(gzip_checkpoint_index.get_checkpoints_total()):
+			entity_ordinal = gzip_checkpoint_index.get_entity_ordinal(checkpoint_index=checkpoint_index)
+			self.assertEqual(records[entity_ordinal:], [record for _, record in gzip_checkpoint_index.get_raw_record_iterator(json_file_path=self.__json_file_path, checkpoint_index=checkpoint_index)])
+
+	def test_partitioned_search(self):
+
+		search_criteria = SearchCriteria(
+			entity_types=[],
+			entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+			id=None,
+			label_parts=["abc"],
+			description_parts=None,
+			language=LanguageEnum.English
+		)
+		expected_entity_ids = [entity.get_id() for entity in WikiDataParser(
+			json_file_path=self.__json_file_path
+		).search(
+			search_criteria=search_criteria,
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=10000
+			)
+		)]
+		self.assertLess(0, len(expected_entity_ids))
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			gzip_checkpoint_index=WikiDataGzipCheckpointIndex.build(
+				wiki_data_parser=WikiDataParser(
+					json_file_path=self.__json_file_path
+				),
+				span_bytes=65536
+			)
+		)
+		partial_file_paths = []
+		for partition_index in range(3):
+			partial_file_path = os.path.join(self.__temporary_directory.name, f"{partition_index}.partial")
+			wiki_data_parser.search_partition(
+				search_criteria=search_criteria,
+				scan_partition=ScanPartition(
+					partition_index=partition_index,
+					partitions_total=3
+				),
+				partial_file_path=partial_file_path
+			)
+			partial_file_paths.append(partial_file_path)
+		self.assertEqual(expected_entity_ids, [entity.get_id() for entity in WikiDataParser.merge_partial_results(
+			partial_file_paths=partial_file_paths
+		)])
+
+	def test_non_gzip_file(self):
+
+		json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.bz2")
+		create_wiki_data_dump_file(
+			file_path=json_file_path
+		)
+		with self.assertRaises(NotImplementedError):
+			WikiDataGzipCheckpointIndex.build(
+				wiki_data_parser=WikiDataParser(
+					json_file_path=json_file_path
+				)
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import pickle
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, Entity, EntityTypeEnum, Claim, ClaimPropertyValue, PropertyTypeEnum
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class HashableEntityTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def __search(self) -> list:
+		return WikiDataParser(
+			json_file_path=self.__json_file_path
+		).search(
+			search_criteria=SearchCriteria(
+				entity_types=[],
+				entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+				id=None,
+				label_parts=None,
+				description_parts=None,
+				language=LanguageEnum.English,
+				additional_languages=[LanguageEnum.German]
+			),
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=100
+			)
+		)
+
+	def test_dedupe_search_results(self):
+
+		first_entities = self.__search()
+		second_entities = self.__search()
+
+		self.assertLess(0, len(first_entities))
+		self.assertEqual(len(first_entities), len(set(first_entities + second_entities)))
+
+		entity_per_entity = {entity: entity for entity in first_entities}
+		for entity in second_entities:
+			self.assertIsNot(entity, entity_per_entity[entity])
+			self.assertEqual(entity, entity_per_entity[entity])
+
+	def test_claim_hash(self):
+
+		claim = Claim(
+			property_id="P31",
+			property_values=[
+				ClaimPropertyValue(
+					property_type=PropertyTypeEnum.Item,
+					property_value="Q5"
+				)
+			]
+		)
+		same_claim = Claim(
+			property_id="P31",
+			property_values=[
+				ClaimPropertyValue(
+					property_type=PropertyTypeEnum.Item,
+					property_value="Q5"
+				)
+			]
+		)
+		other_claim = Claim(
+			property_id="P31",
+			property_values=[
+				ClaimPropertyValue(
+					property_type=PropertyTypeEnum.Item,
+					property_value="Q515"
+				)
+			]
+		)
+
+		self.assertEqual(claim, same_claim)
+		self.assertEqual(hash(claim), hash(same_claim))
+		self.assertNotEqual(claim, other_claim)
+		self.assertEqual(2, len({claim, same_claim, other_claim}))
+
+	def test_entity_is_not_mutated_through_arguments_or_getters(self):
+
+		property_values = [
+			ClaimPropertyValue(
+				property_type=PropertyTypeEnum.Item,
+				property_value="Q5"
+			)
+		]
+		claims = [
+			Claim(
+				property_id="P31",
+				property_values=property_values
+			)
+		]
+		aliases_per_language_code = {"en": ["DNA"]}
+		entity = Entity(
+			entity_type=EntityTypeEnum.Item,
+			id="Q42",
+			label="Douglas Adams",
+			description="English writer and humorist",
+			claims=claims,
+			aliases_per_language_code=aliases_per_language_code
+		)
+		entity_hash = hash(entity)
+
+		property_values.clear()
+		claims.clear()
+		aliases_per_language_code["en"].append("Douglas Noel Adams")
+		entity.get_claims().clear()
+		entity.get_aliases(language=LanguageEnum.English).clear()
+
+		self.assertEqual(1, len(entity.get_claims()))
+		self.assertEqual(1, len(entity.get_claims()[0].get_property_values()))
+		self.assertEqual(["DNA"], entity.get_aliases(language=LanguageEnum.English))
+		self.assertEqual(entity_hash, hash(entity))
+
+	def test_round_trip_keeps_equality(self):
+
+		for entity in self.__search():
+			self.assertEqual(entity, Entity.parse_bytes(entity_bytes=entity.to_bytes()))
+			self.assertEqual(hash(entity), hash(Entity.parse_bytes(entity_bytes=entity.to_bytes())))
+			self.assertEqual(entity, pickle.loads(pickle.dumps(entity)))
+			self.assertEqual(hash(entity), hash(pickle.loads(pickle.dumps(entity))))
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataHierarchyIndex
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class HierarchyIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_build_save_and_load(self):
+
+		hierarchy_index = WikiDataHierarchyIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			maximum_edges_in_memory=2
+		)
+
+		index_file_path = os.path.join(self.__temporary_directory.name, "hierarchy.index")
+		hierarchy_index.save(
+			index_file_path=index_file_path
+		)
+		loaded_hierarchy_index = WikiDataHierarchyIndex.load(
+			index_file_path=index_file_path
+		)
+
+		for index in [hierarchy_index, loaded_hierarchy_index]:
+			self.assertEqual({"Q1549591"}, index.get_subclass_ids(class_id="Q515", is_transitive=False))
+			self.assertEqual({"Q515", "Q1549591"}, index.get_subclass_ids(class_id="Q486972", is_transitive=True))
+			self.assertEqual({"Q515", "Q486972"}, index.get_superclass_ids(class_id="Q1549591", is_transitive=True))
+			self.assertEqual({"Q350", "Q64"}, index.get_instance_ids(class_id="Q515", is_transitive=False))
+			self.assertEqual({"Q350", "Q64", "Q90"}, index.get_instance_ids(class_id="Q515", is_transitive=True))
+			self.assertEqual({"Q1549591", "Q515", "Q486972"}, index.get_class_ids(entity_id="Q90", is_transitive=True))
+			self.assertTrue(index.is_instance_of(entity_id="Q90", class_id="Q486972", is_transitive=True))
+			self.assertFalse(index.is_instance_of(entity_id="Q90", class_id="Q515", is_transitive=False))
+			self.assertFalse(index.is_instance_of(entity_id="Q42", class_id="Q515", is_transitive=True))
+
+	def test_search_transitive_instance_of(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		hierarchy_index = WikiDataHierarchyIndex.build(
+			wiki_data_parser=wiki_data_parser
+		)
+
+		for is_instance_of_transitive, expected_entity_ids in [
+			(False, ["Q350", "Q64"]),
+			(True, ["Q90", "Q350", "Q64"])
+		]:
+			entities = WikiDataParser(
+				json_file_path=self.__json_file_path,
+				hierarchy_index=hierarchy_index
+			).search(
+				search_criteria=SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=None,
+					label_parts=None,
+					description_parts=None,
+					language=LanguageEnum.English,
+					instance_of_ids=["Q515"],
+					is_instance_of_transitive=is_instance_of_transitive
+				),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=10
+				)
+			)
+			self.assertEqual(expected_entity_ids, [entity.get_id() for entity in entities])
+
+	def test_search_transitive_instance_of_without_index(self):
+
+		with self.assertRaises(Exception):
+			WikiDataParser(
+				json_file_path=self.__json_file_path
+			).search(
+				search_criteria=SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=None,
+					label_parts=None,
+					description_parts=None,
+					language=LanguageEnum.English,
+					instance_of_ids=["Q515"],
+					is_instance_of_transitive=True
+				),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=10
+				)
+			)
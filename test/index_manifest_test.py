@@ -0,0 +1,90 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, WikiDataHierarchyIndex, WikiDataSitelinkIndex, WikiDataIndexManifest
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json, get_default_entity_jsons
+
+
+class IndexManifestTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__previous_json_file_path = os.path.join(self.__temporary_directory.name, "previous.json.bz2")
+		create_wiki_data_dump_file(
+			file_path=self.__previous_json_file_path
+		)
+		entity_jsons = []
+		for entity_json in get_default_entity_jsons():
+			if entity_json["id"] == "Q89":
+				continue
+			if entity_json["id"] == "Q350":
+				entity_json = create_entity_json(entity_id="Q350", labels={"en": "Cambridge"}, descriptions={"en": "city in Cambridgeshire, England"}, item_claims={"P31": ["Q515", "Q486972"]}, sitelinks={"enwiki": "Cambridge", "dewiki": "Cambridge"})
+			entity_jsons.append(entity_json)
+		entity_jsons.insert(2, create_entity_json(entity_id="Q60", labels={"en": "New York City"}, item_claims={"P31": ["Q515"]}, sitelinks={"enwiki": "New York City"}))
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.bz2")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path,
+			entity_jsons=entity_jsons
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_incremental_build(self):
+
+		previous_index_manifest = WikiDataIndexManifest.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__previous_json_file_path
+			),
+			manifest_file_path=os.path.join(self.__temporary_directory.name, "previous.manifest")
+		)
+		self.assertEqual(14, previous_index_manifest.get_added_entities_total())
+		self.assertEqual(0, previous_index_manifest.get_removed_entities_total())
+
+		with patch.object(WikiDataIndexManifest, "get_payload", wraps=WikiDataIndexManifest.get_payload) as get_payload_mock:
+			index_manifest = WikiDataIndexManifest.build(
+				wiki_data_parser=WikiDataParser(
+					json_file_path=self.__json_file_path
+				),
+				manifest_file_path=os.path.join(self.__temporary_directory.name, "dump.manifest"),
+				previous_index_manifest=previous_index_manifest,
+				batch_size=4
+			)
+			# only the added and changed entities are decoded
+			self.assertEqual(2, get_payload_mock.call_count)
+
+		self.assertEqual(1, index_manifest.get_added_entities_total())
+		self.assertEqual(1, index_manifest.get_removed_entities_total())
+		self.assertEqual(1, index_manifest.get_changed_entities_total())
+		self.assertEqual(12, index_manifest.get_unchanged_entities_total())
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		hierarchy_index = WikiDataHierarchyIndex.build(
+			wiki_data_parser=wiki_data_parser
+		)
+		incremental_hierarchy_index = WikiDataHierarchyIndex.build_from_manifest(
+			index_manifest=index_manifest
+		)
+		for class_id in ["Q515", "Q486972", "Q1549591"]:
+			self.assertEqual(hierarchy_index.get_instance_ids(class_id=class_id, is_transitive=True), incremental_hierarchy_index.get_instance_ids(class_id=class_id, is_transitive=True))
+		self.assertEqual({"Q64", "Q90", "Q350", "Q60"}, incremental_hierarchy_index.get_instance_ids(class_id="Q515", is_transitive=True))
+
+		sitelink_index = WikiDataSitelinkIndex.build(
+			wiki_data_parser=wiki_data_parser
+		)
+		incremental_sitelink_index = WikiDataSitelinkIndex.build_from_manifest(
+			index_manifest=index_manifest
+		)
+		for site_id, title in [("enwiki", "New York City"), ("dewiki", "Cambridge"), ("enwiki", "Apple"), ("enwiki", "Berlin")]:
+			self.assertEqual(sitelink_index.get_entity_id(site_id=site_id, title=title), incremental_sitelink_index.get_entity_id(site_id=site_id, title=title))
+			self.assertEqual(sitelink_index.get_entity_json_index(site_id=site_id, title=title), incremental_sitelink_index.get_entity_json_index(site_id=site_id, title=title))
+		self.assertEqual("Q60", incremental_sitelink_index.get_entity_id(site_id="enwiki", title="New York City"))
+		self.assertIsNone(incremental_sitelink_index.get_entity_id(site_id="enwiki", title="Apple"))
+
+
+if __name__ == "__main__":
+	unittest.main()
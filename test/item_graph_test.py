@@ -0,0 +1,47 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, WikiDataItemGraph
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class ItemGraphTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.bz2")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_export_and_load(self):
+
+		for is_64_bit in [False, True]:
+			directory_path = os.path.join(self.__temporary_directory.name, f"graph_{is_64_bit}")
+			WikiDataItemGraph.export(
+				wiki_data_parser=WikiDataParser(
+					json_file_path=self.__json_file_path
+				),
+				directory_path=directory_path,
+				is_64_bit=is_64_bit,
+				maximum_ids_in_memory=3,
+				maximum_edges_in_memory=2
+			)
+			self.assertFalse(os.path.exists(os.path.join(directory_path, "ids.sqlite")))
+
+			item_graph = WikiDataItemGraph.load(
+				directory_path=directory_path
+			)
+
+			self.assertEqual(9, item_graph.get_edges_total())
+			self.assertEqual(13, item_graph.get_ids_total())
+			edges = [item_graph.get_edge(edge_index=edge_index) for edge_index in range(item_graph.get_edges_total())]
+			self.assertEqual(("Q515", "P279", "Q486972"), edges[0])
+			self.assertIn(("Q42", "P19", "Q350"), edges)
+			self.assertIn(("Q64", "P31", "Q515"), edges)
+			self.assertEqual(len(set(edges)), len(edges))
+			self.assertEqual(len({item_graph.get_id(integer=integer) for integer in range(item_graph.get_ids_total())}), item_graph.get_ids_total())
@@ -0,0 +1,99 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, Entity
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class MemoryMappedTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_entity_json_iterator_matches_streaming_parser(self):
+
+		self.assertEqual(
+			list(WikiDataParser(json_file_path=self.__json_file_path).get_entity_json_iterator()),
+			list(WikiDataParser(json_file_path=self.__json_file_path, is_memory_mapped=True).get_entity_json_iterator())
+		)
+
+	def test_search_matches_streaming_parser(self):
+
+		for label_parts, description_parts, id in [
+			(["city"], None, None),
+			(None, ["capital"], None),
+			(None, None, "Q42"),
+			(["Paris"], ["France"], None),
+			(None, None, None)
+		]:
+			entity_ids_per_parser = []
+			for is_memory_mapped in [False, True]:
+				wiki_data_parser = WikiDataParser(
+					json_file_path=self.__json_file_path,
+					is_memory_mapped=is_memory_mapped
+				)
+				search_criteria = SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=id,
+					label_parts=label_parts,
+					description_parts=description_parts,
+					language=LanguageEnum.English
+				)
+				entity_ids = []
+				for page_index in range(3):
+					entities = wiki_data_parser.search(
+						search_criteria=search_criteria,
+						page_criteria=PageCriteria(
+							page_index=page_index,
+							page_size=2
+						)
+					)
+					entity_ids.extend([entity.get_id() for entity in entities])
+				entity_ids_per_parser.append(entity_ids)
+			self.assertEqual(entity_ids_per_parser[0], entity_ids_per_parser[1])
+
+	def test_prefilter_skips_decoding(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			is_memory_mapped=True
+		)
+		with patch.object(Entity, "parse_json", wraps=Entity.parse_json) as parse_json_mock:
+			entities = wiki_data_parser.search(
+				search_criteria=SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=None,
+					label_parts=["Berlin"],
+					description_parts=None,
+					language=LanguageEnum.English
+				),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=10
+				)
+			)
+			self.assertEqual(["Q64"], [entity.get_id() for entity in entities])
+			self.assertEqual(1, parse_json_mock.call_count)
+
+	def test_compressed_file_is_not_memory_mapped(self):
+
+		with self.assertRaises(NotImplementedError):
+			WikiDataParser(
+				json_file_path=self.__json_file_path + ".bz2",
+				is_memory_mapped=True
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
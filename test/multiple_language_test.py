@@ -0,0 +1,116 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataEntityCache
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json
+
+
+class MultipleLanguageTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_collect_additional_languages(self):
+
+		entities = WikiDataParser(
+			json_file_path=self.__json_file_path
+		).search(
+			search_criteria=SearchCriteria(
+				entity_types=[],
+				entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+				id="Q42",
+				label_parts=None,
+				description_parts=None,
+				language=LanguageEnum.English,
+				additional_languages=[LanguageEnum.German, LanguageEnum.French]
+			),
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=1
+			)
+		)
+
+		self.assertEqual(1, len(entities))
+		entity = entities[0]
+		self.assertEqual("Douglas Adams", entity.get_label())
+		self.assertEqual("Douglas Adams", entity.get_label(language=LanguageEnum.German))
+		self.assertIsNone(entity.get_label(language=LanguageEnum.French))
+		self.assertEqual("English writer and humorist", entity.get_description(language=LanguageEnum.English))
+		self.assertEqual(["Douglas Noel Adams", "DNA"], entity.get_aliases(language=LanguageEnum.English))
+		self.assertEqual([], entity.get_aliases(language=LanguageEnum.German))
+		self.assertEqual({"en", "de"}, set(entity.get_label_per_language_code().keys()))
+
+	def test_label_parts_per_language(self):
+
+		for entity_cache in [None, WikiDataEntityCache(directory_path=os.path.join(self.__temporary_directory.name, "cache"))]:
+			wiki_data_parser = WikiDataParser(
+				json_file_path=self.__json_file_path,
+				entity_cache=entity_cache
+			)
+			if entity_cache is not None:
+				entity_cache.build(
+					wiki_data_parser=wiki_data_parser,
+					language=LanguageEnum.English,
+					additional_languages=[LanguageEnum.German]
+				)
+			entities = wiki_data_parser.search(
+				search_criteria=SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=None,
+					label_parts=["city"],
+					description_parts=None,
+					language=LanguageEnum.English,
+					label_parts_per_language={
+						LanguageEnum.German: ["Stadt"]
+					}
+				),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=10
+				)
+			)
+			self.assertEqual(["Q515"], [entity.get_id() for entity in entities])
+			self.assertEqual("Stadt", entities[0].get_label(language=LanguageEnum.German))
+
+	def test_label_parts_per_language_without_primary_label(self):
+
+		json_file_path = os.path.join(self.__temporary_directory.name, "german.json")
+		create_wiki_data_dump_file(
+			file_path=json_file_path,
+			entity_jsons=[
+				create_entity_json(entity_id="Q1", labels={"en": "Stadt"}),
+				create_entity_json(entity_id="Q2", labels={"de": "Stadtteil"})
+			]
+		)
+		wiki_data_parser = WikiDataParser(
+			json_file_path=json_file_path
+		)
+		for label_parts_per_language, expected_entity_ids in [
+			(None, ["Q1"]),
+			({LanguageEnum.German: ["Stadt"]}, ["Q2"])
+		]:
+			entities = wiki_data_parser.search(
+				search_criteria=SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=None,
+					label_parts=None,
+					description_parts=None,
+					language=LanguageEnum.English,
+					label_parts_per_language=label_parts_per_language
+				),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=10
+				)
+			)
+			self.assertEqual(expected_entity_ids, [entity.get_id() for entity in entities])
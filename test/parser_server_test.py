@@ -0,0 +1,154 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import stat
+from unittest.mock import patch
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataParserServer, WikiDataParserClient, WikiDataParserIterator, Entity
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class ParserServerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_search_through_client(self):
+
+		for address in [os.path.join(self.__temporary_directory.name, "parser.sock"), ("localhost", 0)]:
+			wiki_data_parser = WikiDataParser(
+				json_file_path=self.__json_file_path
+			)
+			wiki_data_parser_server = WikiDataParserServer(
+				wiki_data_parser=wiki_data_parser,
+				address=address,
+				authkey=b"secret"
+			)
+			wiki_data_parser_server.start()
+			try:
+				if isinstance(address, str):
+					self.assertEqual(0o600, stat.S_IMODE(os.stat(address).st_mode))
+
+				entity_ids = []
+				with patch.object(Entity, "parse_json", wraps=Entity.parse_json) as parse_json_mock:
+					for page_index in range(3):
+						entities = WikiDataParserClient(
+							address=wiki_data_parser_server.get_address(),
+							authkey=b"secret"
+						).search(
+							search_criteria=SearchCriteria(
+								entity_types=[],
+								entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+								id=None,
+								label_parts=None,
+								description_parts=None,
+								language=LanguageEnum.English
+							),
+							page_criteria=PageCriteria(
+								page_index=page_index,
+								page_size=2
+							)
+						)
+						entity_ids.extend([entity.get_id() for entity in entities])
+						self.assertEqual(1, wiki_data_parser.get_cursors_total())
+					# each page continues from the cursor of the previous page instead of rescanning from the start
+					self.assertEqual(6, parse_json_mock.call_count)
+				self.assertEqual(["Q1", "Q5", "Q515", "Q486972", "Q1549591", "Q42"], entity_ids)
+
+				entities = list(WikiDataParserIterator(
+					wiki_data_parser=WikiDataParserClient(
+						address=wiki_data_parser_server.get_address(),
+						authkey=b"secret"
+					),
+					search_criteria=None
+				))
+				self.assertEqual(14, len(entities))
+			finally:
+				wiki_data_parser_server.stop()
+
+	def test_search_error_raised_by_client(self):
+
+		wiki_data_parser_server = WikiDataParserServer(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=os.path.join(self.__temporary_directory.name, "dump.txt")
+			),
+			address=("localhost", 0),
+			authkey=b"secret"
+		)
+		wiki_data_parser_server.start()
+		try:
+			with self.assertRaises(NotImplementedError):
+				WikiDataParserClient(
+					address=wiki_data_parser_server.get_address(),
+					authkey=b"secret"
+				).search(
+					search_criteria=SearchCriteria(
+						entity_types=[],
+						entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+						id=None,
+						label_parts=None,
+						description_parts=None,
+						language=LanguageEnum.English
+					),
+					page_criteria=PageCriteria(
+						page_index=0,
+						page_size=2
+					)
+				)
+		finally:
+			wiki_data_parser_server.stop()
+
+	def test_tcp_address_requires_authkey(self):
+
+		with self.assertRaises(Exception):
+			WikiDataParserServer(
+				wiki_data_parser=WikiDataParser(
+					json_file_path=self.__json_file_path
+				),
+				address=("localhost", 0)
+			)
+
+	def test_cursor_eviction(self):
+
+		search_criteria = SearchCriteria(
+			entity_types=[],
+			entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+			id=None,
+			label_parts=None,
+			description_parts=None,
+			language=LanguageEnum.English
+		)
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			maximum_cursors_total=2
+		)
+		for page_size in range(1, 5):
+			wiki_data_parser.search(
+				search_criteria=search_criteria,
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=page_size
+				)
+			)
+		self.assertEqual(2, wiki_data_parser.get_cursors_total())
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			cursor_expire_seconds=0
+		)
+		wiki_data_parser.search(
+			search_criteria=search_criteria,
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=1
+			)
+		)
+		self.assertEqual(0, wiki_data_parser.get_cursors_total())
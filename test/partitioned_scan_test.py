@@ -0,0 +1,93 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+import multiprocessing
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, ScanPartition
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+def get_search_criteria() -> SearchCriteria:
+	return SearchCriteria(
+		entity_types=[],
+		entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+		id=None,
+		label_parts=None,
+		description_parts=None,
+		language=LanguageEnum.English
+	)
+
+
+def search_partition(json_file_path: str, partition_index: int, partitions_total: int, partial_file_path: str, page_criteria: PageCriteria):
+	WikiDataParser(
+		json_file_path=json_file_path
+	).search_partition(
+		search_criteria=get_search_criteria(),
+		scan_partition=ScanPartition(
+			partition_index=partition_index,
+			partitions_total=partitions_total
+		),
+		partial_file_path=partial_file_path,
+		page_criteria=page_criteria
+	)
+
+
+class PartitionedScanTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_merged_partitions_match_single_scan(self):
+
+		for file_name in ["dump.json", "dump.json.gz", "dump.json.bz2"]:
+			json_file_path = os.path.join(self.__temporary_directory.name, file_name)
+			create_wiki_data_dump_file(
+				file_path=json_file_path
+			)
+			expected_entity_ids = [entity.get_id() for entity in WikiDataParser(
+				json_file_path=json_file_path
+			).search(
+				search_criteria=get_search_criteria(),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=100
+				)
+			)]
+
+			for partitions_total in [1, 3, 20]:
+				for page_criteria in [None, PageCriteria(page_index=0, page_size=4), PageCriteria(page_index=2, page_size=4)]:
+					partial_file_paths = [os.path.join(self.__temporary_directory.name, f"{file_name}.{partition_index}.partial") for partition_index in range(partitions_total)]
+					processes = [multiprocessing.Process(
+						target=search_partition,
+						args=(json_file_path, partition_index, partitions_total, partial_file_paths[partition_index], page_criteria)
+					) for partition_index in range(partitions_total)]
+					for process in processes:
+						process.start()
+					for process in processes:
+						process.join()
+						self.assertEqual(0, process.exitcode)
+
+					entities = WikiDataParser.merge_partial_results(
+						partial_file_paths=partial_file_paths,
+						page_criteria=page_criteria
+					)
+					if page_criteria is None:
+						self.assertEqual(expected_entity_ids, [entity.get_id() for entity in entities])
+					else:
+						first_valid_entity_index = page_criteria.get_first_valid_entity_index()
+						self.assertEqual(expected_entity_ids[first_valid_entity_index:first_valid_entity_index + 4], [entity.get_id() for entity in entities])
+
+	def test_invalid_partition_index(self):
+
+		with self.assertRaises(Exception):
+			ScanPartition(
+				partition_index=3,
+				partitions_total=3
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
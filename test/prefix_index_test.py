@@ -0,0 +1,66 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, LanguageEnum, WikiDataPrefixIndex
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class PrefixIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def __build(self, *, maximum_keys_in_memory: int = 10000000) -> WikiDataPrefixIndex:
+		return WikiDataPrefixIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			languages=[LanguageEnum.English, LanguageEnum.German],
+			top_entities_total=2,
+			precomputed_prefix_length=3,
+			maximum_keys_in_memory=maximum_keys_in_memory,
+			temporary_directory_path=self.__temporary_directory.name
+		)
+
+	def test_build_save_and_load(self):
+
+		prefix_index = self.__build()
+		index_file_path = os.path.join(self.__temporary_directory.name, "prefix.index")
+		prefix_index.save(
+			index_file_path=index_file_path
+		)
+		loaded_prefix_index = WikiDataPrefixIndex.load(
+			index_file_path=index_file_path
+		)
+
+		for index in [prefix_index, loaded_prefix_index, self.__build(maximum_keys_in_memory=3)]:
+			self.assertEqual(prefix_index.get_keys_total(), index.get_keys_total())
+			# the most sitelinks rank first and ties fall back to the lowest id
+			self.assertEqual(["Q64", "Q1549591"], index.get_entity_ids(prefix="B", language=LanguageEnum.English))
+			self.assertEqual(["Q89", "Q312"], index.get_entity_ids(prefix="ap", language=LanguageEnum.English))
+			self.assertEqual(["Q89"], index.get_entity_ids(prefix="APPLE", language=LanguageEnum.English, limit=1))
+			self.assertEqual(["Q312"], index.get_entity_ids(prefix="apple inc", language=LanguageEnum.English))
+			self.assertEqual(["Q42"], index.get_entity_ids(prefix="dna", language=LanguageEnum.English))
+			self.assertEqual(["Q42"], index.get_entity_ids(prefix="douglas  noel", language=LanguageEnum.English))
+			self.assertEqual(["Q515"], index.get_entity_ids(prefix="st", language=LanguageEnum.German))
+			self.assertEqual([], index.get_entity_ids(prefix="st", language=LanguageEnum.English))
+			self.assertEqual([], index.get_entity_ids(prefix="ville", language=LanguageEnum.French))
+			self.assertEqual([], index.get_entity_ids(prefix="zzz", language=LanguageEnum.English))
+
+	def test_precomputed_prefixes_match_scan(self):
+
+		prefix_index = self.__build()
+
+		for prefix in ["a", "b", "c", "ca", "cit", "d", "h", "hu", "p", "s", "u"]:
+			scanned_entity_ids = prefix_index.get_entity_ids(prefix=prefix, language=LanguageEnum.English, limit=100)
+			self.assertEqual(scanned_entity_ids[:2], prefix_index.get_entity_ids(prefix=prefix, language=LanguageEnum.English, limit=2))
+			self.assertEqual(len(scanned_entity_ids), len(set(scanned_entity_ids)))
+		self.assertEqual(["Q350", "Q515"], prefix_index.get_entity_ids(prefix="c", language=LanguageEnum.English, limit=100))
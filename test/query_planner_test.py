@@ -0,0 +1,158 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataOffsetIndex, WikiDataHierarchyIndex, WikiDataSitelinkIndex, QueryPlanTypeEnum
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class QueryPlannerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		offset_index_file_path = os.path.join(self.__temporary_directory.name, "offset.index")
+		WikiDataOffsetIndex.build(
+			wiki_data_parser=wiki_data_parser,
+			maximum_entities_in_memory=4
+		).save(
+			index_file_path=offset_index_file_path
+		)
+		self.__offset_index = WikiDataOffsetIndex.load(
+			index_file_path=offset_index_file_path
+		)
+		self.__hierarchy_index = WikiDataHierarchyIndex.build(
+			wiki_data_parser=wiki_data_parser
+		)
+		self.__sitelink_index = WikiDataSitelinkIndex.build(
+			wiki_data_parser=wiki_data_parser
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def __get_search_criteria(self, **kwargs) -> SearchCriteria:
+		return SearchCriteria(**{
+			"entity_types": [],
+			"entity_types_set_compliment_type": SetComplimentTypeEnum.Exclusive,
+			"id": None,
+			"label_parts": None,
+			"description_parts": None,
+			"language": LanguageEnum.English,
+			**kwargs
+		})
+
+	def test_offset_index(self):
+
+		self.assertEqual(14, self.__offset_index.get_entities_total())
+		entity_json_index, offset = self.__offset_index.get_entity_json_index_and_offset(entity_id="Q42")
+		self.assertEqual(5, entity_json_index)
+		with open(self.__json_file_path, "rb") as file_handle:
+			file_handle.seek(offset)
+			self.assertTrue(file_handle.readline().startswith(b'{"type":"item","id":"Q42"'))
+		self.assertIsNone(self.__offset_index.get_entity_json_index_and_offset(entity_id="Q43"))
+
+	def test_plans_match_full_scan(self):
+
+		indexed_wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			offset_index=self.__offset_index,
+			hierarchy_index=self.__hierarchy_index,
+			sitelink_index=self.__sitelink_index
+		)
+		for search_criteria, expected_query_plan_type, expected_index_names in [
+			(self.__get_search_criteria(id="Q42"), QueryPlanTypeEnum.IndexLookup, ["offset"]),
+			(self.__get_search_criteria(sitelink_site_id="enwiki", sitelink_title="Berlin"), QueryPlanTypeEnum.IndexLookup, ["sitelink"]),
+			(self.__get_search_criteria(instance_of_ids=["Q515"]), QueryPlanTypeEnum.IndexLookup, ["hierarchy"]),
+			(self.__get_search_criteria(id="Q90", instance_of_ids=["Q515"], is_instance_of_transitive=True), QueryPlanTypeEnum.IndexLookup, ["offset"]),
+			(self.__get_search_criteria(label_parts=["city"]), QueryPlanTypeEnum.FullScan, [])
+		]:
+			query_plan = indexed_wiki_data_parser.get_query_plan(
+				search_criteria=search_criteria
+			)
+			self.assertEqual(expected_query_plan_type, query_plan.get_query_plan_type())
+			self.assertEqual(expected_index_names, query_plan.get_index_names())
+
+			for page_index in range(2):
+				page_criteria = PageCriteria(
+					page_index=page_index,
+					page_size=2
+				)
+				self.assertEqual(
+					[entity.get_id() for entity in WikiDataParser(json_file_path=self.__json_file_path, hierarchy_index=self.__hierarchy_index).search(search_criteria=search_criteria, page_criteria=page_criteria)],
+					[entity.get_id() for entity in indexed_wiki_data_parser.search(search_criteria=search_criteria, page_criteria=page_criteria)]
+				)
+
+	def test_intersection_and_costly_lookup(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			offset_index=self.__offset_index,
+			hierarchy_index=self.__hierarchy_index,
+			sitelink_index=self.__sitelink_index
+		)
+		query_plan = wiki_data_parser.get_query_plan(
+			search_criteria=self.__get_search_criteria(sitelink_site_id="enwiki", sitelink_title="Berlin", id="Q64")
+		)
+		self.assertEqual(QueryPlanTypeEnum.IndexLookup, query_plan.get_query_plan_type())
+
+		# when a lookup costs more than scanning every record, the planner scans
+		self.assertEqual(QueryPlanTypeEnum.FullScan, WikiDataParser(
+			json_file_path=self.__json_file_path,
+			offset_index=self.__offset_index,
+			hierarchy_index=self.__hierarchy_index
+		).get_query_plan(
+			search_criteria=self.__get_search_criteria(instance_of_ids=["Q515", "Q1549591", "Q5"], is_instance_of_transitive=True)
+		).get_query_plan_type())
+
+	def test_explain(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			offset_index=self.__offset_index,
+			hierarchy_index=self.__hierarchy_index
+		)
+		query_plan_explanation = wiki_data_parser.explain(
+			search_criteria=self.__get_search_criteria(instance_of_ids=["Q515"], is_instance_of_transitive=False),
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=10
+			)
+		)
+		self.assertEqual(QueryPlanTypeEnum.IndexLookup, query_plan_explanation.get_query_plan().get_query_plan_type())
+		self.assertEqual(2, query_plan_explanation.get_query_plan().get_estimated_rows_examined_total())
+		self.assertEqual(2, query_plan_explanation.get_actual_rows_examined_total())
+		self.assertEqual(2, query_plan_explanation.get_actual_rows_returned_total())
+		self.assertIn("index_lookup using hierarchy", str(query_plan_explanation))
+
+		query_plan_explanation = wiki_data_parser.explain(
+			search_criteria=self.__get_search_criteria(label_parts=["Paris"]),
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=10
+			)
+		)
+		self.assertEqual(QueryPlanTypeEnum.FullScan, query_plan_explanation.get_query_plan().get_query_plan_type())
+		self.assertEqual(14, query_plan_explanation.get_query_plan().get_estimated_rows_examined_total())
+		self.assertEqual(14, query_plan_explanation.get_actual_rows_examined_total())
+		self.assertEqual(1, query_plan_explanation.get_actual_rows_returned_total())
+
+	def test_stale_offset_index(self):
+
+		with open(self.__json_file_path, "ab") as file_handle:
+			file_handle.write(b"\n")
+		with self.assertRaises(Exception):
+			WikiDataParser(
+				json_file_path=self.__json_file_path,
+				offset_index=self.__offset_index
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
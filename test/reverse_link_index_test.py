@@ -0,0 +1,81 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, WikiDataReverseLinkIndex
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json, get_default_entity_jsons
+
+
+class ReverseLinkIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_build_save_and_load(self):
+
+		reverse_link_index = WikiDataReverseLinkIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			maximum_links_in_memory=2,
+			temporary_directory_path=self.__temporary_directory.name
+		)
+		index_file_path = os.path.join(self.__temporary_directory.name, "reverse_link.index")
+		reverse_link_index.save(
+			index_file_path=index_file_path
+		)
+		loaded_reverse_link_index = WikiDataReverseLinkIndex.load(
+			index_file_path=index_file_path
+		)
+
+		for index in [reverse_link_index, loaded_reverse_link_index]:
+			self.assertEqual(9, index.get_links_total())
+			self.assertEqual(6, index.get_targets_total())
+			# Q515 is linked by Q1549591 through P279 and by Q350 and Q64 through P31
+			self.assertEqual([(7, "P31"), (9, "P31"), (4, "P279")], index.get_incoming_link_entity_json_indexes(entity_id="Q515"))
+			self.assertEqual([(4, "P279")], index.get_incoming_link_entity_json_indexes(entity_id="Q515", property_id="P279"))
+			self.assertEqual([], index.get_incoming_link_entity_json_indexes(entity_id="Q515", property_id="P17"))
+			self.assertEqual([], index.get_incoming_link_entity_json_indexes(entity_id="Q42"))
+			self.assertEqual("Q64", index.get_entity_id(entity_json_index=9))
+
+	def test_get_incoming_links(self):
+
+		json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.bz2")
+		# many sources with large ordinal gaps exercise the multi-byte deltas
+		create_wiki_data_dump_file(
+			file_path=json_file_path,
+			entity_jsons=get_default_entity_jsons() + [
+				create_entity_json(entity_id=f"Q{1000000 + entity_index}", labels={"en": f"person {entity_index}"}, item_claims={"P19": ["Q90"]} if entity_index % 150 == 0 else {})
+				for entity_index in range(600)
+			]
+		)
+		wiki_data_parser = WikiDataParser(
+			json_file_path=json_file_path
+		)
+		reverse_link_index = WikiDataReverseLinkIndex.build(
+			wiki_data_parser=wiki_data_parser
+		)
+
+		with self.assertRaises(Exception):
+			wiki_data_parser.get_incoming_links(entity_id="Q90")
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=json_file_path,
+			reverse_link_index=reverse_link_index
+		)
+		self.assertEqual([("Q1000000", "P19"), ("Q1000150", "P19"), ("Q1000300", "P19"), ("Q1000450", "P19")], wiki_data_parser.get_incoming_links(entity_id="Q90"))
+		self.assertEqual([("Q42", "P31")], wiki_data_parser.get_incoming_links(entity_id="Q5", property_id="P31"))
+		self.assertEqual([("Q90", "P17")], wiki_data_parser.get_incoming_links(entity_id="Q142"))
+
+		with self.assertRaises(Exception):
+			WikiDataParser(
+				json_file_path=self.__json_file_path,
+				reverse_link_index=reverse_link_index
+			)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, Entity
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class SearchIteratorTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+		self.__search_criteria = SearchCriteria(
+			entity_types=[],
+			entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+			id=None,
+			label_parts=None,
+			description_parts=None,
+			language=LanguageEnum.English
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_pages_match_search(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		expected_entity_ids = [entity.get_id() for entity in WikiDataParser(
+			json_file_path=self.__json_file_path
+		).search(
+			search_criteria=self.__search_criteria,
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=100
+			)
+		)]
+
+		entity_ids = []
+		with patch.object(Entity, "parse_json", wraps=Entity.parse_json) as parse_json_mock:
+			for page_index in range(4):
+				for entity in wiki_data_parser.search_iterator(
+					search_criteria=self.__search_criteria,
+					page_criteria=PageCriteria(
+						page_index=page_index,
+						page_size=4
+					)
+				):
+					entity_ids.append(entity.get_id())
+			# each page continues from the cursor registered by the previous page
+			self.assertEqual(14, parse_json_mock.call_count)
+		self.assertEqual(expected_entity_ids, entity_ids)
+
+	def test_first_result_before_scan_completes(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path
+		)
+		with patch.object(Entity, "parse_json", wraps=Entity.parse_json) as parse_json_mock:
+			entity_iterator = wiki_data_parser.search_iterator(
+				search_criteria=self.__search_criteria,
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=1000000
+				)
+			)
+			self.assertEqual(0, parse_json_mock.call_count)
+			self.assertEqual("Q1", next(entity_iterator).get_id())
+			self.assertEqual(1, parse_json_mock.call_count)
+			self.assertEqual(0, wiki_data_parser.get_cursors_total())
+
+			# an abandoned page keeps no cursor
+			entity_iterator.close()
+			self.assertEqual(0, wiki_data_parser.get_cursors_total())
+
+			self.assertEqual(13, len(list(wiki_data_parser.search_iterator(
+				search_criteria=self.__search_criteria,
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=13
+				)
+			))))
+			self.assertEqual(1, wiki_data_parser.get_cursors_total())
+
+
+if __name__ == "__main__":
+	unittest.main()
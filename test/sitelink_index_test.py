@@ -0,0 +1,99 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataSitelinkIndex, normalize_sitelink_title
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class SitelinkIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_build_save_and_load(self):
+
+		sitelink_index = WikiDataSitelinkIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			)
+		)
+		index_file_path = os.path.join(self.__temporary_directory.name, "sitelink.index")
+		sitelink_index.save(
+			index_file_path=index_file_path
+		)
+		loaded_sitelink_index = WikiDataSitelinkIndex.load(
+			index_file_path=index_file_path
+		)
+
+		for index in [sitelink_index, loaded_sitelink_index]:
+			self.assertEqual("Q42", index.get_entity_id(site_id="enwiki", title="Douglas_Adams"))
+			self.assertEqual("Q42", index.get_entity_id(site_id="dewiki", title="douglas Adams"))
+			self.assertEqual(5, index.get_entity_json_index(site_id="enwiki", title="Douglas Adams"))
+			self.assertEqual("Q90", index.get_entity_id(site_id="frwiki", title="Paris"))
+			self.assertIsNone(index.get_entity_id(site_id="dewiki", title="Paris"))
+			self.assertIsNone(index.get_entity_id(site_id="enwiki", title="Nowhere"))
+
+	def test_build_for_site_ids(self):
+
+		sitelink_index = WikiDataSitelinkIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			site_ids=["dewiki"]
+		)
+		self.assertEqual("Q64", sitelink_index.get_entity_id(site_id="dewiki", title="Berlin"))
+		self.assertIsNone(sitelink_index.get_entity_id(site_id="enwiki", title="Berlin"))
+
+	def test_search_by_sitelink(self):
+
+		sitelink_index = WikiDataSitelinkIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			)
+		)
+		for sitelink_index in [None, sitelink_index]:
+			wiki_data_parser = WikiDataParser(
+				json_file_path=self.__json_file_path,
+				sitelink_index=sitelink_index
+			)
+			for title, expected_entity_ids in [
+				("apple_Inc.", ["Q312"]),
+				("Apple", ["Q89"]),
+				("Pear", [])
+			]:
+				entities = wiki_data_parser.search(
+					search_criteria=SearchCriteria(
+						entity_types=[],
+						entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+						id=None,
+						label_parts=None,
+						description_parts=None,
+						language=LanguageEnum.English,
+						sitelink_site_id="enwiki",
+						sitelink_title=title
+					),
+					page_criteria=PageCriteria(
+						page_index=0,
+						page_size=10
+					)
+				)
+				self.assertEqual(expected_entity_ids, [entity.get_id() for entity in entities])
+				self.assertEqual(0, wiki_data_parser.get_cursors_total())
+
+	def test_normalize_sitelink_title(self):
+
+		self.assertEqual("Douglas Adams", normalize_sitelink_title(site_id="enwiki", title="douglas_Adams"))
+		self.assertEqual("Douglas  Adams", normalize_sitelink_title(site_id="enwiki", title="Douglas__Adams"))
+		self.assertEqual("apple", normalize_sitelink_title(site_id="enwiktionary", title="apple"))
+		self.assertNotEqual(
+			WikiDataSitelinkIndex.get_sitelink_hash(site_id="enwiktionary", title="apple"),
+			WikiDataSitelinkIndex.get_sitelink_hash(site_id="enwiktionary", title="Apple")
+		)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, WikiDataSparseIdIndex, QueryPlanTypeEnum
+from test.wiki_data_dump_creator import create_wiki_data_dump_file, create_entity_json
+
+
+class SparseIdIndexTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json")
+		# the dump is mostly ordered by id, except for Q15 which appears near the end
+		self.__entity_numbers = [entity_number for entity_number in range(10, 70) if entity_number != 15]
+		self.__entity_numbers.insert(55, 15)
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path,
+			entity_jsons=[create_entity_json(entity_id=f"Q{entity_number}", labels={"en": f"entity {entity_number}"}) for entity_number in self.__entity_numbers] + [create_entity_json(entity_id="P20", labels={"en": "property 20"})]
+		)
+		index_file_path = os.path.join(self.__temporary_directory.name, "sparse_id.index")
+		WikiDataSparseIdIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			records_per_block=10
+		).save(
+			index_file_path=index_file_path
+		)
+		self.__sparse_id_index = WikiDataSparseIdIndex.load(
+			index_file_path=index_file_path
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def __get_search_criteria(self, *, minimum_id, maximum_id) -> SearchCriteria:
+		return SearchCriteria(
+			entity_types=[],
+			entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+			id=None,
+			label_parts=None,
+			description_parts=None,
+			language=LanguageEnum.English,
+			minimum_id=minimum_id,
+			maximum_id=maximum_id
+		)
+
+	def test_range_search(self):
+
+		self.assertEqual(7, self.__sparse_id_index.get_blocks_total())
+		self.assertEqual(61, self.__sparse_id_index.get_records_total())
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			sparse_id_index=self.__sparse_id_index
+		)
+		for minimum_id, maximum_id, expected_entity_ids in [
+			("Q30", "Q34", ["Q30", "Q31", "Q32", "Q33", "Q34"]),
+			("Q14", "Q16", ["Q14", "Q16", "Q15"]),
+			("Q68", None, ["Q68", "Q69"]),
+			(None, "Q11", ["Q10", "Q11"]),
+			("P1", "P100", ["P20"]),
+			("Q100", "Q200", [])
+		]:
+			search_criteria = self.__get_search_criteria(
+				minimum_id=minimum_id,
+				maximum_id=maximum_id
+			)
+			page_criteria = PageCriteria(
+				page_index=0,
+				page_size=100
+			)
+			self.assertEqual(expected_entity_ids, [entity.get_id() for entity in WikiDataParser(json_file_path=self.__json_file_path).search(search_criteria=search_criteria, page_criteria=page_criteria)])
+			query_plan_explanation = wiki_data_parser.explain(
+				search_criteria=search_criteria,
+				page_criteria=page_criteria
+			)
+			self.assertEqual(len(expected_entity_ids), query_plan_explanation.get_actual_rows_returned_total())
+			self.assertEqual(expected_entity_ids, [entity.get_id() for entity in wiki_data_parser.search(search_criteria=search_criteria, page_criteria=page_criteria)])
+
+		query_plan = wiki_data_parser.get_query_plan(
+			search_criteria=self.__get_search_criteria(minimum_id="Q30", maximum_id="Q34")
+		)
+		self.assertEqual(QueryPlanTypeEnum.RangeScan, query_plan.get_query_plan_type())
+		# the two blocks holding the range and the block whose bounds are widened by the out of place Q15
+		self.assertEqual(30, query_plan.get_estimated_rows_examined_total())
+
+		query_plan = wiki_data_parser.get_query_plan(
+			search_criteria=self.__get_search_criteria(minimum_id="Q14", maximum_id="Q16")
+		)
+		self.assertEqual(20, query_plan.get_estimated_rows_examined_total())
+
+	def test_mixed_entity_type_range(self):
+
+		with self.assertRaises(Exception):
+			self.__get_search_criteria(
+				minimum_id="P1",
+				maximum_id="Q10"
+			)
+
+	def test_stale_index(self):
+
+		# swapping two records of the same length keeps the file size but moves ids outside of their block bounds
+		with open(self.__json_file_path, "rb") as file_handle:
+			lines = file_handle.read().split(b"\n")
+		lines[3], lines[43] = lines[43], lines[3]
+		with open(self.__json_file_path, "wb") as file_handle:
+			file_handle.write(b"\n".join(lines))
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			sparse_id_index=self.__sparse_id_index
+		)
+		with self.assertRaises(Exception):
+			wiki_data_parser.search(
+				search_criteria=self.__get_search_criteria(minimum_id="Q10", maximum_id="Q13"),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=100
+				)
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import unittest
+import tempfile
+import os
+from src.austin_heller_repo.wiki_data_parser import WikiDataParser, SearchCriteria, PageCriteria, SetComplimentTypeEnum, LanguageEnum, EntityTypeEnum, WikiDataHierarchyIndex, WikiDataSqliteDatabase, QueryPlanTypeEnum
+from test.wiki_data_dump_creator import create_wiki_data_dump_file
+
+
+class SqliteDatabaseTest(unittest.TestCase):
+
+	def setUp(self):
+		self.__temporary_directory = tempfile.TemporaryDirectory()
+		self.__json_file_path = os.path.join(self.__temporary_directory.name, "dump.json.bz2")
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path
+		)
+		self.__database_file_path = os.path.join(self.__temporary_directory.name, "dump.sqlite")
+		self.__sqlite_database = WikiDataSqliteDatabase.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			),
+			database_file_path=self.__database_file_path,
+			language=LanguageEnum.English,
+			additional_languages=[LanguageEnum.German, LanguageEnum.French],
+			batch_size=4
+		)
+
+	def tearDown(self):
+		self.__temporary_directory.cleanup()
+
+	def test_search_matches_dump(self):
+
+		hierarchy_index = WikiDataHierarchyIndex.build(
+			wiki_data_parser=WikiDataParser(
+				json_file_path=self.__json_file_path
+			)
+		)
+		dump_wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			hierarchy_index=hierarchy_index
+		)
+		database_wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			hierarchy_index=hierarchy_index,
+			sqlite_database=WikiDataSqliteDatabase(
+				database_file_path=self.__database_file_path
+			)
+		)
+		self.assertEqual(QueryPlanTypeEnum.DatabaseQuery, database_wiki_data_parser.get_query_plan(
+			search_criteria=SearchCriteria(
+				entity_types=[],
+				entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+				id=None,
+				label_parts=None,
+				description_parts=None,
+				language=LanguageEnum.English
+			)
+		).get_query_plan_type())
+
+		search_criteria_kwargs_list = [
+			{},
+			{"id": "Q42"},
+			{"label_parts": ["Apple"]},
+			{"description_parts": ["capital", "city"]},
+			{"label_parts_per_language": {LanguageEnum.German: ["Stadt"]}},
+			{"instance_of_ids": ["Q515"], "is_instance_of_transitive": True},
+			{"instance_of_ids": ["Q5"]},
+			{"sitelink_site_id": "enwiki", "sitelink_title": "douglas_Adams"},
+			{"minimum_id": "Q60", "maximum_id": "Q400"},
+			{"claim_property_ids": ["P279"]},
+			{"entity_types": [EntityTypeEnum.Property], "entity_types_set_compliment_type": SetComplimentTypeEnum.Inclusive},
+			{"language": LanguageEnum.German},
+			{"language": LanguageEnum.French, "additional_languages": [LanguageEnum.English]}
+		]
+		for search_criteria_kwargs in search_criteria_kwargs_list:
+			for page_index, page_size in [(0, 100), (0, 2), (1, 2), (2, 3)]:
+				entities_per_wiki_data_parser = []
+				for wiki_data_parser in [dump_wiki_data_parser, database_wiki_data_parser]:
+					entities_per_wiki_data_parser.append(wiki_data_parser.search(
+						search_criteria=SearchCriteria(**{
+							"entity_types": [],
+							"entity_types_set_compliment_type": SetComplimentTypeEnum.Exclusive,
+							"id": None,
+							"label_parts": None,
+							"description_parts": None,
+							"language": LanguageEnum.English,
+							**search_criteria_kwargs
+						}),
+						page_criteria=PageCriteria(
+							page_index=page_index,
+							page_size=page_size
+						)
+					))
+				self.assertEqual(entities_per_wiki_data_parser[0], entities_per_wiki_data_parser[1], search_criteria_kwargs)
+
+		# the clauses narrow the rows read, so a selective search examines only the matching rows
+		self.assertEqual(1, database_wiki_data_parser.explain(
+			search_criteria=SearchCriteria(
+				entity_types=[],
+				entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+				id=None,
+				label_parts=None,
+				description_parts=None,
+				language=LanguageEnum.English,
+				instance_of_ids=["Q5"]
+			),
+			page_criteria=PageCriteria(
+				page_index=0,
+				page_size=10
+			)
+		).get_actual_rows_examined_total())
+
+	def test_tables(self):
+
+		self.assertEqual(14, self.__sqlite_database.get_entities_total())
+		self.assertEqual(["en", "de", "fr"], self.__sqlite_database.get_language_codes())
+		self.assertEqual([("Q64",), ("Q90",)], self.__sqlite_database.execute(
+			sql="SELECT entity.entity_id FROM entity JOIN claim ON claim.entity_json_index = entity.entity_json_index WHERE claim.property_id = ? AND claim.value = ? ORDER BY entity.entity_id",
+			parameters=["P31", "Q1549591"]
+		))
+		self.assertEqual([("Stadt",)], self.__sqlite_database.execute(
+			sql="SELECT entity_text.label FROM entity_text JOIN entity ON entity.entity_json_index = entity_text.entity_json_index WHERE entity.entity_id = 'Q515' AND entity_text.language_code = 'de'"
+		))
+
+	def test_unloaded_language_and_stale_file(self):
+
+		wiki_data_parser = WikiDataParser(
+			json_file_path=self.__json_file_path,
+			sqlite_database=self.__sqlite_database
+		)
+
+		with self.assertRaises(Exception):
+			wiki_data_parser.search(
+				search_criteria=SearchCriteria(
+					entity_types=[],
+					entity_types_set_compliment_type=SetComplimentTypeEnum.Exclusive,
+					id=None,
+					label_parts=None,
+					description_parts=None,
+					language=LanguageEnum.Spanish
+				),
+				page_criteria=PageCriteria(
+					page_index=0,
+					page_size=10
+				)
+			)
+
+		create_wiki_data_dump_file(
+			file_path=self.__json_file_path,
+			entity_jsons=[]
+		)
+
+		with self.assertRaises(Exception):
+			WikiDataParser(
+				json_file_path=self.__json_file_path,
+				sqlite_database=self.__sqlite_database
+			)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import json
+import bz2
+import gzip
+from typing import List, Dict, Optional
+
+
+def create_item_claim_json(*, property_id: str, item_id: str) -> Dict:
+	return {
+		"mainsnak": {
+			"snaktype": "value",
+			"property": property_id,
+			"datavalue": {
+				"value": {
+					"entity-type": "item",
+					"numeric-id": int(item_id[1:]),
+					"id": item_id
+				},
+				"type": "wikibase-entityid"
+			},
+			"datatype": "wikibase-item"
+		},
+		"type": "statement",
+		"rank": "normal"
+	}
+
+
+def create_entity_json(*, entity_id: str, labels: Dict[str, str], descriptions: Optional[Dict[str, str]] = None, aliases: Optional[Dict[str, List[str]]] = None, item_claims: Optional[Dict[str, List[str]]] = None, sitelinks: Optional[Dict[str, str]] = None) -> Dict:
+	return {
+		"type": "property" if entity_id.startswith("P") else "item",
+		"id": entity_id,
+		"labels": {language_code: {"language": language_code, "value": label} for language_code, label in labels.items()},
+		"descriptions": {language_code: {"language": language_code, "value": description} for language_code, description in (descriptions or {}).items()},
+		"aliases": {language_code: [{"language": language_code, "value": alias} for alias in language_aliases] for language_code, language_aliases in (aliases or {}).items()},
+		"claims": {property_id: [create_item_claim_json(property_id=property_id, item_id=item_id) for item_id in item_ids] for property_id, item_ids in (item_claims or {}).items()},
+		"sitelinks": {site_id: {"site": site_id, "title": title, "badges": []} for site_id, title in (sitelinks or {}).items()}
+	}
+
+
+def get_default_entity_jsons() -> List[Dict]:
+	return [
+		create_entity_json(entity_id="Q1", labels={"en": "universe", "de": "Universum"}, descriptions={"en": "totality of space and all contents"}),
+		create_entity_json(entity_id="Q5", labels={"en": "human", "de": "Mensch"}, descriptions={"en": "common name of Homo sapiens"}, sitelinks={"enwiki": "Human"}),
+		create_entity_json(entity_id="Q515", labels={"en": "city", "de": "Stadt", "fr": "ville"}, descriptions={"en": "large human settlement"}, item_claims={"P279": ["Q486972"]}, sitelinks={"enwiki": "City"}),
+		create_entity_json(entity_id="Q486972", labels={"en": "human settlement"}),
+		create_entity_json(entity_id="Q1549591", labels={"en": "big city"}, item_claims={"P279": ["Q515"]}),
+		create_entity_json(entity_id="Q42", labels={"en": "Douglas Adams", "de": "Douglas Adams"}, descriptions={"en": "English writer and humorist"}, aliases={"en": ["Douglas Noel Adams", "DNA"]}, item_claims={"P31": ["Q5"], "P19": ["Q350"]}, sitelinks={"enwiki": "Douglas Adams", "dewiki": "Douglas Adams"}),
+		create_entity_json(entity_id="Q90", labels={"en": "Paris", "de": "Paris", "fr": "Paris"}, descriptions={"en": "capital and largest city of France"}, item_claims={"P31": ["Q1549591"], "P17": ["Q142"]}, sitelinks={"enwiki": "Paris", "frwiki": "Paris"}),
+		create_entity_json(entity_id="Q350", labels={"en": "Cambridge"}, descriptions={"en": "city in Cambridgeshire, England"}, item_claims={"P31": ["Q515"]}, sitelinks={"enwiki": "Cambridge"}),
+		create_entity_json(entity_id="Q142", labels={"en": "France", "fr": "France"}, descriptions={"en": "country in Western Europe"}, sitelinks={"enwiki": "France"}),
+		create_entity_json(entity_id="Q64", labels={"en": "Berlin", "de": "Berlin"}, descriptions={"en": "capital and largest city of Germany"}, item_claims={"P31": ["Q1549591", "Q515"]}, sitelinks={"enwiki": "Berlin", "dewiki": "Berlin"}),
+		create_entity_json(entity_id="Q89", labels={"en": "apple", "de": "Apfel"}, descriptions={"en": "fruit of the apple tree"}, sitelinks={"enwiki": "Apple"}),
+		create_entity_json(entity_id="Q312", labels={"en": "Apple Inc."}, descriptions={"en": "American technology company"}, sitelinks={"enwiki": "Apple Inc."}),
+		create_entity_json(entity_id="P31", labels={"en": "instance of"}, descriptions={"en": "that class of which this subject is a particular example"}),
+		create_entity_json(entity_id="P279", labels={"en": "subclass of"}, descriptions={"en": "next higher class or type"})
+	]
+
+
+def create_wiki_data_dump_file(*, file_path: str, entity_jsons: Optional[List[Dict]] = None):
+	if entity_jsons is None:
+		entity_jsons = get_default_entity_jsons()
+	dump_bytes = ("[\n" + ",\n".join([json.dumps(entity_json, separators=(",", ":")) for entity_json in entity_jsons]) + "\n]\n").encode()
+	if file_path.endswith(".bz2"):
+		open_method = bz2.open
+	elif file_path.endswith(".gz"):
+		open_method = gzip.open
+	else:
+		open_method = open
+	with open_method(file_path, "wb") as file_handle:
+		file_handle.write(dump_bytes)